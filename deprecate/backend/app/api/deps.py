@@ -41,8 +41,13 @@ AsyncSessionDep = Annotated[AsyncSession, Depends(get_db_async)]  # New async
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
-    """Get current authenticated user from JWT token (legacy synchronous)."""
+def get_token_payload(token: TokenDep) -> TokenPayload:
+    """
+    Validate a JWT token without loading the user.
+
+    For hot, read-only endpoints that must not hit the database; the user's
+    active flag is not checked.
+    """
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -59,6 +64,12 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
+    return token_data
+
+
+def get_current_user(session: SessionDep, token: TokenDep) -> User:
+    """Get current authenticated user from JWT token (legacy synchronous)."""
+    token_data = get_token_payload(token)
 
     user = session.get(User, token_data.sub)
     if not user:
@@ -105,3 +116,4 @@ async def get_current_user_async(session: AsyncSessionDep, token: TokenDep) -> U
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentUserAsync = Annotated[User, Depends(get_current_user_async)]
+TokenPayloadDep = Annotated[TokenPayload, Depends(get_token_payload)]
@@ -3,15 +3,34 @@ import io
 import uuid
 from typing import List
 
-from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    HTTPException,
+    UploadFile,
+    status,
+)
 from fastapi.responses import StreamingResponse
 from sqlmodel import select
 
 from app.api.deps import CurrentUser, SessionDep
 from app.crud.investor import create_investor_profile
+from app.models.bulk_import import BulkImportJob
 from app.models.investor import InvestorProfile, InvestorProfileCreate
-from app.models.startup import FundingStage, Industry
 from app.models.user import User, UserCreate, UserRole
+from app.services.bulk_import import (
+    detect_import_format,
+    export_startups_ndjson,
+    import_startups,
+    parse_funding_stages,
+    parse_investment_focus,
+    run_investor_import_job,
+    spool_upload,
+)
+from app.services.investor_index import investor_index
+from app.services.investor_search import investor_search_index
+from app.services.suggest import suggest_index
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -92,10 +111,10 @@ async def create_investor_admin(
                 "linkedin_url", investor_data.get("linkedin")
             ),
             twitter_url=investor_data.get("twitter_url", investor_data.get("twitter")),
-            investment_focus=_parse_investment_focus(
+            investment_focus=parse_investment_focus(
                 investor_data.get("investment_focus", [])
             ),
-            preferred_stages=_parse_funding_stages(
+            preferred_stages=parse_funding_stages(
                 investor_data.get("preferred_stages", [])
             ),
         )
@@ -118,14 +137,18 @@ async def create_investor_admin(
         )
 
 
-@router.post("/investors/bulk-import")
-async def bulk_import_investors(
+@router.post("/investors/bulk-import", status_code=status.HTTP_202_ACCEPTED)
+def bulk_import_investors(
     session: SessionDep,
     current_user: CurrentUser,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
 ):
     """
-    Admin endpoint to bulk import investors from CSV file.
+    Admin endpoint to bulk import investors from a CSV or NDJSON file.
+
+    The upload is copied to a temporary file and imported in the background;
+    poll GET /admin/imports/{job_id} for progress.
 
     Expected CSV columns:
     - name (or full_name): Full name of the investor
@@ -138,80 +161,47 @@ async def bulk_import_investors(
     - twitter_url (or twitter): Twitter profile URL
     - investment_focus: Comma-separated list of industries
     - preferred_stages: Comma-separated list of funding stages
+
+    NDJSON objects use the same keys, with lists for the last two.
     """
     require_admin(current_user)
 
-    if not file.filename or not file.filename.endswith(".csv"):
+    import_format = detect_import_format(file.filename, file.content_type)
+    if import_format is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="File must be a CSV file"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be a CSV or NDJSON file",
         )
 
-    try:
-        # Read CSV content
-        content = await file.read()
-        csv_content = content.decode("utf-8")
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
-
-        results = {"total_rows": 0, "created": 0, "skipped": 0, "errors": []}
-
-        for row_num, row in enumerate(csv_reader, 1):
-            results["total_rows"] += 1
-
-            try:
-                # Validate required fields
-                email = row.get("email", "").strip()
-                if not email:
-                    results["errors"].append(f"Row {row_num}: Email is required")
-                    continue
-
-                # Prepare investor data
-                investor_data = {
-                    "name": row.get("name", row.get("full_name", "")).strip(),
-                    "email": email,
-                    "firm_name": row.get("firm_name", row.get("company", "")).strip(),
-                    "bio": row.get("bio", "").strip() or None,
-                    "website": row.get("website", "").strip() or None,
-                    "location": row.get("location", "").strip() or None,
-                    "linkedin_url": row.get(
-                        "linkedin_url", row.get("linkedin", "")
-                    ).strip()
-                    or None,
-                    "twitter_url": row.get(
-                        "twitter_url", row.get("twitter", "")
-                    ).strip()
-                    or None,
-                    "investment_focus": _parse_csv_list(
-                        row.get("investment_focus", "")
-                    ),
-                    "preferred_stages": _parse_csv_list(
-                        row.get("preferred_stages", "")
-                    ),
-                }
+    path = spool_upload(file.file, suffix=f".{import_format.value}")
+    job = BulkImportJob(kind="investors", filename=file.filename)
+    session.add(job)
+    session.commit()
+    session.refresh(job)
 
-                # Create investor using the existing endpoint logic
-                result = await create_investor_admin(
-                    session, current_user, investor_data
-                )
-
-                if result.get("created"):
-                    results["created"] += 1
-                elif result.get("skipped"):
-                    results["skipped"] += 1
+    background_tasks.add_task(
+        run_investor_import_job, session.get_bind(), job.id, path, import_format
+    )
+    return {"message": "Bulk import started", "job_id": str(job.id)}
 
-            except Exception as e:
-                results["errors"].append(f"Row {row_num}: {str(e)}")
-                continue
 
-        return {
-            "message": f"Bulk import completed. {results['created']} created, {results['skipped']} skipped, {len(results['errors'])} errors.",
-            "results": results,
-        }
+@router.get("/imports/{job_id}", response_model=BulkImportJob)
+def get_import_job(
+    job_id: uuid.UUID,
+    session: SessionDep,
+    current_user: CurrentUser,
+):
+    """
+    Admin endpoint to get the status and progress of a bulk import job.
+    """
+    require_admin(current_user)
 
-    except Exception as e:
+    job = session.get(BulkImportJob, job_id)
+    if not job:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process CSV file: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found"
         )
+    return job
 
 
 @router.get("/investors/export")
@@ -363,6 +353,9 @@ async def delete_investor_admin(
             session.add(user)
 
         session.commit()
+        investor_index.remove(investor_id)
+        investor_search_index.remove(investor_id)
+        suggest_index.remove_investor(investor_id)
 
         return {"message": "Investor profile deleted successfully"}
 
@@ -374,54 +367,48 @@ async def delete_investor_admin(
         )
 
 
-# Helper functions
-
-
-def _parse_investment_focus(focus_list) -> List[Industry]:
-    """Parse investment focus from various input formats."""
-    if isinstance(focus_list, str):
-        focus_list = _parse_csv_list(focus_list)
-
-    if not focus_list:
-        return []
-
-    valid_industries = []
-    for item in focus_list:
-        try:
-            # Try to match with Industry enum
-            industry = Industry(item.strip())
-            valid_industries.append(industry)
-        except ValueError:
-            # If not a valid industry, skip it
-            continue
-
-    return valid_industries
-
-
-def _parse_funding_stages(stages_list) -> List[FundingStage]:
-    """Parse funding stages from various input formats."""
-    if isinstance(stages_list, str):
-        stages_list = _parse_csv_list(stages_list)
-
-    if not stages_list:
-        return []
+# Sync endpoints: parsing and inserting block, so they run in the threadpool
+@router.post("/startups/bulk-import")
+def bulk_import_startups(
+    session: SessionDep,
+    current_user: CurrentUser,
+    file: UploadFile = File(...),
+):
+    """
+    Admin endpoint to bulk import startups from a CSV or NDJSON file.
+
+    The upload is parsed, validated and inserted in batches as it is read, so
+    files of any size work. Each row/object carries the StartupCreate fields
+    plus founder_email or founder_id; CSV cells of the JSON sections
+    (team_members, funding, ...) hold JSON text. Startups whose founder
+    already has one with the same name are skipped. Output of
+    /admin/startups/export can be imported as is.
+    """
+    require_admin(current_user)
 
-    valid_stages = []
-    for item in stages_list:
-        try:
-            # Try to match with FundingStage enum
-            stage = FundingStage(item.strip())
-            valid_stages.append(stage)
-        except ValueError:
-            # If not a valid stage, skip it
-            continue
+    import_format = detect_import_format(file.filename, file.content_type)
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be a CSV or NDJSON file",
+        )
 
-    return valid_stages
+    report = import_startups(session, file.file, import_format)
+    return {"message": report.message, "results": report.as_dict()}
 
 
-def _parse_csv_list(csv_string: str) -> List[str]:
-    """Parse a comma-separated string into a list."""
-    if not csv_string:
-        return []
+@router.get("/startups/export")
+def export_startups(
+    session: SessionDep,
+    current_user: CurrentUser,
+):
+    """
+    Admin endpoint to export all startups as NDJSON, streamed in batches.
+    """
+    require_admin(current_user)
 
-    return [item.strip() for item in csv_string.split(",") if item.strip()]
+    return StreamingResponse(
+        export_startups_ndjson(session.get_bind()),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=startups_export.ndjson"},
+    )
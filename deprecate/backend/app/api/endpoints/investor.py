@@ -5,15 +5,23 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import SQLModel
 
 from app.api.deps import SessionDep, get_current_user
+from app.core.responses import ORJSONResponse
 from app.crud.investor import (
+    decode_investor_cursor,
+    encode_investor_cursor,
     get_filtered_investor_profiles_with_users,
     get_investor_profile_by_id,
     get_investors_by_funding_stage,
     get_investors_by_industry_focus,
     search_investors_by_name_or_firm,
 )
-from app.models.investor import InvestorProfileRead, InvestorWithUserRead
+from app.models.investor import (
+    InvestorCountMode,
+    InvestorProfileRead,
+    InvestorWithUserRead,
+)
 from app.models.startup import FundingStage, Industry
+from app.services.investor_projection import investor_read_dicts
 
 router = APIRouter(prefix="/investors", tags=["Investors"])
 
@@ -23,9 +31,10 @@ class InvestorListResponse(SQLModel):
 
     investors: List[InvestorWithUserRead]
     total: int
-    page: int
+    page: Optional[int]  # None for pages fetched with a cursor
     limit: int
     total_pages: int
+    next_cursor: Optional[str] = None  # Pass as `cursor` to get the next page
 
 
 @router.get("/", response_model=InvestorListResponse)
@@ -45,62 +54,75 @@ async def list_investors(
         None, description="Filter by preferred funding stages"
     ),
     location: Optional[str] = Query(None, description="Filter by investor location"),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor of a previous page (replaces skip; not with skip)",
+    ),
+    count: InvestorCountMode = Query(
+        InvestorCountMode.EXACT,
+        description="Exact total or a cheaper query planner estimate",
+    ),
     current_user: uuid.UUID = Depends(get_current_user),
 ):
     """
     List all investor profiles with filtering, search, and pagination.
 
     Features:
-    - Pagination with skip/limit
+    - Pagination with skip/limit, or with `cursor` (keyset on firm name + id)
+      for constant-cost deep pages
+    - Exact or estimated totals
     - Search by investor name or firm name
     - Filter by investment focus industries
     - Filter by preferred funding stages
     - Filter by location
     """
+    keyset = None
+    if cursor:
+        if skip:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either skip or cursor, not both",
+            )
+        try:
+            keyset = decode_investor_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+
     # Use the enhanced filtering function
-    investor_user_pairs, total_count = get_filtered_investor_profiles_with_users(
+    investor_rows, total_count = get_filtered_investor_profiles_with_users(
         db=session,
         skip=skip,
-        limit=limit,
+        limit=limit + 1,
         search=search,
         industries=industries,
         funding_stages=funding_stages,
         location=location,
+        cursor=keyset,
+        count_mode=count,
     )
 
-    # Convert to response format
-    investors_with_users = []
-    for investor_profile, user in investor_user_pairs:
-        investor_data = InvestorWithUserRead(
-            id=investor_profile.id,
-            user_id=investor_profile.user_id,
-            name=user.full_name,
-            email=user.email,
-            company=investor_profile.firm_name,  # Map firm_name to company
-            firm_name=investor_profile.firm_name,
-            bio=investor_profile.bio,
-            website=investor_profile.website,
-            location=investor_profile.location,
-            linkedin_url=investor_profile.linkedin_url,
-            twitter_url=investor_profile.twitter_url,
-            investment_focus=investor_profile.investment_focus,
-            preferred_stages=investor_profile.preferred_stages,
-            profile_picture=None,  # TODO: Add profile picture handling
-            min_investment=None,  # TODO: Add investment range fields to model
-            max_investment=None,  # TODO: Add investment range fields to model
-        )
-        investors_with_users.append(investor_data)
-
-    # Calculate pagination info
+    # Calculate pagination info; a cursor page has no page number
     total_pages = (total_count + limit - 1) // limit
-    current_page = (skip // limit) + 1
-
-    return InvestorListResponse(
-        investors=investors_with_users,
-        total=total_count,
-        page=current_page,
-        limit=limit,
-        total_pages=total_pages,
+    current_page = None if keyset else (skip // limit) + 1
+
+    # One row past the page tells whether there is a next page
+    next_cursor = None
+    if len(investor_rows) > limit:
+        investor_rows = investor_rows[:limit]
+        next_cursor = encode_investor_cursor(investor_rows[-1])
+
+    # Rows map straight to JSON; skips per-row models and response validation
+    return ORJSONResponse(
+        {
+            "investors": investor_read_dicts(investor_rows),
+            "total": total_count,
+            "page": current_page,
+            "limit": limit,
+            "total_pages": total_pages,
+            "next_cursor": next_cursor,
+        }
     )
 
 
@@ -119,33 +141,11 @@ async def search_investors(
     """
     Search investors by name or firm name.
     """
-    investor_user_pairs = search_investors_by_name_or_firm(
+    investor_rows = search_investors_by_name_or_firm(
         db=session, search_term=q, skip=skip, limit=limit
     )
 
-    investors_with_users = []
-    for investor_profile, user in investor_user_pairs:
-        investor_data = InvestorWithUserRead(
-            id=investor_profile.id,
-            user_id=investor_profile.user_id,
-            name=user.full_name,
-            email=user.email,
-            company=investor_profile.firm_name,
-            firm_name=investor_profile.firm_name,
-            bio=investor_profile.bio,
-            website=investor_profile.website,
-            location=investor_profile.location,
-            linkedin_url=investor_profile.linkedin_url,
-            twitter_url=investor_profile.twitter_url,
-            investment_focus=investor_profile.investment_focus,
-            preferred_stages=investor_profile.preferred_stages,
-            profile_picture=None,
-            min_investment=None,
-            max_investment=None,
-        )
-        investors_with_users.append(investor_data)
-
-    return investors_with_users
+    return ORJSONResponse(investor_read_dicts(investor_rows))
 
 
 @router.get("/by-industry/{industry}", response_model=List[InvestorWithUserRead])
@@ -159,33 +159,11 @@ async def get_investors_by_industry(
     """
     Get investors who focus on a specific industry.
     """
-    investor_user_pairs = get_investors_by_industry_focus(
+    investor_rows = get_investors_by_industry_focus(
         db=session, industry=industry, skip=skip, limit=limit
     )
 
-    investors_with_users = []
-    for investor_profile, user in investor_user_pairs:
-        investor_data = InvestorWithUserRead(
-            id=investor_profile.id,
-            user_id=investor_profile.user_id,
-            name=user.full_name,
-            email=user.email,
-            company=investor_profile.firm_name,
-            firm_name=investor_profile.firm_name,
-            bio=investor_profile.bio,
-            website=investor_profile.website,
-            location=investor_profile.location,
-            linkedin_url=investor_profile.linkedin_url,
-            twitter_url=investor_profile.twitter_url,
-            investment_focus=investor_profile.investment_focus,
-            preferred_stages=investor_profile.preferred_stages,
-            profile_picture=None,
-            min_investment=None,
-            max_investment=None,
-        )
-        investors_with_users.append(investor_data)
-
-    return investors_with_users
+    return ORJSONResponse(investor_read_dicts(investor_rows))
 
 
 @router.get("/by-stage/{funding_stage}", response_model=List[InvestorWithUserRead])
@@ -199,33 +177,11 @@ async def get_investors_by_stage(
     """
     Get investors who prefer a specific funding stage.
     """
-    investor_user_pairs = get_investors_by_funding_stage(
+    investor_rows = get_investors_by_funding_stage(
         db=session, funding_stage=funding_stage, skip=skip, limit=limit
     )
 
-    investors_with_users = []
-    for investor_profile, user in investor_user_pairs:
-        investor_data = InvestorWithUserRead(
-            id=investor_profile.id,
-            user_id=investor_profile.user_id,
-            name=user.full_name,
-            email=user.email,
-            company=investor_profile.firm_name,
-            firm_name=investor_profile.firm_name,
-            bio=investor_profile.bio,
-            website=investor_profile.website,
-            location=investor_profile.location,
-            linkedin_url=investor_profile.linkedin_url,
-            twitter_url=investor_profile.twitter_url,
-            investment_focus=investor_profile.investment_focus,
-            preferred_stages=investor_profile.preferred_stages,
-            profile_picture=None,
-            min_investment=None,
-            max_investment=None,
-        )
-        investors_with_users.append(investor_data)
-
-    return investors_with_users
+    return ORJSONResponse(investor_read_dicts(investor_rows))
 
 
 @router.get("/{investor_id}", response_model=InvestorProfileRead)
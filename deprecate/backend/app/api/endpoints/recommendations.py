@@ -4,8 +4,17 @@ Recommendation API endpoints for startup-investor matching.
 
 from fastapi import APIRouter, HTTPException, Query, status
 
-from app.api.deps import CurrentUser, SessionDep
-from app.models.recommendation import RecommendationResponse
+from app.api.deps import (
+    AsyncSessionDep,
+    CurrentUser,
+    CurrentUserAsync,
+    SessionDep,
+)
+from app.core.responses import ORJSONResponse
+from app.models.recommendation import (
+    RecommendationResponse,
+    StartupRecommendationResponse,
+)
 from app.models.user import UserRole
 from app.services.recommendation_engine import recommendation_engine
 
@@ -14,8 +23,8 @@ router = APIRouter(prefix="/me", tags=["Recommendations"])
 
 @router.get("/recommendations", response_model=RecommendationResponse)
 async def get_my_recommendations(
-    session: SessionDep,
-    current_user: CurrentUser,
+    session: AsyncSessionDep,
+    current_user: CurrentUserAsync,
     max_results: int = Query(
         10, ge=1, le=50, description="Maximum number of recommendations"
     ),
@@ -36,6 +45,9 @@ async def get_my_recommendations(
     - Location proximity consideration
     - Detailed explanations for each recommendation
     - Configurable result limits and score thresholds
+
+    Runs on the async database session; scoring happens on a bounded worker
+    pool so it never blocks the event loop.
     """
     # Verify user is a founder (only founders can get investor recommendations)
     if current_user.role != UserRole.FOUNDER:
@@ -46,9 +58,60 @@ async def get_my_recommendations(
 
     # Generate recommendations using the recommendation engine
     try:
-        recommendations = recommendation_engine.get_recommendations_for_founder(
+        recommendations = (
+            await recommendation_engine.get_recommendations_for_founder_async(
+                session=session,
+                founder_id=current_user.id,
+                max_results=max_results,
+                min_score=min_score,
+            )
+        )
+
+        # Already a validated model: serialize it once instead of having
+        # FastAPI dump and re-validate it against the response model
+        return ORJSONResponse(recommendations.model_dump(mode="json"))
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate recommendations: {str(e)}",
+        )
+
+
+@router.get(
+    "/startup-recommendations", response_model=StartupRecommendationResponse
+)
+def get_my_startup_recommendations(
+    session: SessionDep,
+    current_user: CurrentUser,
+    max_results: int = Query(
+        10, ge=1, le=50, description="Maximum number of recommendations"
+    ),
+    min_score: float = Query(
+        30.0, ge=0.0, le=100.0, description="Minimum recommendation score"
+    ),
+):
+    """
+    Get personalized startup recommendations for the current investor.
+
+    Scores every published startup against the investor's profile with the
+    same algorithm used for founder recommendations and returns the best
+    matches with explanations.
+
+    A plain `def` route: the synchronous session, startup index load and
+    scoring pass run in FastAPI's threadpool, not on the event loop.
+    """
+    # Verify user is an investor (only investors can get startup recommendations)
+    if current_user.role != UserRole.INVESTOR:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only investors can access startup recommendations",
+        )
+
+    try:
+        recommendations = recommendation_engine.get_recommendations_for_investor(
             db=session,
-            founder_id=current_user.id,
+            user_id=current_user.id,
             max_results=max_results,
             min_score=min_score,
         )
@@ -99,8 +162,9 @@ async def explain_recommendation_algorithm(
                 "weight": recommendation_engine.weights["location_proximity"],
                 "description": "Geographic proximity between investor and startup",
                 "scoring": {
-                    "same_location": "100% - Same city/region",
-                    "compatible_region": "70% - Compatible geographic region",
+                    "same_region": "100% - Same city/metropolitan region",
+                    "nearby_region": "70% - Region within 800 km",
+                    "same_part_of_continent": "40% - Region within 2,000 km",
                     "different_region": "20% - Different regions (small penalty)",
                 },
             },
@@ -0,0 +1,56 @@
+"""
+Typeahead search endpoints.
+"""
+
+import uuid
+from typing import List, Optional
+
+from fastapi import APIRouter, Query
+from sqlmodel import SQLModel
+
+from app.api.deps import SessionDep, TokenPayloadDep
+from app.services.suggest import SuggestionType, suggest_index
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+class Suggestion(SQLModel):
+    """A single typeahead suggestion."""
+
+    type: SuggestionType
+    id: uuid.UUID  # Investor profile id or startup id
+    label: str
+
+
+class SuggestResponse(SQLModel):
+    """Response model for typeahead suggestions."""
+
+    suggestions: List[Suggestion]
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+def suggest(
+    session: SessionDep,
+    token: TokenPayloadDep,
+    q: str = Query(..., min_length=1, description="Prefix typed so far"),
+    limit: int = Query(8, ge=1, le=20, description="Maximum suggestions"),
+    types: Optional[List[SuggestionType]] = Query(
+        None, description="Restrict to investor names, firm names or startups"
+    ),
+):
+    """
+    Suggest investor names, firm names and published startup names.
+
+    Matches any word start ("cap" finds "Ama Capital") from an in-memory
+    index, so keystrokes don't query the database. The token is validated
+    without loading the user. The session is only used when the index needs
+    its periodic reload.
+    """
+    suggest_index.refresh_if_stale(session)
+
+    return SuggestResponse(
+        suggestions=[
+            Suggestion(type=kind, id=record_id, label=label)
+            for kind, record_id, label in suggest_index.suggest(q, limit, types)
+        ]
+    )
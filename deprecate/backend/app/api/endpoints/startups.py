@@ -1,38 +1,91 @@
 import uuid
-from typing import Any, List
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 
 from app.api.deps import CurrentUser, SessionDep
 from app.crud.startup import (
     create_startup,
+    decode_startup_cursor,
+    encode_startup_cursor,
     get_draft_startups_by_founder,
     get_published_startups,
     get_startup,
     get_startups_by_founder,
     update_startup_publication_status,
 )
-from app.models.startup import Startup, StartupCreate, StartupRead, StartupUpdate
+from app.models.startup import (
+    FundingStage,
+    Industry,
+    StartupCreate,
+    StartupRead,
+    StartupSummary,
+    StartupUpdate,
+)
 
 router = APIRouter(prefix="/startups", tags=["Startups"])
 
 
-@router.get("/", response_model=List[Startup])
-async def get_all_startups(session: SessionDep):
-    """Get all published startups (public endpoint)"""
-    startups = get_published_startups(db=session)
-    if not startups:
+@router.get("/", response_model=List[StartupSummary])
+async def get_all_startups(
+    session: SessionDep,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of startups to skip"),
+    limit: int = Query(
+        100, ge=1, le=500, description="Maximum number of startups to return"
+    ),
+    industry: Optional[Industry] = Query(None, description="Filter by industry"),
+    location: Optional[str] = Query(
+        None, description="Filter by location (case-insensitive)"
+    ),
+    funding_stage: Optional[FundingStage] = Query(
+        None, description="Filter by funding stage"
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="X-Next-Cursor header of the previous page (replaces skip)",
+    ),
+):
+    """Get all published startups as cards (public endpoint; full profile at
+    /startups/{startup_id}). Ordered by name; X-Next-Cursor is set if there is
+    a next page."""
+    keyset = None
+    if cursor:
+        try:
+            keyset = decode_startup_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+
+    startups = get_published_startups(
+        db=session,
+        skip=skip,
+        limit=limit + 1,
+        industry=industry,
+        location=location,
+        funding_stage=funding_stage,
+        summary=True,
+        cursor=keyset,
+    )
+    # A cursor past the last page is an empty page, not a missing resource
+    if not startups and keyset is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="No published startups found"
         )
+
+    # One row past the page tells whether there is a next page
+    if len(startups) > limit:
+        startups = startups[:limit]
+        response.headers["X-Next-Cursor"] = encode_startup_cursor(startups[-1])
     return startups
 
 
-@router.get("/founder/{founder_id}", response_model=List[StartupRead])
+@router.get("/founder/{founder_id}", response_model=List[StartupSummary])
 async def get_founder_startups(session: SessionDep, founder_id: uuid.UUID):
     """Get all startups created by a specific founder (includes drafts)"""
     startups = get_startups_by_founder(
-        db=session, founder_id=founder_id, include_drafts=True
+        db=session, founder_id=founder_id, include_drafts=True, summary=True
     )
     if not startups:
         raise HTTPException(
@@ -42,10 +95,12 @@ async def get_founder_startups(session: SessionDep, founder_id: uuid.UUID):
     return startups
 
 
-@router.get("/drafts", response_model=List[StartupRead])
+@router.get("/drafts", response_model=List[StartupSummary])
 async def get_my_draft_startups(session: SessionDep, current_user: CurrentUser):
     """Get current user's draft startups (requires authentication)"""
-    startups = get_draft_startups_by_founder(db=session, founder_id=current_user.id)
+    startups = get_draft_startups_by_founder(
+        db=session, founder_id=current_user.id, summary=True
+    )
     return startups  # Return empty list if no drafts found
 
 
@@ -2,10 +2,20 @@ import asyncio
 import uuid
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    UploadFile,
+    status,
+)
+from fastapi.responses import RedirectResponse
 from fastapi.security import HTTPBearer
 
 from app.api.deps import SessionDep, get_current_user
+from app.core.config import settings
 from app.core.upload import (
     UploadResponse,
     upload_service,
@@ -17,6 +27,19 @@ from app.models.user import User
 router = APIRouter(prefix="/upload", tags=["Upload"])
 security = HTTPBearer()
 
+
+def _batch_upload_slots() -> asyncio.Semaphore:
+    """
+    Limit how many files of one batch request upload at once.
+
+    Documents and videos in a batch stream with a single part buffer each,
+    so they hold at most UPLOAD_MEMORY_LIMIT however many files there are.
+    Images are still read whole (up to MAX_IMAGE_SIZE) for processing.
+    """
+    return asyncio.Semaphore(
+        max(1, settings.UPLOAD_MEMORY_LIMIT // settings.UPLOAD_PART_SIZE)
+    )
+
 '''
 # Add these new models
 class BatchUploadResponse(BaseModel):
@@ -261,6 +284,44 @@ async def upload_profile_image(
         )
 
 
+@router.get(
+    "/files/{file_id}/variant/{name}",
+    status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+    summary="Get Image Variant",
+    description="Redirect to the smallest encoding of an image variant the client accepts.",
+)
+async def get_image_variant(
+    file_id: str,
+    name: str,
+    db: SessionDep,
+    accept: Annotated[Optional[str], Header()] = None,
+) -> RedirectResponse:
+    """
+    Serve an image variant (original, large, medium, small, thumbnail):
+
+    - **AVIF or WebP** when the Accept header lists them
+    - **JPEG/PNG fallback** for every other client
+    - **Rendered on first request** if uploaded in lazy mode
+    - **Public**, so it can be used directly in `<img src>`
+    """
+    # Public endpoint: keep database round trips off the event loop
+    file_metadata = await asyncio.to_thread(db.get, FileMetadata, file_id)
+    if not file_metadata:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+        )
+
+    # Lazy mode: render the variant if this is its first request
+    file_metadata = await upload_service.ensure_variant(file_metadata, name, db)
+    key = upload_service.select_variant(file_metadata, name, accept)
+    return RedirectResponse(
+        file_metadata.variants[key],
+        status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+        # The redirect target depends on Accept; caches must keep them apart
+        headers={"Vary": "Accept", "Cache-Control": "public, max-age=3600"},
+    )
+
+
 @router.delete(
     "/{file_key:path}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -352,6 +413,7 @@ async def upload_files_batch(
 
     successful_uploads = []
     failed_uploads = []
+    slots = _batch_upload_slots()
 
     # Process files in parallel for better performance
     async def upload_single_file(
@@ -361,25 +423,28 @@ async def upload_files_batch(
         try:
             # Auto-detect file type and route to appropriate service
             content_type = file.content_type or ""
+            # Batch files share the request's memory limit, one part each
+            part = settings.UPLOAD_PART_SIZE
 
-            if content_type.startswith("image/"):
-                result = await upload_service.upload_image(file, db)
-            elif content_type.startswith("video/"):
-                result = await upload_service.upload_video(file, db)
-            elif content_type in [
-                "application/pdf",
-                "application/msword",
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                "application/vnd.ms-powerpoint",
-                "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                "text/plain",
-                "text/csv",
-                "application/json",
-            ]:
-                result = await upload_service.upload_document(file, db)
-            else:
-                # Default to document upload for unknown types
-                result = await upload_service.upload_document(file, db)
+            async with slots:
+                if content_type.startswith("image/"):
+                    result = await upload_service.upload_image(file, db)
+                elif content_type.startswith("video/"):
+                    result = await upload_service.upload_video(file, db, part)
+                elif content_type in [
+                    "application/pdf",
+                    "application/msword",
+                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    "application/vnd.ms-powerpoint",
+                    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                    "text/plain",
+                    "text/csv",
+                    "application/json",
+                ]:
+                    result = await upload_service.upload_document(file, db, part)
+                else:
+                    # Default to document upload for unknown types
+                    result = await upload_service.upload_document(file, db, part)
 
             return True, result
 
@@ -620,6 +685,7 @@ async def upload_files_batch_atomic(
 
     successful_uploads = []
     uploaded_file_keys = []
+    slots = _batch_upload_slots()
 
     async def upload_single_file(
         file: UploadFile,
@@ -628,25 +694,28 @@ async def upload_files_batch_atomic(
         try:
             # Auto-detect file type and route to appropriate service
             content_type = file.content_type or ""
+            # Batch files share the request's memory limit, one part each
+            part = settings.UPLOAD_PART_SIZE
 
-            if content_type.startswith("image/"):
-                result = await upload_service.upload_image(file, db)
-            elif content_type.startswith("video/"):
-                result = await upload_service.upload_video(file, db)
-            elif content_type in [
-                "application/pdf",
-                "application/msword",
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                "application/vnd.ms-powerpoint",
-                "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                "text/plain",
-                "text/csv",
-                "application/json",
-            ]:
-                result = await upload_service.upload_document(file, db)
-            else:
-                # Default to document upload for unknown types
-                result = await upload_service.upload_document(file, db)
+            async with slots:
+                if content_type.startswith("image/"):
+                    result = await upload_service.upload_image(file, db)
+                elif content_type.startswith("video/"):
+                    result = await upload_service.upload_video(file, db, part)
+                elif content_type in [
+                    "application/pdf",
+                    "application/msword",
+                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    "application/vnd.ms-powerpoint",
+                    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                    "text/plain",
+                    "text/csv",
+                    "application/json",
+                ]:
+                    result = await upload_service.upload_document(file, db, part)
+                else:
+                    # Default to document upload for unknown types
+                    result = await upload_service.upload_document(file, db, part)
 
             return True, result
 
@@ -6,6 +6,7 @@ from app.api.endpoints import (
     investor,
     pitch,
     recommendations,
+    search,
     startups,
     test_async,
     upload,
@@ -28,6 +29,7 @@ api_router.include_router(auth.router)
 api_router.include_router(user.router)
 api_router.include_router(investor.router)
 api_router.include_router(recommendations.router)
+api_router.include_router(search.router)
 api_router.include_router(pitch.router)
 api_router.include_router(startups.router)
 api_router.include_router(upload.router)
@@ -59,6 +59,10 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE: int = 50 * 1024 * 1024  # 50MB
     MAX_IMAGE_SIZE: int = 10 * 1024 * 1024  # 10MB
     MAX_VIDEO_SIZE: int = 100 * 1024 * 1024  # 100MB
+    # Documents and videos are streamed to storage as multipart uploads
+    UPLOAD_PART_SIZE: int = 8 * 1024 * 1024  # 8MB; S3 requires at least 5MB
+    # Upload buffers one request may hold; batch uploads share it between files
+    UPLOAD_MEMORY_LIMIT: int = 32 * 1024 * 1024  # 32MB
     ALLOWED_IMAGE_TYPES: list[str] = [
         "image/jpeg",
         "image/png",
@@ -90,6 +94,42 @@ class Settings(BaseSettings):
     IMAGE_MAX_WIDTH: int = 2048
     IMAGE_MAX_HEIGHT: int = 2048
     THUMBNAIL_SIZE: tuple[int, int] = (300, 300)
+    IMAGE_PROCESSING_WORKERS: int = 2  # Processes per API worker
+    # Images being processed or queued per API worker before uploads wait
+    IMAGE_PROCESSING_MAX_PENDING: int = 8
+    # How long an upload waits for a processing slot before failing with 503
+    IMAGE_PROCESSING_QUEUE_TIMEOUT_SECONDS: float = 10.0
+    # Upload renders only the original and thumbnail; other variants are
+    # rendered and stored on first request (GET /upload/files/{id}/variant/..)
+    IMAGE_LAZY_VARIANTS: bool = True
+    # Modern encodings stored per image variant, besides the JPEG/PNG fallback
+    # (app.core.image_processing.IMAGE_ENCODINGS); served by Accept header.
+    # "avif" needs a Pillow build with libavif (the 11.2 wheels have none)
+    IMAGE_VARIANT_FORMATS: dict[str, list[str]] = {
+        "large": ["webp"],
+        "medium": ["webp"],
+        "small": ["webp"],
+        "thumbnail": ["webp"],
+    }
+
+    # Recommendation Engine
+    INVESTOR_INDEX_TTL_SECONDS: int = 300  # Full reload interval per worker
+    STARTUP_INDEX_TTL_SECONDS: int = 300
+    RECOMMENDATION_CACHE_TTL_SECONDS: int = 300
+    RECOMMENDATION_CACHE_MAX_ENTRIES: int = 1024
+    # Threads per worker that score async recommendation requests
+    RECOMMENDATION_SCORING_WORKERS: int = 2
+    # JSON file with industry/stage partial-credit overrides (app.services.affinity)
+    RECOMMENDATION_AFFINITY_FILE: str | None = None
+
+    # Search
+    SUGGEST_INDEX_TTL_SECONDS: int = 300  # Full reload interval per worker
+
+    # Bulk import
+    BULK_IMPORT_BATCH_SIZE: int = 1000  # Rows validated and inserted per statement
+    BULK_IMPORT_MAX_ERRORS: int = 1000  # Row errors listed in an import report
+    # Processes per background import that hash new users' passwords
+    BULK_IMPORT_HASH_WORKERS: int = 2
 
     # Environment
     ENVIRONMENT: str = "development"  # development, staging, production
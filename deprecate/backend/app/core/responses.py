@@ -0,0 +1,19 @@
+"""
+JSON response that renders with orjson.
+
+For routes that hand back already-shaped data (see
+``app.services.investor_projection``): returning it as this response skips
+FastAPI's validation against ``response_model``, and orjson serializes UUIDs,
+enums and datetimes natively. Same as fastapi.responses.ORJSONResponse, which
+newer FastAPI releases deprecate.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
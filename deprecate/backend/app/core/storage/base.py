@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import List, Mapping, Optional, Tuple, Union
+from typing import BinaryIO, List, Mapping, Optional, Tuple, Union
 
 
 class StorageClient(ABC):
@@ -35,6 +35,47 @@ class StorageClient(ABC):
         """
         pass
 
+    @abstractmethod
+    async def upload_stream(
+        self,
+        file_path: str,
+        stream: BinaryIO,
+        content_type: str,
+        memory_limit: int,
+        metadata: Optional[Mapping[str, Union[str, List[str], Tuple[str]]]] = None,
+    ) -> str:
+        """
+        Upload a file-like object in parts (multipart upload) and return public URL
+
+        The stream is read from a worker thread, one part at a time, so
+        large files never have to be held in memory whole.
+
+        Args:
+            file_path: Path where file should be stored
+            stream: Binary file-like object to read the content from
+            content_type: MIME type of the file
+            memory_limit: Most bytes of the stream to buffer at once
+                (at least one part)
+            metadata: Optional metadata to store with file
+
+        Returns:
+            Public URL of uploaded file
+        """
+        pass
+
+    @abstractmethod
+    async def download_file(self, file_path: str) -> bytes:
+        """
+        Download a file's content from storage
+
+        Args:
+            file_path: Path of file to download
+
+        Returns:
+            File content as bytes
+        """
+        pass
+
     @abstractmethod
     async def delete_file(self, file_path: str) -> bool:
         """
@@ -1,9 +1,10 @@
 """MinIO storage client implementation"""
 
+import asyncio
 import json
 from datetime import timedelta
 from io import BytesIO
-from typing import List, Mapping, Optional, Tuple, Union
+from typing import BinaryIO, List, Mapping, Optional, Tuple, Union
 
 from minio import Minio
 from minio.error import S3Error
@@ -95,8 +96,9 @@ class MinIOStorageClient(StorageClient):
             # Prepare metadata - convert to dict for MinIO compatibility
             object_metadata = dict(metadata) if metadata else {}
 
-            # Upload file
-            self.client.put_object(
+            # Upload file; the MinIO client blocks, so keep it off the event loop
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name=self._bucket_name,
                 object_name=file_path,
                 data=BytesIO(content),
@@ -111,6 +113,58 @@ class MinIOStorageClient(StorageClient):
         except S3Error as e:
             raise MinIOStorageError(f"Failed to upload to storage: {str(e)}")
 
+    async def upload_stream(
+        self,
+        file_path: str,
+        stream: BinaryIO,
+        content_type: str,
+        memory_limit: int,
+        metadata: Optional[Mapping[str, Union[str, List[str], Tuple[str]]]] = None,
+    ) -> str:
+        """Upload a stream to MinIO in parts and return public URL"""
+        part_size = settings.UPLOAD_PART_SIZE
+        # put_object reads the next part while up to num_parallel_uploads
+        # parts are being sent, so it holds that many parts plus one
+        parts_in_memory = max(1, memory_limit // part_size)
+        parallel_uploads = parts_in_memory - 1 if parts_in_memory >= 3 else 1
+        try:
+            object_metadata = dict(metadata) if metadata else {}
+
+            # Unknown length: put_object switches to a multipart upload once
+            # the stream turns out to be longer than one part
+            await asyncio.to_thread(
+                self.client.put_object,
+                bucket_name=self._bucket_name,
+                object_name=file_path,
+                data=stream,
+                length=-1,
+                content_type=content_type,
+                metadata=object_metadata,  # type: ignore
+                part_size=part_size,
+                num_parallel_uploads=parallel_uploads,
+            )
+
+            return f"http://{settings.MINIO_ENDPOINT}/{self._bucket_name}/{file_path}"
+
+        except S3Error as e:
+            raise MinIOStorageError(f"Failed to upload to storage: {str(e)}")
+
+    async def download_file(self, file_path: str) -> bytes:
+        """Download file content from MinIO"""
+
+        def read() -> bytes:
+            response = self.client.get_object(self._bucket_name, file_path)
+            try:
+                return response.read()
+            finally:
+                response.close()
+                response.release_conn()
+
+        try:
+            return await asyncio.to_thread(read)
+        except S3Error as e:
+            raise MinIOStorageError(f"Failed to download from storage: {str(e)}")
+
     async def delete_file(self, file_path: str) -> bool:
         """Delete file from MinIO"""
         try:
@@ -1,7 +1,7 @@
 """AWS S3 storage client implementation (placeholder/example)"""
 
 from datetime import timedelta
-from typing import List, Mapping, Optional, Tuple, Union
+from typing import BinaryIO, List, Mapping, Optional, Tuple, Union
 
 # import boto3  # Would be needed for real implementation
 from .base import StorageClient
@@ -34,6 +34,24 @@ class S3StorageClient(StorageClient):
         # Real implementation would use boto3 to upload to S3
         raise NotImplementedError("S3 upload not implemented")
 
+    async def upload_stream(
+        self,
+        file_path: str,
+        stream: BinaryIO,
+        content_type: str,
+        memory_limit: int,
+        metadata: Optional[Mapping[str, Union[str, List[str], Tuple[str]]]] = None,
+    ) -> str:
+        """Upload a stream to S3 in parts and return public URL"""
+        # Real implementation would use boto3's upload_fileobj with a
+        # TransferConfig sized from memory_limit
+        raise NotImplementedError("S3 streaming upload not implemented")
+
+    async def download_file(self, file_path: str) -> bytes:
+        """Download file from S3"""
+        # Real implementation would use boto3 to read the object from S3
+        raise NotImplementedError("S3 download not implemented")
+
     async def delete_file(self, file_path: str) -> bool:
         """Delete file from S3"""
         # Real implementation would use boto3 to delete from S3
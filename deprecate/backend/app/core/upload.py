@@ -1,18 +1,35 @@
+import asyncio
+import hashlib
 import uuid
+from contextlib import aclosing
 from datetime import datetime, timedelta
-from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, UploadFile, status
-from PIL import Image, ImageOps
-from sqlmodel import Session
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
 
 from app.core.config import settings
+from app.core.image_processing import (
+    FALLBACK_ENCODINGS,
+    IMAGE_ENCODINGS,
+    IMAGE_VARIANTS,
+    ImageProcessorBusy,
+    check_encodings,
+    image_processor,
+    variant_key,
+)
 from app.core.storage import StorageClient, get_default_storage_client
 from app.models.upload import FileMetadata, UploadResponse
 
 
+# Variants rendered at upload in lazy mode; the rest on first request
+LAZY_MODE_VARIANTS = {
+    name: IMAGE_VARIANTS[name] for name in ("original", "thumbnail")
+}
+
+
 class FileUploadError(HTTPException):
     """Custom exception for file upload errors"""
 
@@ -23,8 +40,20 @@ class FileUploadError(HTTPException):
 class UploadService:
     """Production-grade file upload service with pluggable storage backend"""
 
-    def __init__(self, storage_client: Optional[StorageClient] = None):
+    def __init__(
+        self,
+        storage_client: Optional[StorageClient] = None,
+        variant_formats: Optional[Dict[str, Sequence[str]]] = None,
+    ):
         self.storage_client = storage_client or get_default_storage_client()
+        # Image variant -> modern encodings stored besides the JPEG/PNG fallback
+        self.variant_formats = check_encodings(
+            settings.IMAGE_VARIANT_FORMATS
+            if variant_formats is None
+            else variant_formats
+        )
+        # (file_id, variant) -> render in progress, shared by concurrent requests
+        self._variant_renders: Dict[Tuple[str, str], asyncio.Task] = {}
         # Ensure bucket exists on initialization
         self._ensure_bucket_exists()
 
@@ -51,12 +80,18 @@ class UploadService:
             raise ValueError(f"Failed to initialize storage bucket: {e}")
 
     def _generate_file_path(
-        self, file_type: str, file_id: str, filename: str, variant: str = ""
+        self,
+        file_type: str,
+        file_id: str,
+        filename: str,
+        variant: str = "",
+        extension: Optional[str] = None,
+        date: Optional[datetime] = None,
     ) -> str:
         """Generate organized file path structure"""
-        date_path = datetime.now().strftime("%Y/%m/%d")
+        date_path = (date or datetime.now()).strftime("%Y/%m/%d")
         variant_suffix = f"_{variant}" if variant else ""
-        file_extension = Path(filename).suffix
+        file_extension = Path(filename).suffix if extension is None else extension
 
         return f"{file_type}/{date_path}/{file_id}{variant_suffix}{file_extension}"
 
@@ -76,8 +111,7 @@ class UploadService:
             raise FileUploadError("File size cannot be determined")
 
         if file.size > max_size:
-            max_mb = max_size / (1024 * 1024)
-            raise FileUploadError(f"File too large. Maximum size: {max_mb:.1f}MB")
+            raise _file_too_large(max_size)
 
     async def _read_file_content(self, file: UploadFile) -> bytes:
         """Read file content safely"""
@@ -90,61 +124,237 @@ class UploadService:
 
     def _calculate_checksum(self, content: bytes) -> str:
         """Calculate MD5 checksum for file integrity"""
-        import hashlib
-
         return hashlib.md5(content).hexdigest()
 
+    async def _stream_file(
+        self, file: UploadFile, file_path: str, memory_limit: int, max_size: int
+    ) -> Tuple[str, str, int]:
+        """
+        Stream an upload to storage in parts, checksumming it on the way.
+
+        Args:
+            file: The upload; its content is read from the spooled temp file
+            file_path: Storage path
+            memory_limit: Most bytes of the file to buffer at once
+            max_size: Size limit, enforced on the bytes actually read
+
+        Returns:
+            (URL, MD5 checksum, size in bytes)
+
+        Raises:
+            FileUploadError: The stream is longer than max_size; whatever
+                was stored of it is deleted
+        """
+        await file.seek(0)
+        reader = _ChecksumReader(file.file, max_size)
+        try:
+            url = await self.storage_client.upload_stream(
+                file_path, reader, file.content_type, memory_limit
+            )
+        except Exception:
+            # Don't leave a partial object behind
+            await self.storage_client.delete_file(file_path)
+            raise
+        return url, reader.hexdigest(), reader.size
+
     async def _process_image(
-        self, content: bytes, file_id: str, filename: str
+        self,
+        content: bytes,
+        file_id: str,
+        filename: str,
+        upload_date: datetime,
+        variants: Dict[str, Optional[Tuple[int, int]]] = IMAGE_VARIANTS,
     ) -> Dict[str, str]:
         """Process image: resize, optimize, create thumbnails"""
-        variants = {}
+        # Variants are rendered in the image process pool; each is uploaded
+        # while the next one is being encoded
+        uploads: Dict[str, asyncio.Task] = {}
 
         try:
-            # Open and process image
-            image = Image.open(BytesIO(content))
-
-            # Convert to RGB if necessary
-            if image.mode in ("RGBA", "P"):
-                image = image.convert("RGB")
-
-            # Auto-orient based on EXIF data
-            image = ImageOps.exif_transpose(image)
-
-            # Create different variants
-            variants_config = {
-                "original": None,  # Keep original
-                "large": (1920, 1080),
-                "medium": (800, 600),
-                "small": (400, 300),
-                "thumbnail": settings.THUMBNAIL_SIZE,
-            }
-
-            for variant_name, size in variants_config.items():
-                processed_image = image.copy()
-
-                if size and (image.width > size[0] or image.height > size[1]):
-                    processed_image.thumbnail(size, Image.Resampling.LANCZOS)
-
-                # Save processed image
-                output = BytesIO()
-                processed_image.save(output, format="JPEG", quality=85, optimize=True)
-                processed_content = output.getvalue()
-
-                # Upload variant using storage client
-                variant_path = self._generate_file_path(
-                    "images", file_id, filename, variant_name
-                )
-                variant_url = await self.storage_client.upload_file(
-                    variant_path, processed_content, "image/jpeg"
-                )
-                variants[variant_name] = variant_url
+            async with aclosing(
+                image_processor.render(content, variants, self.variant_formats)
+            ) as rendered:
+                async for variant in rendered:
+                    # Paths are derived from upload_date so lazily rendered
+                    # variants can find the original later
+                    variant_path = self._generate_file_path(
+                        "images",
+                        file_id,
+                        filename,
+                        variant.name,
+                        variant.extension,
+                        upload_date,
+                    )
+                    uploads[variant.key] = asyncio.create_task(
+                        self.storage_client.upload_file(
+                            variant_path, variant.content, variant.content_type
+                        )
+                    )
 
-            return variants
+            urls = await asyncio.gather(*uploads.values())
+            return dict(zip(uploads, urls))
 
+        except ImageProcessorBusy:
+            raise FileUploadError(
+                "Image processing is busy, please retry",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
         except Exception as e:
+            # Don't leave uploads of a failed image running unobserved
+            for upload in uploads.values():
+                upload.cancel()
+            await asyncio.gather(*uploads.values(), return_exceptions=True)
             raise FileUploadError(f"Image processing failed: {str(e)}")
 
+    async def ensure_variant(
+        self, file_metadata: FileMetadata, name: str, db: Session
+    ) -> FileMetadata:
+        """
+        Render an image variant that hasn't been rendered yet (lazy mode).
+
+        The variant is rendered from the stored original, uploaded and
+        recorded in FileMetadata.variants. Concurrent requests for the same
+        variant share one render; it finishes even if they disconnect.
+
+        Args:
+            file_metadata: Metadata of an uploaded image
+            name: Variant name, e.g. "medium"
+            db: Database session
+
+        Returns:
+            The file metadata, refreshed if the variant was rendered
+        """
+        variants = file_metadata.variants or {}
+        if (
+            file_metadata.file_type != "image"
+            or name not in IMAGE_VARIANTS
+            or name in variants
+            or "original" not in variants
+        ):
+            # Nothing to render; select_variant reports unknown variants
+            return file_metadata
+
+        flight = (file_metadata.file_id, name)
+        render = self._variant_renders.get(flight)
+        if render is None:
+            render = asyncio.create_task(
+                self._render_variant(
+                    file_metadata.file_id,
+                    name,
+                    self._generate_file_path(
+                        "images",
+                        file_metadata.file_id,
+                        file_metadata.original_filename,
+                        "original",
+                        Path(variants["original"]).suffix,
+                        file_metadata.upload_date,
+                    ),
+                    file_metadata.original_filename,
+                    file_metadata.upload_date,
+                    db.get_bind(),
+                )
+            )
+            self._variant_renders[flight] = render
+            render.add_done_callback(
+                lambda _: self._variant_renders.pop(flight, None)
+            )
+
+        await asyncio.shield(render)
+        await asyncio.to_thread(db.refresh, file_metadata)
+        return file_metadata
+
+    async def _render_variant(
+        self,
+        file_id: str,
+        name: str,
+        original_path: str,
+        filename: str,
+        upload_date: datetime,
+        engine: Engine,
+    ) -> None:
+        """Render one variant from the stored original and record its URLs."""
+        # Another worker process may have rendered it in the meantime
+        if await asyncio.to_thread(self._has_variant, engine, file_id, name):
+            return
+
+        try:
+            content = await self.storage_client.download_file(original_path)
+        except Exception as e:
+            raise FileUploadError(
+                f"Failed to read original image: {str(e)}",
+                status_code=status.HTTP_502_BAD_GATEWAY,
+            )
+        urls = await self._process_image(
+            content, file_id, filename, upload_date, {name: IMAGE_VARIANTS[name]}
+        )
+
+        # Waiting for the row lock must not block the event loop
+        await asyncio.to_thread(self._record_variants, engine, file_id, urls)
+
+    @staticmethod
+    def _has_variant(engine: Engine, file_id: str, name: str) -> bool:
+        """Whether a variant is recorded in the file's metadata row."""
+        with Session(engine) as session:
+            file_metadata = session.get(FileMetadata, file_id)
+            return bool(file_metadata and name in (file_metadata.variants or {}))
+
+    @staticmethod
+    def _record_variants(engine: Engine, file_id: str, urls: Dict[str, str]) -> None:
+        """Merge variant URLs into the file's metadata row, keeping the rest."""
+        with Session(engine) as session:
+            # Row lock: other workers may be recording other variants
+            file_metadata = session.exec(
+                select(FileMetadata)
+                .where(FileMetadata.file_id == file_id)
+                .with_for_update()
+            ).one()
+            file_metadata.variants = {**(file_metadata.variants or {}), **urls}
+            session.add(file_metadata)
+            session.commit()
+
+    def select_variant(
+        self, file_metadata: FileMetadata, name: str, accept: Optional[str]
+    ) -> str:
+        """
+        Pick the stored encoding of an image variant that best suits a client.
+
+        Modern encodings (AVIF, WebP) are only served to clients whose Accept
+        header names them, preferring the higher q-value and then the order of
+        IMAGE_ENCODINGS; otherwise the JPEG/PNG fallback is served.
+
+        Args:
+            file_metadata: Metadata of an uploaded image
+            name: Variant name, e.g. "medium"
+            accept: The request's Accept header
+
+        Returns:
+            Key of the chosen encoding in file_metadata.variants
+        """
+        variants = file_metadata.variants or {}
+        if (
+            file_metadata.file_type != "image"
+            or name not in IMAGE_VARIANTS
+            or name not in variants
+        ):
+            raise FileUploadError(
+                "Image variant not found", status_code=status.HTTP_404_NOT_FOUND
+            )
+
+        ranges = _parse_accept(accept or "")
+        fallback_type = "image/png" if variants[name].endswith(".png") else "image/jpeg"
+        best_key, best_quality = name, _accept_quality(ranges, fallback_type)
+        for encoding, spec in IMAGE_ENCODINGS.items():
+            key = variant_key(name, encoding)
+            if encoding in FALLBACK_ENCODINGS or key not in variants:
+                continue
+            # On a tie, a modern encoding beats the fallback, not another one
+            quality = ranges.get(spec.content_type, 0.0)
+            if quality > best_quality or (
+                quality > 0 and quality == best_quality and best_key == name
+            ):
+                best_key, best_quality = key, quality
+        return best_key
+
     async def upload_image(self, file: UploadFile, db: Session) -> UploadResponse:
         """Upload and process image files"""
         # Debug logging
@@ -164,11 +374,19 @@ class UploadService:
 
         # Generate file ID and read content
         file_id = str(uuid.uuid4())
+        upload_date = datetime.now()
         content = await self._read_file_content(file)
         checksum = self._calculate_checksum(content)
 
-        # Process image and create variants
-        variants = await self._process_image(content, file_id, file.filename)
+        # Process image and create variants; in lazy mode the other sizes are
+        # rendered on first request (ensure_variant)
+        variants = await self._process_image(
+            content,
+            file_id,
+            file.filename,
+            upload_date,
+            LAZY_MODE_VARIANTS if settings.IMAGE_LAZY_VARIANTS else IMAGE_VARIANTS,
+        )
 
         # Create metadata
         file_metadata_obj = FileMetadata(
@@ -176,7 +394,7 @@ class UploadService:
             original_filename=file.filename,
             content_type=file.content_type,
             size=len(content),
-            upload_date=datetime.now(),
+            upload_date=upload_date,
             file_id=file_id,
             file_type="image",
             processed=True,
@@ -203,7 +421,12 @@ class UploadService:
             upload_date=file_metadata_obj.upload_date,
         )
 
-    async def upload_document(self, file: UploadFile, db: Session) -> UploadResponse:
+    async def upload_document(
+        self,
+        file: UploadFile,
+        db: Session,
+        memory_limit: int = settings.UPLOAD_MEMORY_LIMIT,
+    ) -> UploadResponse:
         """Upload document files"""
         # Validation
         if not file.filename:
@@ -212,17 +435,14 @@ class UploadService:
             raise FileUploadError("Content type is required")
 
         self._validate_file_type(file, settings.ALLOWED_DOCUMENT_TYPES)
-        self._validate_file_size(file, settings.MAX_FILE_SIZE)
+        max_size = settings.MAX_FILE_SIZE
+        self._validate_file_size(file, max_size)
 
-        # Generate file ID and read content
+        # Stream the file to storage without reading it into memory
         file_id = str(uuid.uuid4())
-        content = await self._read_file_content(file)
-        checksum = self._calculate_checksum(content)
-
-        # Upload file using storage client
         file_path = self._generate_file_path("documents", file_id, file.filename)
-        url = await self.storage_client.upload_file(
-            file_path, content, file.content_type
+        url, checksum, size = await self._stream_file(
+            file, file_path, memory_limit, max_size
         )
 
         # Create metadata
@@ -230,7 +450,7 @@ class UploadService:
             filename=f"{file_id}{Path(file.filename).suffix}",
             original_filename=file.filename,
             content_type=file.content_type,
-            size=len(content),
+            size=size,
             upload_date=datetime.now(),
             file_id=file_id,
             file_type="document",
@@ -248,13 +468,18 @@ class UploadService:
             file_id=file_id,
             filename=file_metadata_obj.filename,
             content_type=file.content_type,
-            size=len(content),
+            size=size,
             url=url,
             file_metadata=file_metadata_obj.model_dump(),
             upload_date=file_metadata_obj.upload_date,
         )
 
-    async def upload_video(self, file: UploadFile, db: Session) -> UploadResponse:
+    async def upload_video(
+        self,
+        file: UploadFile,
+        db: Session,
+        memory_limit: int = settings.UPLOAD_MEMORY_LIMIT,
+    ) -> UploadResponse:
         """Upload video files"""
         # Validation
         if not file.filename:
@@ -263,17 +488,14 @@ class UploadService:
             raise FileUploadError("Content type is required")
 
         self._validate_file_type(file, settings.ALLOWED_VIDEO_TYPES)
-        self._validate_file_size(file, settings.MAX_VIDEO_SIZE)
+        max_size = settings.MAX_VIDEO_SIZE
+        self._validate_file_size(file, max_size)
 
-        # Generate file ID and read content
+        # Stream the file to storage without reading it into memory
         file_id = str(uuid.uuid4())
-        content = await self._read_file_content(file)
-        checksum = self._calculate_checksum(content)
-
-        # Upload file using storage client
         file_path = self._generate_file_path("videos", file_id, file.filename)
-        url = await self.storage_client.upload_file(
-            file_path, content, file.content_type
+        url, checksum, size = await self._stream_file(
+            file, file_path, memory_limit, max_size
         )
 
         # Create metadata
@@ -281,7 +503,7 @@ class UploadService:
             filename=f"{file_id}{Path(file.filename).suffix}",
             original_filename=file.filename,
             content_type=file.content_type,
-            size=len(content),
+            size=size,
             upload_date=datetime.now(),
             file_id=file_id,
             file_type="video",
@@ -299,7 +521,7 @@ class UploadService:
             file_id=file_id,
             filename=file_metadata_obj.filename,
             content_type=file.content_type,
-            size=len(content),
+            size=size,
             url=url,
             file_metadata=file_metadata_obj.model_dump(),
             upload_date=file_metadata_obj.upload_date,
@@ -349,5 +571,66 @@ class UploadService:
         return self.storage_client.bucket_name
 
 
+class _ChecksumReader:
+    """
+    File wrapper that MD5-hashes and counts whatever is read through it.
+
+    Reading past `max_size` bytes raises FileUploadError, so the upload
+    stops partway instead of storing a file over the limit.
+    """
+
+    def __init__(self, file: BinaryIO, max_size: Optional[int] = None):
+        self._file = file
+        self._md5 = hashlib.md5()
+        self.max_size = max_size
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self.size += len(data)
+        if self.max_size is not None and self.size > self.max_size:
+            raise _file_too_large(self.max_size)
+        self._md5.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._md5.hexdigest()
+
+
+def _file_too_large(max_size: int) -> FileUploadError:
+    max_mb = max_size / (1024 * 1024)
+    return FileUploadError(f"File too large. Maximum size: {max_mb:.1f}MB")
+
+
+def _parse_accept(accept: str) -> Dict[str, float]:
+    """Parse an Accept header into media range -> q-value."""
+    ranges: Dict[str, float] = {}
+    for item in accept.split(","):
+        media_range, *params = item.split(";")
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        ranges[media_range] = quality
+    return ranges
+
+
+def _accept_quality(ranges: Dict[str, float], content_type: str) -> float:
+    """q-value of a content type under the most specific matching range."""
+    if not ranges:
+        return 1.0  # No Accept header: anything goes
+    for media_range in (content_type, content_type.split("/")[0] + "/*", "*/*"):
+        if media_range in ranges:
+            return ranges[media_range]
+    return 0.0
+
+
 # Global upload service instance
 upload_service = UploadService()
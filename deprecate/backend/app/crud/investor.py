@@ -1,11 +1,39 @@
+import base64
+import json
 import uuid
-from typing import List, Optional
-
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import (
+    Row,
+    case,
+    func,
+    insert,
+    literal_column,
+    tuple_,
+    type_coerce,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Session, and_, col, or_, select
+from sqlmodel.sql.expression import Select
 
-from app.models.investor import InvestorProfile, InvestorProfileCreate
+from app.models.investor import (
+    InvestorCountMode,
+    InvestorProfile,
+    InvestorProfileCreate,
+)
 from app.models.startup import FundingStage, Industry
 from app.models.user import User
+from app.services.geo import apply_geocode
+from app.services.investor_index import investor_index
+from app.services.investor_projection import select_investor_reads
+from app.services.investor_search import (
+    PREFIX_MATCH,
+    SUBSTRING_MATCH,
+    WORD_PREFIX_MATCH,
+    investor_search_index,
+    normalize_search_text,
+)
+from app.services.suggest import suggest_index
 
 
 def create_investor_profile(
@@ -17,12 +45,40 @@ def create_investor_profile(
     investor_profile = InvestorProfile.model_validate(
         investor_profile_in, update={"user_id": user_id}
     )
+    apply_geocode(investor_profile)
     db.add(investor_profile)
     db.commit()
     db.refresh(investor_profile)
+    investor_index.upsert(investor_profile)
+    investor_search_index.upsert(investor_profile)
+    suggest_index.sync_investor(investor_profile)
     return investor_profile
 
 
+def insert_investors(
+    db: Session,
+    user_rows: Sequence[Dict[str, Any]],
+    profile_rows: Sequence[Dict[str, Any]],
+) -> int:
+    """
+    Insert a batch of users and investor profiles in one transaction.
+
+    Rows are complete column dicts (ids, hashed passwords and geocode fields
+    set), written with one executemany INSERT per table. Unlike
+    create_investor_profile this does not touch the process-local indexes;
+    callers invalidate them once they are done.
+
+    Returns:
+        int: Profiles inserted
+    """
+    if user_rows:
+        db.execute(insert(User), user_rows)
+    if profile_rows:
+        db.execute(insert(InvestorProfile), profile_rows)
+    db.commit()
+    return len(profile_rows)
+
+
 def get_all_investor_profiles(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[InvestorProfile]:
@@ -43,6 +99,16 @@ def get_investor_profile_by_id(
     return db.get(InvestorProfile, profile_id)
 
 
+def get_investor_profile_by_user_id(
+    db: Session, user_id: uuid.UUID
+) -> InvestorProfile | None:
+    """
+    Retrieve the investor profile owned by a user.
+    """
+    statement = select(InvestorProfile).where(InvestorProfile.user_id == user_id)
+    return db.exec(statement).first()
+
+
 def update_investor_profile(
     db: Session, profile_id: uuid.UUID, investor_update: dict
 ) -> InvestorProfile | None:
@@ -56,10 +122,14 @@ def update_investor_profile(
     for field, value in investor_update.items():
         if hasattr(investor_profile, field):
             setattr(investor_profile, field, value)
+    apply_geocode(investor_profile)
 
     db.add(investor_profile)
     db.commit()
     db.refresh(investor_profile)
+    investor_index.upsert(investor_profile)
+    investor_search_index.upsert(investor_profile)
+    suggest_index.sync_investor(investor_profile)
     return investor_profile
 
 
@@ -73,6 +143,9 @@ def delete_investor_profile(db: Session, profile_id: uuid.UUID) -> bool:
 
     db.delete(investor_profile)
     db.commit()
+    investor_index.remove(profile_id)
+    investor_search_index.remove(profile_id)
+    suggest_index.remove_investor(profile_id)
     return True
 
 
@@ -101,21 +174,26 @@ def get_filtered_investor_profiles_with_users(
     industries: Optional[List[Industry]] = None,
     funding_stages: Optional[List[FundingStage]] = None,
     location: Optional[str] = None,
-) -> tuple[List[tuple[InvestorProfile, User]], int]:
+    cursor: Optional[tuple[str, uuid.UUID]] = None,
+    count_mode: InvestorCountMode = InvestorCountMode.EXACT,
+) -> tuple[List[Row], int]:
     """
     Retrieve investor profiles with advanced filtering and search capabilities.
-    Returns both the filtered results and total count for pagination.
+    Returns both the filtered rows (the InvestorWithUserRead columns, see
+    app.services.investor_projection) and total count for pagination.
+
+    Results are ordered by (firm_name, id). Pass the (firm_name, id) of the
+    last row of the previous page as `cursor` for keyset pagination; `skip`
+    is ignored then, so deep pages cost the same as the first one.
     """
     # Build the base query
-    base_query = (
-        select(InvestorProfile, User)
-        .join(User)
-        .where(InvestorProfile.user_id == User.id)
-    )
+    base_query = select_investor_reads()
 
-    # Build count query for total results
+    # Count query: a single COUNT(*) row instead of every matching profile
     count_query = (
-        select(InvestorProfile).join(User).where(InvestorProfile.user_id == User.id)
+        select(func.count())
+        .select_from(InvestorProfile)
+        .join(User, InvestorProfile.user_id == User.id)
     )
 
     # Apply filters
@@ -142,38 +220,120 @@ def get_filtered_investor_profiles_with_users(
         count_query = count_query.where(filter_condition)
 
     # Get total count
-    count_results = db.exec(count_query).all()
-    total_count = len(count_results)
+    if count_mode == InvestorCountMode.ESTIMATED:
+        total_count = _estimate_row_count(db, count_query)
+    else:
+        total_count = db.exec(count_query).one()
 
     # Apply pagination and ordering
-    final_query = (
-        base_query.order_by(InvestorProfile.firm_name).offset(skip).limit(limit)
-    )
+    final_query = base_query.order_by(InvestorProfile.firm_name, InvestorProfile.id)
+    if cursor is not None:
+        final_query = final_query.where(
+            tuple_(InvestorProfile.firm_name, InvestorProfile.id) > tuple_(*cursor)
+        )
+    else:
+        final_query = final_query.offset(skip)
 
     # Execute the query
-    results = db.exec(final_query).all()
+    results = db.exec(final_query.limit(limit)).all()
 
     return list(results), total_count
 
 
+def _estimate_row_count(db: Session, count_query: Select) -> int:
+    """
+    Planner estimate of the rows a COUNT(*) query would count.
+
+    Reads the row estimate of the counted plan node from EXPLAIN, so nothing
+    is scanned. Falls back to an exact count on databases other than
+    PostgreSQL.
+    """
+    connection = db.connection()
+    if connection.dialect.name != "postgresql":
+        return db.exec(count_query).one()
+
+    compiled = count_query.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    # The top node is the COUNT(*) aggregate; its input holds the estimate
+    node = plan[0]["Plan"]
+    while node.get("Plans") and node["Node Type"] == "Aggregate":
+        node = node["Plans"][0]
+    return int(node["Plan Rows"])
+
+
+def encode_investor_cursor(investor: Any) -> str:
+    """
+    Opaque keyset cursor pointing after `investor` (a profile or a row with
+    firm_name and id).
+    """
+    payload = json.dumps([investor.firm_name, str(investor.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_investor_cursor(cursor: str) -> tuple[str, uuid.UUID]:
+    """
+    Decode a cursor from encode_investor_cursor.
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        firm_name, profile_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return str(firm_name), uuid.UUID(profile_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
 def search_investors_by_name_or_firm(
     db: Session, search_term: str, skip: int = 0, limit: int = 100
-) -> List[tuple[InvestorProfile, User]]:
+) -> List[Row]:
     """
     Search investors by name or firm name with case-insensitive matching.
+    Results are ranked: names or firms starting with the term first, then
+    words starting with the term, then by trigram similarity.
     """
-    search_lower = search_term.lower()
+    if db.get_bind().dialect.name != "postgresql":
+        return _search_investors_in_process(db, search_term, skip, limit)
+
+    term = normalize_search_text(search_term)
+    escaped = _escape_like(term)
+    name = col(User.full_name)
+    firm_name = col(InvestorProfile.firm_name)
+
+    # ILIKE '%term%' on both columns is served by their pg_trgm GIN indexes
+    rank = case(
+        (
+            or_(
+                name.ilike(f"{escaped}%", escape="\\"),
+                firm_name.ilike(f"{escaped}%", escape="\\"),
+            ),
+            PREFIX_MATCH,
+        ),
+        (
+            or_(
+                name.ilike(f"% {escaped}%", escape="\\"),
+                firm_name.ilike(f"% {escaped}%", escape="\\"),
+            ),
+            WORD_PREFIX_MATCH,
+        ),
+        else_=SUBSTRING_MATCH,
+    )
+    similarity = func.greatest(
+        func.similarity(name, term), func.similarity(firm_name, term)
+    )
+
     statement = (
-        select(InvestorProfile, User)
-        .join(User)
+        select_investor_reads()
         .where(
-            InvestorProfile.user_id == User.id,
             or_(
-                col(User.full_name).ilike(f"%{search_lower}%"),
-                col(InvestorProfile.firm_name).ilike(f"%{search_lower}%"),
+                name.ilike(f"%{escaped}%", escape="\\"),
+                firm_name.ilike(f"%{escaped}%", escape="\\"),
             ),
         )
-        .order_by(InvestorProfile.firm_name)
+        .order_by(rank.desc(), similarity.desc(), firm_name, InvestorProfile.id)
         .offset(skip)
         .limit(limit)
     )
@@ -181,54 +341,81 @@ def search_investors_by_name_or_firm(
     return list(results)
 
 
+def _search_investors_in_process(
+    db: Session, search_term: str, skip: int, limit: int
+) -> List[Row]:
+    """
+    Search through the in-process trigram index (databases without pg_trgm).
+    """
+    profile_ids = investor_search_index.search(db, search_term, skip + limit)[skip:]
+    if not profile_ids:
+        return []
+
+    statement = select_investor_reads().where(
+        col(InvestorProfile.id).in_(profile_ids)
+    )
+    positions = {profile_id: i for i, profile_id in enumerate(profile_ids)}
+    results = db.exec(statement).all()
+    return sorted(results, key=lambda row: positions[row.id])
+
+
+def _escape_like(term: str) -> str:
+    """
+    Escape LIKE wildcards so the term only matches literally.
+    """
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 def get_investors_by_industry_focus(
     db: Session, industry: Industry, skip: int = 0, limit: int = 100
-) -> List[tuple[InvestorProfile, User]]:
+) -> List[Row]:
     """
     Get investors who have the specified industry in their investment focus.
-    This is a simplified version that works without complex JSON queries.
+    Containment and pagination run in SQL on the GIN-indexed JSONB column.
     """
-    # Get all investors and filter in Python for now
-    # In production, you'd want to optimize this with proper JSON queries
-    all_investors = get_all_investor_profiles_with_users(
-        db, 0, 1000
-    )  # Get a larger set
-
-    filtered_investors = []
-    for investor_profile, user in all_investors:
-        if (
-            investor_profile.investment_focus
-            and industry in investor_profile.investment_focus
-        ):
-            filtered_investors.append((investor_profile, user))
-
-    # Apply pagination manually
-    start_idx = skip
-    end_idx = skip + limit
-    return filtered_investors[start_idx:end_idx]
+    return _get_investors_containing(
+        db, InvestorProfile.investment_focus, industry.value, skip, limit
+    )
 
 
 def get_investors_by_funding_stage(
     db: Session, funding_stage: FundingStage, skip: int = 0, limit: int = 100
-) -> List[tuple[InvestorProfile, User]]:
+) -> List[Row]:
     """
     Get investors who prefer the specified funding stage.
-    This is a simplified version that works without complex JSON queries.
-    """
-    # Get all investors and filter in Python for now
-    all_investors = get_all_investor_profiles_with_users(
-        db, 0, 1000
-    )  # Get a larger set
-
-    filtered_investors = []
-    for investor_profile, user in all_investors:
-        if (
-            investor_profile.preferred_stages
-            and funding_stage in investor_profile.preferred_stages
-        ):
-            filtered_investors.append((investor_profile, user))
-
-    # Apply pagination manually
-    start_idx = skip
-    end_idx = skip + limit
-    return filtered_investors[start_idx:end_idx]
+    Containment and pagination run in SQL on the GIN-indexed JSONB column.
+    """
+    return _get_investors_containing(
+        db, InvestorProfile.preferred_stages, funding_stage.value, skip, limit
+    )
+
+
+def _get_investors_containing(
+    db: Session, column: Any, value: str, skip: int, limit: int
+) -> List[Row]:
+    """
+    Page through investors whose JSON array column contains `value`.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        # JSONB @> '["value"]', served by the column's GIN index
+        contains = type_coerce(column, JSONB).contains([value])
+    else:
+        # No @> on other databases (SQLite in dev and tests): look for the
+        # value among the array's elements
+        elements = func.json_each(column).table_valued("value")
+        contains = (
+            select(literal_column("1"))
+            .select_from(elements)
+            .where(elements.c.value == value)
+            .exists()
+        )
+
+    statement = (
+        select_investor_reads()
+        .where(contains)
+        .order_by(InvestorProfile.firm_name, InvestorProfile.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    results = db.exec(statement).all()
+    return list(results)
@@ -1,9 +1,19 @@
+import base64
+import json
 import uuid
-from typing import Optional, Sequence
+from typing import Any, Dict, Optional, Sequence
 
-from sqlmodel import Session, select
+from sqlalchemy import func, insert, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
 
-from app.models.startup import Startup, StartupCreate, StartupUpdate
+from app.models.startup import Startup, StartupCreate, StartupSummary, StartupUpdate
+from app.services.geo import apply_geocode
+from app.services.recommendation_cache import recommendation_cache
+from app.services.startup_index import startup_index
+from app.services.suggest import suggest_index
 
 """
     Get a startup by id 
@@ -17,14 +27,32 @@ def get_startup(db: Session, startup_id: uuid.UUID) -> Optional[Startup]:
     return db.get(Startup, startup_id)
 
 
+"""
+    Load only the StartupSummary columns of a listing query
+    The JSON profile sections (team_members, funding, metrics, ...) and long
+    text fields stay unloaded; touching one on a result costs a query
+    @param statement: SelectOfScalar[Startup]
+    @return SelectOfScalar[Startup]
+"""
+
+
+def _summary_only(statement: SelectOfScalar[Startup]) -> SelectOfScalar[Startup]:
+    columns = [getattr(Startup, field) for field in StartupSummary.model_fields]
+    return statement.options(load_only(*columns))
+
+
 """
     Get all startups
+    Ordered by (name, id); pass the (name, id) of the last startup of the
+    previous page as cursor for keyset pagination (skip is ignored then)
     @param db: Session
     @param skip: int
     @param limit: int
     @param industry: Optional[str]
-    @param location: Optional[str]
+    @param location: Optional[str] (case-insensitive)
     @param funding_stage: Optional[str]
+    @param summary: bool (load only the StartupSummary columns)
+    @param cursor: Optional[tuple[str, uuid.UUID]]
     @return Sequence[Startup]
 """
 
@@ -37,24 +65,62 @@ def get_startups(
     location: Optional[str] = None,
     funding_stage: Optional[str] = None,
     published_only: bool = True,
+    summary: bool = False,
+    cursor: Optional[tuple[str, uuid.UUID]] = None,
 ) -> Sequence[Startup]:
     statement = select(Startup)
+    if summary:
+        statement = _summary_only(statement)
 
     # Filter by published status by default for public listings
+    # Every filter combination is served by an index ending in (name, id)
     if published_only:
         statement = statement.where(Startup.is_published)
     if industry:
         statement = statement.where(Startup.industry == industry)
     if location:
-        statement = statement.where(Startup.location == location)
+        statement = statement.where(func.lower(Startup.location) == location.lower())
     if funding_stage:
         statement = statement.where(Startup.funding_stage == funding_stage)
 
-    statement = statement.offset(skip).limit(limit)
-    results = db.exec(statement).all()
+    statement = statement.order_by(Startup.name, Startup.id)
+    if cursor is not None:
+        statement = statement.where(tuple_(Startup.name, Startup.id) > tuple_(*cursor))
+    else:
+        statement = statement.offset(skip)
+
+    results = db.exec(statement.limit(limit)).all()
     return results
 
 
+"""
+    Opaque keyset cursor pointing after a startup
+    @param startup: Startup
+    @return str
+"""
+
+
+def encode_startup_cursor(startup: Startup) -> str:
+    payload = json.dumps([startup.name, str(startup.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+"""
+    Decode a cursor from encode_startup_cursor
+    Raises ValueError if the cursor is malformed
+    @param cursor: str
+    @return tuple[str, uuid.UUID]
+"""
+
+
+def decode_startup_cursor(cursor: str) -> tuple[str, uuid.UUID]:
+    try:
+        name, startup_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return str(name), uuid.UUID(startup_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
 """
     Create a startup
     @param db: Session
@@ -69,12 +135,34 @@ def create_startup(
     startup_data = startup.model_dump()
     startup_data["founder_id"] = founder_id
     db_startup = Startup(**startup_data)
+    apply_geocode(db_startup)
     db.add(db_startup)
     db.commit()
     db.refresh(db_startup)
+    startup_index.sync(db_startup)
+    suggest_index.sync_startup(db_startup)
     return db_startup
 
 
+"""
+    Insert a batch of startups with one executemany INSERT
+    Rows are complete column dicts (id, founder_id and geocode fields set);
+    unlike create_startup this does not touch the process-local indexes, so
+    callers invalidate startup_index and suggest_index once they are done
+    @param db: Session
+    @param rows: Sequence[Dict[str, Any]]
+    @return int (rows inserted)
+"""
+
+
+def insert_startups(db: Session, rows: Sequence[Dict[str, Any]]) -> int:
+    if not rows:
+        return 0
+    db.execute(insert(Startup), rows)
+    db.commit()
+    return len(rows)
+
+
 """
     Update a startup
     @param db: Session
@@ -94,10 +182,14 @@ def update_startup(
     update_data = startup.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_startup, field, value)
+    apply_geocode(db_startup)
 
     db.add(db_startup)
     db.commit()
     db.refresh(db_startup)
+    recommendation_cache.invalidate_startup(startup_id)
+    startup_index.sync(db_startup)
+    suggest_index.sync_startup(db_startup)
     return db_startup
 
 
@@ -116,6 +208,9 @@ def delete_startup(db: Session, startup_id: uuid.UUID) -> bool:
 
     db.delete(db_startup)
     db.commit()
+    recommendation_cache.invalidate_startup(startup_id)
+    startup_index.remove(startup_id)
+    suggest_index.remove_startup(startup_id)
     return True
 
 
@@ -133,19 +228,41 @@ def get_startup_by_founder(db: Session, founder_id: uuid.UUID) -> Optional[Start
     return result
 
 
+"""
+    Get a startup by founder id (async)
+    @param session: AsyncSession
+    @param founder_id: uuid.UUID
+    @return Optional[Startup]
+"""
+
+
+async def get_startup_by_founder_async(
+    session: AsyncSession, founder_id: uuid.UUID
+) -> Optional[Startup]:
+    statement = select(Startup).where(Startup.founder_id == founder_id)
+    result = await session.execute(statement)
+    return result.scalars().first()
+
+
 """
     Get all startups by founder id
     @param db: Session
     @param founder_id: uuid.UUID
     @param include_drafts: bool
+    @param summary: bool (load only the StartupSummary columns)
     @return Sequence[Startup]
 """
 
 
 def get_startups_by_founder(
-    db: Session, founder_id: uuid.UUID, include_drafts: bool = True
+    db: Session,
+    founder_id: uuid.UUID,
+    include_drafts: bool = True,
+    summary: bool = False,
 ) -> Sequence[Startup]:
     statement = select(Startup).where(Startup.founder_id == founder_id)
+    if summary:
+        statement = _summary_only(statement)
 
     # If not including drafts, only return published startups
     if not include_drafts:
@@ -160,6 +277,8 @@ def get_startups_by_founder(
     @param db: Session
     @param skip: int
     @param limit: int
+    @param summary: bool (load only the StartupSummary columns)
+    @param cursor: Optional[tuple[str, uuid.UUID]] (see get_startups)
     @return Sequence[Startup]
 """
 
@@ -171,6 +290,8 @@ def get_published_startups(
     industry: Optional[str] = None,
     location: Optional[str] = None,
     funding_stage: Optional[str] = None,
+    summary: bool = False,
+    cursor: Optional[tuple[str, uuid.UUID]] = None,
 ) -> Sequence[Startup]:
     return get_startups(
         db=db,
@@ -180,6 +301,8 @@ def get_published_startups(
         location=location,
         funding_stage=funding_stage,
         published_only=True,
+        summary=summary,
+        cursor=cursor,
     )
 
 
@@ -187,16 +310,21 @@ def get_published_startups(
     Get draft startups by founder
     @param db: Session
     @param founder_id: uuid.UUID
+    @param summary: bool (load only the StartupSummary columns)
     @return Sequence[Startup]
 """
 
 
 def get_draft_startups_by_founder(
-    db: Session, founder_id: uuid.UUID
+    db: Session, founder_id: uuid.UUID, summary: bool = False
 ) -> Sequence[Startup]:
+    # SQL NOT (a Python `not` here would compile to WHERE false); served by
+    # the partial index ix_startup_founder_id_draft
     statement = select(Startup).where(
-        Startup.founder_id == founder_id, not Startup.is_published
+        Startup.founder_id == founder_id, ~col(Startup.is_published)
     )
+    if summary:
+        statement = _summary_only(statement)
     results = db.exec(statement).all()
     return results
 
@@ -221,6 +349,9 @@ def update_startup_publication_status(
     db.add(db_startup)
     db.commit()
     db.refresh(db_startup)
+    recommendation_cache.invalidate_startup(startup_id)
+    startup_index.sync(db_startup)
+    suggest_index.sync_startup(db_startup)
     return db_startup
 
 
@@ -239,7 +370,7 @@ def get_startups_by_industry(db: Session, industry: str) -> Sequence[Startup]:
 
 
 """
-    Get all startups by location
+    Get all startups by location (case-insensitive)
     @param db: Session
     @param location: str
     @return Sequence[Startup]
@@ -247,7 +378,9 @@ def get_startups_by_industry(db: Session, industry: str) -> Sequence[Startup]:
 
 
 def get_startups_by_location(db: Session, location: str) -> Sequence[Startup]:
-    statement = select(Startup).where(Startup.location == location)
+    statement = select(Startup).where(
+        func.lower(Startup.location) == location.lower()
+    )
     results = db.exec(statement).all()
     return results
 
@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.routing import APIRoute
+from sqlmodel import Session
 
 # endpoints
 from app.api.main import api_router
@@ -11,9 +12,13 @@ from app.backend_pre_start import main as backend_pre_start
 from app.core.config import settings
 from app.core.db import (
     close_async_database,
+    engine,
     init_async_database,
     test_database_connection,
 )
+from app.core.image_processing import image_processor
+from app.services.recommendation_engine import recommendation_engine
+from app.services.suggest import suggest_index
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -33,10 +38,17 @@ async def lifespan(app: FastAPI):
     # Test database connection
     await test_database_connection()
 
+    # Build the typeahead index before serving requests
+    if engine is not None:
+        with Session(engine) as session:
+            suggest_index.load(session)
+
     yield
 
     # Shutdown
     await close_async_database()
+    recommendation_engine.scoring_executor.shutdown(wait=False)
+    image_processor.shutdown()
 
 
 # Create FastAPI application
@@ -56,6 +68,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Keyset cursor of startup listings
 )
 
 
@@ -0,0 +1,65 @@
+"""investor jsonb gin
+
+Revision ID: 4f1e8a2c6b93
+Revises: d7b5850ad2b2
+Create Date: 2026-10-18 13:21:08.640115
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "4f1e8a2c6b93"
+down_revision: Union[str, None] = "d7b5850ad2b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSONB_COLUMNS = ("investment_focus", "preferred_stages")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # JSONB and GIN indexes only exist on PostgreSQL; other databases keep JSON
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in JSONB_COLUMNS:
+        op.alter_column(
+            "investorprofile",
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::jsonb",
+        )
+        op.create_index(
+            op.f(f"ix_investorprofile_{column}"),
+            "investorprofile",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in JSONB_COLUMNS:
+        op.drop_index(
+            op.f(f"ix_investorprofile_{column}"), table_name="investorprofile"
+        )
+        op.alter_column(
+            "investorprofile",
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,57 @@
+"""startup listing indexes
+
+Revision ID: 5d2c7e9a1f04
+Revises: b83d0c5e91a7
+Create Date: 2026-10-18 15:10:42.118305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2c7e9a1f04"
+down_revision: Union[str, None] = "b83d0c5e91a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Listing filters of app.crud.startup.get_startups, each ending in the
+# (name, id) keyset order
+LISTING_INDEXES = (
+    ("ix_startup_is_published_name_id", ["is_published", "name", "id"]),
+    (
+        "ix_startup_industry_is_published_name_id",
+        ["industry", "is_published", "name", "id"],
+    ),
+    (
+        "ix_startup_funding_stage_is_published_name_id",
+        ["funding_stage", "is_published", "name", "id"],
+    ),
+    (
+        "ix_startup_location_lower",
+        [sa.text("lower(location)"), "is_published", "name", "id"],
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index_name, columns in LISTING_INDEXES:
+        op.create_index(index_name, "startup", columns, unique=False)
+    op.create_index(
+        op.f("ix_startup_founder_id"), "startup", ["founder_id"], unique=False
+    )
+    # Superseded by the leading column of ix_startup_is_published_name_id
+    op.drop_index(op.f("ix_startup_is_published"), table_name="startup")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_startup_is_published"), "startup", ["is_published"], unique=False
+    )
+    op.drop_index(op.f("ix_startup_founder_id"), table_name="startup")
+    for index_name, _ in reversed(LISTING_INDEXES):
+        op.drop_index(index_name, table_name="startup")
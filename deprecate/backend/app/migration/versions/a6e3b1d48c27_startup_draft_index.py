@@ -0,0 +1,37 @@
+"""startup draft index
+
+Revision ID: a6e3b1d48c27
+Revises: 5d2c7e9a1f04
+Create Date: 2026-10-18 15:48:19.502733
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a6e3b1d48c27"
+down_revision: Union[str, None] = "5d2c7e9a1f04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial index over drafts only; the predicate matches how the drafts
+    # query's NOT is_published compiles on each database
+    op.create_index(
+        "ix_startup_founder_id_draft",
+        "startup",
+        ["founder_id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_published"),
+        sqlite_where=sa.text("is_published = 0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_startup_founder_id_draft", table_name="startup")
@@ -0,0 +1,51 @@
+"""investor search trigram
+
+Revision ID: b83d0c5e91a7
+Revises: 4f1e8a2c6b93
+Create Date: 2026-10-18 14:02:51.337420
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b83d0c5e91a7"
+down_revision: Union[str, None] = "4f1e8a2c6b93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column) searched with ILIKE '%term%'
+TRIGRAM_INDEXES = (
+    ("ix_user_full_name_trgm", "user", "full_name"),
+    ("ix_investorprofile_firm_name_trgm", "investorprofile", "firm_name"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm is PostgreSQL-only; other databases use the in-process index
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table_name, column in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # The extension is left installed; other objects may depend on it
+    for index_name, table_name, _ in TRIGRAM_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,76 @@
+"""location regions
+
+Revision ID: d7b5850ad2b2
+Revises: 9c557bb8aad7
+Create Date: 2026-10-18 11:02:37.514208
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+from app.services.geo import geocode
+
+# revision identifiers, used by Alembic.
+revision: str = "d7b5850ad2b2"
+down_revision: Union[str, None] = "9c557bb8aad7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GEOCODED_TABLES = ("startup", "investorprofile")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in GEOCODED_TABLES:
+        op.add_column(
+            table_name,
+            sa.Column("region", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        )
+        op.add_column(table_name, sa.Column("latitude", sa.Float(), nullable=True))
+        op.add_column(table_name, sa.Column("longitude", sa.Float(), nullable=True))
+        op.create_index(
+            op.f(f"ix_{table_name}_region"), table_name, ["region"], unique=False
+        )
+
+    # Backfill existing rows with the bundled gazetteer
+    connection = op.get_bind()
+    for table_name in GEOCODED_TABLES:
+        table = sa.table(
+            table_name,
+            sa.column("id", sa.Uuid()),
+            sa.column("location", sa.String()),
+            sa.column("region", sa.String()),
+            sa.column("latitude", sa.Float()),
+            sa.column("longitude", sa.Float()),
+        )
+        rows = connection.execute(
+            sa.select(table.c.id, table.c.location).where(
+                table.c.location.is_not(None)
+            )
+        ).all()
+        for row_id, location in rows:
+            region = geocode(location)
+            if region is None:
+                continue
+            connection.execute(
+                table.update()
+                .where(table.c.id == row_id)
+                .values(
+                    region=region.id,
+                    latitude=region.latitude,
+                    longitude=region.longitude,
+                )
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in GEOCODED_TABLES:
+        op.drop_index(op.f(f"ix_{table_name}_region"), table_name=table_name)
+        op.drop_column(table_name, "longitude")
+        op.drop_column(table_name, "latitude")
+        op.drop_column(table_name, "region")
@@ -2,12 +2,14 @@
 
 from sqlmodel import SQLModel
 
+from app.models.bulk_import import BulkImportJob, BulkImportJobStatus
 from app.models.investor import (
     InvestorProfile,
     InvestorProfileCreate,
     InvestorProfileRead,
     InvestorProfileUpdate,
 )
+from app.models.match import MatchRun, MatchRunStatus, StartupInvestorMatch
 from app.models.pitch import (
     PitchDeck,
     PitchDeckCreate,
@@ -33,6 +35,11 @@ __all__ = [
     "InvestorProfileCreate",
     "InvestorProfileRead",
     "InvestorProfileUpdate",
+    "BulkImportJob",
+    "BulkImportJobStatus",
+    "MatchRun",
+    "MatchRunStatus",
+    "StartupInvestorMatch",
     "PitchDeck",
     "PitchDeckCreate",
     "PitchDeckRead",
@@ -0,0 +1,42 @@
+"""
+Bulk import jobs.
+
+Admin imports that run in the background (investor bulk import) record their
+progress here after every batch, so clients can poll a job by id from any
+worker (GET /admin/imports/{job_id}).
+"""
+
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+from sqlalchemy import JSON, Column
+from sqlmodel import Field, SQLModel
+
+
+class BulkImportJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class BulkImportJob(SQLModel, table=True):
+    """One bulk import and its progress so far."""
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    kind: str  # What is imported, e.g. "investors"
+    filename: Optional[str] = None
+    status: BulkImportJobStatus = Field(
+        default=BulkImportJobStatus.PENDING, index=True
+    )
+    total_rows: int = 0
+    created: int = 0
+    skipped: int = 0
+    error_count: int = 0
+    # Row errors, up to BULK_IMPORT_MAX_ERRORS
+    errors: List[str] = Field(default_factory=list, sa_column=Column(JSON))
+    detail: Optional[str] = None  # Why a failed job stopped
+    started_at: datetime = Field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = None
@@ -1,12 +1,21 @@
 import uuid
+from enum import Enum
 from typing import List, Optional
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.models.startup import FundingStage, Industry
 
 
+class InvestorCountMode(str, Enum):
+    """How investor listings compute their total."""
+
+    EXACT = "exact"  # SELECT COUNT(*)
+    ESTIMATED = "estimated"  # Query planner row estimate (PostgreSQL)
+
+
 class InvestorProfileBase(SQLModel):
     firm_name: str = Field(index=True)
     bio: Optional[str] = None
@@ -14,18 +23,46 @@ class InvestorProfileBase(SQLModel):
     location: Optional[str] = None
     linkedin_url: Optional[str] = None
     twitter_url: Optional[str] = None
+    # JSONB on PostgreSQL so containment (@>) filters can use GIN indexes
     investment_focus: Optional[List[Industry]] = Field(
-        default=None, sa_column=Column(JSON)
+        default=None, sa_column=Column(JSON().with_variant(JSONB(), "postgresql"))
     )
     preferred_stages: Optional[List[FundingStage]] = Field(
-        default=None, sa_column=Column(JSON)
+        default=None, sa_column=Column(JSON().with_variant(JSONB(), "postgresql"))
     )
 
 
 class InvestorProfile(InvestorProfileBase, table=True):
+    __table_args__ = (
+        Index(
+            "ix_investorprofile_investment_focus",
+            "investment_focus",
+            postgresql_using="gin",
+            postgresql_ops={"investment_focus": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_investorprofile_preferred_stages",
+            "preferred_stages",
+            postgresql_using="gin",
+            postgresql_ops={"preferred_stages": "jsonb_path_ops"},
+        ),
+        # Substring search (app.services.investor_search); needs pg_trgm
+        Index(
+            "ix_investorprofile_firm_name_trgm",
+            "firm_name",
+            postgresql_using="gin",
+            postgresql_ops={"firm_name": "gin_trgm_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="user.id", unique=True)
 
+    # Canonical location, derived from `location` on write (app.services.geo)
+    region: Optional[str] = Field(default=None, index=True)
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
     # Relationship to User
     user: "User" = Relationship(back_populates="investor_profile")  # type: ignore # noqa: F821
 
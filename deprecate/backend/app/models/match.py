@@ -0,0 +1,53 @@
+"""
+Precomputed startup-investor matches.
+
+Written by the offline match job (app/scripts/precompute_matches.py) and read
+by features that need every startup's best investors at once, such as the
+nightly "new matches" digest.
+"""
+
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class MatchRunStatus(str, Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    ABANDONED = "abandoned"
+
+
+class MatchRun(SQLModel, table=True):
+    """One execution of the match job, also used as its checkpoint."""
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    status: MatchRunStatus = Field(default=MatchRunStatus.RUNNING, index=True)
+    algorithm_version: str
+    top_n: int
+    min_score: float
+    # Startups are processed in id order; everything up to this id is saved
+    last_startup_id: Optional[uuid.UUID] = None
+    startups_processed: int = 0
+    matches_written: int = 0
+    started_at: datetime = Field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = None
+
+
+class StartupInvestorMatch(SQLModel, table=True):
+    """A single top-N investor for a startup within a match run."""
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    run_id: uuid.UUID = Field(
+        foreign_key="matchrun.id", index=True, ondelete="CASCADE"
+    )
+    startup_id: uuid.UUID = Field(
+        foreign_key="startup.id", index=True, ondelete="CASCADE"
+    )
+    investor_id: uuid.UUID = Field(
+        foreign_key="investorprofile.id", index=True, ondelete="CASCADE"
+    )
+    rank: int  # 1 = best match
+    score: float  # 0.0 to 100.0
@@ -61,3 +61,23 @@ class StartupProfile(SQLModel):
     description: str
     business_model: Optional[str] = None
     target_market: Optional[str] = None
+    region: Optional[str] = None  # Gazetteer region id
+
+
+class StartupRecommendation(SQLModel):
+    """A single startup recommendation for an investor."""
+
+    startup: StartupProfile
+    score: float  # Overall recommendation score (0.0 to 100.0)
+    confidence: str  # "high", "medium", "low"
+    reasons: List[RecommendationReason]
+    match_percentage: int  # Percentage match (0-100)
+
+
+class StartupRecommendationResponse(SQLModel):
+    """Startup recommendations for an investor with metadata."""
+
+    recommendations: List[StartupRecommendation]
+    total_startups_analyzed: int
+    generated_at: str  # ISO timestamp
+    algorithm_version: str = "1.0"
@@ -4,7 +4,7 @@ import uuid
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import field_validator
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -127,9 +127,50 @@ class StartupBase(SQLModel):
 
 
 class Startup(StartupBase, table=True):
+    __table_args__ = (
+        # Listing filters (app.crud.startup.get_startups). Each index ends with
+        # the (name, id) keyset order, so a filtered page is one range scan.
+        Index("ix_startup_is_published_name_id", "is_published", "name", "id"),
+        Index(
+            "ix_startup_industry_is_published_name_id",
+            "industry",
+            "is_published",
+            "name",
+            "id",
+        ),
+        Index(
+            "ix_startup_funding_stage_is_published_name_id",
+            "funding_stage",
+            "is_published",
+            "name",
+            "id",
+        ),
+        # Location filters compare lower(location)
+        Index(
+            "ix_startup_location_lower",
+            text("lower(location)"),
+            "is_published",
+            "name",
+            "id",
+        ),
+        # A founder's drafts (get_draft_startups_by_founder); the predicate
+        # matches how NOT is_published compiles on each database
+        Index(
+            "ix_startup_founder_id_draft",
+            "founder_id",
+            postgresql_where=text("NOT is_published"),
+            sqlite_where=text("is_published = 0"),
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    founder_id: uuid.UUID = Field(foreign_key="user.id")
-    is_published: bool = Field(default=False, index=True)
+    founder_id: uuid.UUID = Field(foreign_key="user.id", index=True)
+    is_published: bool = Field(default=False)
+
+    # Canonical location, derived from `location` on write (app.services.geo)
+    region: Optional[str] = Field(default=None, index=True)
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
     # JSON fields stored with SQLAlchemy JSON type
     team_members: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
@@ -221,6 +262,24 @@ class StartupRead(StartupBase):
     timeline: Optional[Dict[str, Any]] = None
 
 
+class StartupSummary(SQLModel):
+    """Card fields for startup listings; the JSON profile sections are left out."""
+
+    id: uuid.UUID
+    founder_id: uuid.UUID
+    name: str
+    description: str
+    industry: Industry
+    location: str
+    funding_stage: FundingStage
+    funding_goal: Optional[float] = None
+    founded_year: Optional[str] = None
+    team_size: Optional[int] = None
+    website: Optional[str] = None
+    logo_url: Optional[str] = None
+    is_published: bool
+
+
 class StartupUpdate(SQLModel):
     name: Optional[str] = None
     description: Optional[str] = None
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Recommendation Ranking Benchmark
+
+Compares the original "score everything, sort, slice" ranking with the bounded
+heap + early-exit ranker and the vectorized batch ranker on synthetic investor
+populations. No database is needed.
+
+Usage:
+    python -m app.scripts.benchmark_ranking
+    python -m app.scripts.benchmark_ranking --sizes 10000 100000 --repeat 3
+"""
+
+import argparse
+import random
+import time
+import uuid
+from typing import Callable, List
+
+from app.models.recommendation import InvestorRecommendation, StartupProfile
+from app.models.startup import FundingStage, Industry
+from app.services.features import InvestorFeatureMatrix
+from app.services.geo import geocode
+from app.services.investor_index import InvestorRecord
+from app.services.recommendation_engine import RecommendationEngine
+
+SAMPLE_LOCATIONS = [
+    "San Francisco, CA",
+    "New York, NY",
+    "Austin, TX",
+    "Boston, MA",
+    "Seattle, WA",
+    "London, UK",
+    "Berlin, Germany",
+    "Lagos, Nigeria",
+    "Accra, Ghana",
+    "Palo Alto, CA",
+    "Kumasi, Ghana",
+    None,
+]
+
+
+def generate_investors(count: int, seed: int = 42) -> List[InvestorRecord]:
+    """Generate synthetic investor records with realistic focus/stage spreads."""
+    rng = random.Random(seed)
+    industries = list(Industry)
+    stages = list(FundingStage)
+
+    investors = []
+    for i in range(count):
+        location = rng.choice(SAMPLE_LOCATIONS)
+        region = geocode(location)
+        investors.append(
+            InvestorRecord(
+                id=uuid.UUID(int=rng.getrandbits(128)),
+                user_id=uuid.UUID(int=rng.getrandbits(128)),
+                name=f"Investor {i}",
+                email=f"investor{i}@example.com",
+                firm_name=f"Firm {i}",
+                location=location,
+                investment_focus=[
+                    industry.value
+                    for industry in rng.sample(industries, rng.randint(1, 3))
+                ],
+                preferred_stages=[
+                    stage.value for stage in rng.sample(stages, rng.randint(0, 3))
+                ],
+                region=region.id if region else None,
+            )
+        )
+    return investors
+
+
+def generate_startup(seed: int = 42) -> StartupProfile:
+    """Generate a synthetic, fully completed startup profile."""
+    rng = random.Random(seed)
+    return StartupProfile(
+        id=uuid.UUID(int=rng.getrandbits(128)),
+        founder_id=uuid.UUID(int=rng.getrandbits(128)),
+        name="Benchmark Startup",
+        industry=Industry.FINTECH,
+        funding_stage=FundingStage.SEED,
+        location="San Francisco, CA",
+        funding_goal=1_000_000,
+        description="Synthetic startup used for benchmarking",
+        business_model="B2B SaaS",
+        target_market="SMBs",
+        region="sf_bay_area",
+    )
+
+
+def rank_with_full_sort(
+    engine: RecommendationEngine,
+    startup: StartupProfile,
+    investors: List[InvestorRecord],
+    max_results: int,
+    min_score: float,
+) -> List[InvestorRecommendation]:
+    """The original ranking: build every recommendation, sort all, slice."""
+    scored_recommendations = []
+    for investor in investors:
+        score, reasons = engine._calculate_investor_score(startup, investor)
+        if score >= min_score:
+            scored_recommendations.append(
+                engine._create_recommendation(investor, score, reasons)
+            )
+
+    scored_recommendations.sort(key=lambda x: x.score, reverse=True)
+    return scored_recommendations[:max_results]
+
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    """Return the best wall-clock time in seconds over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(
+    sizes: List[int], repeat: int, max_results: int, min_score: float
+) -> List[dict]:
+    """Time each ranking strategy at each population size."""
+    engine = RecommendationEngine()
+    startup = generate_startup()
+    results = []
+
+    for size in sizes:
+        print(f"⏱  Benchmarking {size:,} investors...")
+        investors = generate_investors(size)
+        features = InvestorFeatureMatrix(investors)
+
+        full_sort = time_call(
+            lambda: rank_with_full_sort(
+                engine, startup, investors, max_results, min_score
+            ),
+            repeat,
+        )
+        heap = time_call(
+            lambda: engine._rank_investors(startup, investors, max_results, min_score),
+            repeat,
+        )
+        batch = time_call(
+            lambda: engine._rank_investors_batch(
+                startup, features, max_results, min_score
+            ),
+            repeat,
+        )
+
+        results.append(
+            {"size": size, "full_sort": full_sort, "heap": heap, "batch": batch}
+        )
+
+    return results
+
+
+def main():
+    """Main function for command-line usage."""
+    parser = argparse.ArgumentParser(description="Benchmark recommendation ranking")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Investor population sizes to benchmark",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per measurement")
+    parser.add_argument("--max-results", type=int, default=10)
+    parser.add_argument("--min-score", type=float, default=30.0)
+
+    args = parser.parse_args()
+    results = run_benchmark(args.sizes, args.repeat, args.max_results, args.min_score)
+
+    print("\n" + "=" * 72)
+    print(f"📊 RANKING BENCHMARK (best of {args.repeat} run(s), k={args.max_results})")
+    print("=" * 72)
+    print(
+        f"{'investors':>10} {'full sort':>11} {'heap+prune':>11} {'speedup':>8}"
+        f" {'batch':>9} {'speedup':>8}"
+    )
+    for row in results:
+        print(
+            f"{row['size']:>10,} {row['full_sort']:>10.3f}s {row['heap']:>10.3f}s"
+            f" {row['full_sort'] / row['heap']:>7.1f}x {row['batch']:>8.3f}s"
+            f" {row['full_sort'] / row['batch']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
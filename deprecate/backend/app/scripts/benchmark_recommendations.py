@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""
+Recommendation Engine Benchmark and Regression Suite
+
+Generates synthetic startup and investor populations (spread over the
+Industry/FundingStage enums and the sample locations) at several scales and
+measures the recommendation engine:
+
+- End to end: get_recommendations_for_founder against an in-memory SQLite
+  database, with a cold investor index, a warm index and a cached response
+- Per scorer: every scalar scorer over the whole population, the batch scorers
+  and the rankers
+- Allocations: peak traced memory (tracemalloc) of every measurement
+- Regression: the optimized rankings (batch founder ranking, reverse startup
+  ranking, end-to-end batch path) must equal the per-record reference
+  implementation; any mismatch makes the script exit with status 1
+
+The report is JSON with sorted keys, so reports from two commits can be diffed
+directly or compared with --compare.
+
+Usage:
+    python -m app.scripts.benchmark_recommendations
+    python -m app.scripts.benchmark_recommendations --sizes 1000 10000 --repeat 5
+    python -m app.scripts.benchmark_recommendations --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models import InvestorProfile, Startup, User, UserRole
+from app.models.recommendation import StartupProfile
+from app.models.startup import FundingStage, Industry
+from app.scripts.benchmark_ranking import SAMPLE_LOCATIONS, generate_investors
+from app.services.features import InvestorFeatureMatrix, StartupFeatureMatrix
+from app.services.geo import geocode
+from app.services.investor_index import InvestorRecord, investor_index
+from app.services.recommendation_cache import recommendation_cache
+from app.services.recommendation_engine import RecommendationEngine
+
+# (max_results, min_score) combinations checked against the reference ranking
+PARITY_CASES = [(1, 0.0), (10, 30.0), (50, 0.0), (10, 60.0)]
+
+SAMPLE_FUNDING_GOALS = [None, 50_000, 500_000, 1_000_000, 5_000_000, 25_000_000]
+
+
+def generate_startups(count: int, seed: int = 7) -> List[StartupProfile]:
+    """Generate synthetic startup profiles with varied completeness."""
+    rng = random.Random(seed)
+    industries = list(Industry)
+    stages = list(FundingStage)
+
+    startups = []
+    for i in range(count):
+        location = rng.choice(SAMPLE_LOCATIONS) or ""
+        region = geocode(location)
+        startups.append(
+            StartupProfile(
+                id=uuid.UUID(int=rng.getrandbits(128)),
+                founder_id=uuid.UUID(int=rng.getrandbits(128)),
+                name=f"Startup {i}",
+                industry=rng.choice(industries),
+                funding_stage=rng.choice(stages),
+                location=location,
+                funding_goal=rng.choice(SAMPLE_FUNDING_GOALS),
+                description=rng.choice(["Synthetic startup", ""]),
+                business_model=rng.choice([None, "B2B SaaS"]),
+                target_market=rng.choice([None, "SMBs"]),
+                region=region.id if region else None,
+            )
+        )
+    return startups
+
+
+def create_benchmark_database(
+    startup: StartupProfile, investors: List[InvestorRecord]
+) -> Tuple[Any, uuid.UUID]:
+    """
+    Load one founder startup and every investor into in-memory SQLite.
+
+    Returns:
+        (engine, founder user id)
+    """
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.exec(
+            insert(User),
+            params=[
+                {
+                    "id": investor.user_id,
+                    "full_name": investor.name,
+                    "email": investor.email,
+                    "role": UserRole.INVESTOR,
+                    "is_active": True,
+                    "is_verified": True,
+                    "hashed_password": "benchmark",
+                }
+                for investor in investors
+            ],
+        )
+        session.exec(
+            insert(InvestorProfile),
+            params=[
+                {
+                    "id": investor.id,
+                    "user_id": investor.user_id,
+                    "firm_name": investor.firm_name,
+                    "location": investor.location,
+                    "investment_focus": investor.investment_focus,
+                    "preferred_stages": investor.preferred_stages,
+                    "region": investor.region,
+                }
+                for investor in investors
+            ],
+        )
+
+        founder = User(
+            id=startup.founder_id,
+            full_name="Benchmark Founder",
+            email="founder@example.com",
+            role=UserRole.FOUNDER,
+            hashed_password="benchmark",
+        )
+        session.add(founder)
+        session.add(
+            Startup(
+                id=startup.id,
+                founder_id=founder.id,
+                name=startup.name,
+                description=startup.description,
+                industry=startup.industry,
+                location=startup.location or "",
+                funding_stage=startup.funding_stage,
+                funding_goal=startup.funding_goal,
+                business_model=startup.business_model,
+                target_market=startup.target_market,
+                region=startup.region,
+                is_published=True,
+            )
+        )
+        session.commit()
+
+    return engine, startup.founder_id
+
+
+def measure(
+    func: Callable[[], object],
+    repeat: int,
+    setup: Optional[Callable[[], object]] = None,
+) -> Dict[str, float]:
+    """
+    Time `func` over `repeat` runs and trace the allocations of one more run.
+
+    `setup` runs before every call and is not measured.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    # Separate run: tracing slows allocations down and would skew the timings
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "best_s": min(timings),
+        "mean_s": statistics.fmean(timings),
+        "peak_bytes": peak,
+    }
+
+
+def benchmark_end_to_end(
+    engine: RecommendationEngine,
+    startup: StartupProfile,
+    investors: List[InvestorRecord],
+    repeat: int,
+    max_results: int,
+    min_score: float,
+) -> Tuple[Dict[str, Dict[str, float]], int]:
+    """
+    Time get_recommendations_for_founder through a real session.
+
+    Returns:
+        (timings per scenario, ranking mismatches between batch and reference)
+    """
+    db_engine, founder_id = create_benchmark_database(startup, investors)
+
+    with Session(db_engine) as session:
+
+        def recommend():
+            return engine.get_recommendations_for_founder(
+                session, founder_id, max_results, min_score
+            )
+
+        def cold():
+            investor_index.invalidate()
+            recommendation_cache.clear()
+
+        def warm():
+            investor_index.refresh_if_stale(session)
+            recommendation_cache.clear()
+
+        results = {
+            "cold_index": measure(recommend, repeat, setup=cold),
+            "warm_index": measure(recommend, repeat, setup=warm),
+        }
+        recommend()
+        results["cached"] = measure(recommend, repeat)
+
+        # The batch path must return what the reference per-investor path does
+        warm()
+        batch = recommend()
+        engine.batch_scoring = False
+        try:
+            warm()
+            reference = recommend()
+        finally:
+            engine.batch_scoring = True
+        mismatches = int(
+            recommendation_keys(batch.recommendations)
+            != recommendation_keys(reference.recommendations)
+        )
+
+    investor_index.invalidate()
+    recommendation_cache.clear()
+    db_engine.dispose()
+    return results, mismatches
+
+
+def benchmark_scorers(
+    engine: RecommendationEngine,
+    startup: StartupProfile,
+    investors: List[InvestorRecord],
+    features: InvestorFeatureMatrix,
+    startups: StartupFeatureMatrix,
+    repeat: int,
+    max_results: int,
+    min_score: float,
+) -> Dict[str, Dict[str, float]]:
+    """Time each scorer over the whole population."""
+
+    def each_investor(scorer: Callable[[StartupProfile, InvestorRecord], Any]):
+        return lambda: [scorer(startup, investor) for investor in investors]
+
+    investor = investors[0]
+    return {
+        # Scalar scorers, called once per investor
+        "industry_match": measure(
+            each_investor(engine._score_industry_match), repeat
+        ),
+        "stage_match": measure(each_investor(engine._score_stage_match), repeat),
+        "location_match": measure(
+            each_investor(engine._score_location_match), repeat
+        ),
+        "funding_compatibility": measure(
+            each_investor(engine._score_funding_compatibility), repeat
+        ),
+        "investor_score": measure(
+            each_investor(engine._calculate_investor_score), repeat
+        ),
+        # Batch scorers
+        "feature_matrix_build": measure(
+            lambda: InvestorFeatureMatrix(investors), repeat
+        ),
+        "alignment_batch": measure(
+            lambda: engine._score_alignment_batch(startup, features), repeat
+        ),
+        "location_batch": measure(
+            lambda: engine._score_location_batch(startup, features), repeat
+        ),
+        "investors_batch": measure(
+            lambda: engine._score_investors_batch(startup, features), repeat
+        ),
+        "startups_batch": measure(
+            lambda: engine._score_startups_batch(investor, startups), repeat
+        ),
+        # Rankers
+        "rank_investors_reference": measure(
+            lambda: engine._rank_investors(
+                startup, investors, max_results, min_score
+            ),
+            repeat,
+        ),
+        "rank_investors_batch": measure(
+            lambda: engine._rank_investors_batch(
+                startup, features, max_results, min_score
+            ),
+            repeat,
+        ),
+        "rank_startups_batch": measure(
+            lambda: engine._rank_startups_batch(
+                investor, startups, max_results, min_score
+            ),
+            repeat,
+        ),
+    }
+
+
+def recommendation_keys(recommendations: List[Any]) -> List[Tuple]:
+    """Comparable view of a ranking: who, in which order, with which score."""
+    keys = []
+    for recommendation in recommendations:
+        record = getattr(recommendation, "investor", None) or recommendation.startup
+        keys.append(
+            (
+                record.id,
+                recommendation.score,
+                tuple(reason.description for reason in recommendation.reasons),
+            )
+        )
+    return keys
+
+
+def reference_rank_startups(
+    engine: RecommendationEngine,
+    investor: InvestorRecord,
+    startups: List[StartupProfile],
+    max_results: int,
+    min_score: float,
+) -> List[Tuple[uuid.UUID, float]]:
+    """Score startups one by one and sort; ties keep population order."""
+    scored = []
+    for startup in startups:
+        score, _ = engine._calculate_investor_score(startup, investor)
+        if score >= min_score:
+            scored.append((startup.id, round(score, 2)))
+
+    scored.sort(key=lambda entry: entry[1], reverse=True)
+    return scored[:max_results]
+
+
+def check_parity(
+    engine: RecommendationEngine,
+    startups: List[StartupProfile],
+    investors: List[InvestorRecord],
+    features: InvestorFeatureMatrix,
+    startup_features: StartupFeatureMatrix,
+    samples: int,
+) -> Dict[str, int]:
+    """Compare optimized rankings with the reference implementation."""
+    founder_mismatches = 0
+    for startup in startups[:samples]:
+        for max_results, min_score in PARITY_CASES:
+            batch = engine._rank_investors_batch(
+                startup, features, max_results, min_score
+            )
+            reference = engine._rank_investors(
+                startup, investors, max_results, min_score
+            )
+            if recommendation_keys(batch) != recommendation_keys(reference):
+                founder_mismatches += 1
+
+    reverse_mismatches = 0
+    for investor in investors[: max(1, samples // 4)]:
+        for max_results, min_score in PARITY_CASES:
+            batch = [
+                (recommendation.startup.id, recommendation.score)
+                for recommendation in engine._rank_startups_batch(
+                    investor, startup_features, max_results, min_score
+                )
+            ]
+            reference = reference_rank_startups(
+                engine, investor, startups, max_results, min_score
+            )
+            if batch != reference:
+                reverse_mismatches += 1
+
+    return {
+        "founder_rankings_checked": min(samples, len(startups)) * len(PARITY_CASES),
+        "founder_mismatches": founder_mismatches,
+        "reverse_rankings_checked": min(max(1, samples // 4), len(investors))
+        * len(PARITY_CASES),
+        "reverse_mismatches": reverse_mismatches,
+    }
+
+
+def run_suite(
+    sizes: List[int],
+    repeat: int,
+    max_results: int,
+    min_score: float,
+    parity_samples: int,
+) -> Dict[str, Any]:
+    """Run every benchmark and parity check at each population size."""
+    engine = RecommendationEngine()
+    scales = {}
+
+    for size in sizes:
+        print(f"⏱  Benchmarking {size:,} investors / {size:,} startups...")
+        investors = generate_investors(size)
+        startups = generate_startups(size)
+        features = InvestorFeatureMatrix(investors)
+        startup_features = StartupFeatureMatrix(startups)
+        startup = startups[0]
+
+        end_to_end, end_to_end_mismatches = benchmark_end_to_end(
+            engine, startup, investors, repeat, max_results, min_score
+        )
+        scorers = benchmark_scorers(
+            engine,
+            startup,
+            investors,
+            features,
+            startup_features,
+            repeat,
+            max_results,
+            min_score,
+        )
+
+        print("   🔍 Checking rankings against the reference implementation...")
+        parity = check_parity(
+            engine, startups, investors, features, startup_features, parity_samples
+        )
+        parity["end_to_end_mismatches"] = end_to_end_mismatches
+
+        scales[str(size)] = {
+            "investors": size,
+            "startups": size,
+            "end_to_end": end_to_end,
+            "scorers": scorers,
+            "parity": parity,
+        }
+
+    return {
+        "generated_at": datetime.utcnow().isoformat(),
+        "environment": {
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "algorithm_version": engine.algorithm_version,
+        },
+        "parameters": {
+            "sizes": sizes,
+            "repeat": repeat,
+            "max_results": max_results,
+            "min_score": min_score,
+            "parity_samples": parity_samples,
+        },
+        "scales": scales,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current commit hash, if the suite runs inside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def total_mismatches(report: Dict[str, Any]) -> int:
+    return sum(
+        count
+        for scale in report["scales"].values()
+        for key, count in scale["parity"].items()
+        if key.endswith("mismatches")
+    )
+
+
+def flatten_metrics(report: Dict[str, Any]) -> Dict[str, float]:
+    """Map "size/section/name/metric" to value for best_s and peak_bytes."""
+    metrics = {}
+    for size, scale in report["scales"].items():
+        for section in ("end_to_end", "scorers"):
+            for name, values in scale[section].items():
+                for metric in ("best_s", "peak_bytes"):
+                    metrics[f"{size}/{section}/{name}/{metric}"] = values[metric]
+    return metrics
+
+
+def print_summary(report: Dict[str, Any]) -> None:
+    print("\n" + "=" * 72)
+    print(
+        f"📊 RECOMMENDATION BENCHMARK (best of {report['parameters']['repeat']} run(s))"
+    )
+    print("=" * 72)
+    for size, scale in report["scales"].items():
+        print(f"\n{int(size):,} investors / startups")
+        for section in ("end_to_end", "scorers"):
+            for name, values in scale[section].items():
+                print(
+                    f"  {name:<26} {values['best_s'] * 1000:>10.2f} ms"
+                    f" {values['peak_bytes'] / 1024:>12,.0f} KiB"
+                )
+        parity = scale["parity"]
+        print(
+            f"  parity: {parity['founder_mismatches']} founder,"
+            f" {parity['reverse_mismatches']} reverse,"
+            f" {parity['end_to_end_mismatches']} end-to-end mismatches"
+        )
+
+
+def print_comparison(baseline: Dict[str, Any], report: Dict[str, Any]) -> None:
+    """Print every metric present in both reports with its relative change."""
+    before = flatten_metrics(baseline)
+    after = flatten_metrics(report)
+
+    print("\n" + "=" * 72)
+    print(
+        f"🔀 COMPARISON {baseline['environment'].get('git_commit') or 'baseline'}"
+        f" -> {report['environment'].get('git_commit') or 'current'}"
+    )
+    print("=" * 72)
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        change = (new - old) / old * 100 if old else 0.0
+        print(f"  {key:<56} {change:>+8.1f}%")
+
+
+def main():
+    """Main function for command-line usage."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the recommendation engine and check ranking parity"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 50_000],
+        help="Investor and startup population sizes",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--max-results", type=int, default=10)
+    parser.add_argument("--min-score", type=float, default=30.0)
+    parser.add_argument(
+        "--parity-samples",
+        type=int,
+        default=10,
+        help="Startups ranked against the reference implementation per size",
+    )
+    parser.add_argument(
+        "--output",
+        default="recommendation_benchmark.json",
+        help="Path of the JSON report",
+    )
+    parser.add_argument("--compare", help="Earlier JSON report to compare against")
+
+    args = parser.parse_args()
+    report = run_suite(
+        args.sizes,
+        args.repeat,
+        args.max_results,
+        args.min_score,
+        args.parity_samples,
+    )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, default=str)
+        f.write("\n")
+
+    print_summary(report)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print_comparison(json.load(f), report)
+
+    print(f"\n📝 Report written to {args.output}")
+
+    mismatches = total_mismatches(report)
+    if mismatches:
+        print(f"❌ {mismatches} ranking(s) differ from the reference implementation")
+        sys.exit(1)
+    print("✅ Optimized rankings match the reference implementation")
+
+
+if __name__ == "__main__":
+    main()
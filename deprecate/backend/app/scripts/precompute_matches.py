@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Startup-Investor Match Precompute Job
+
+Scores every published startup against every investor and stores the top-N
+investors per startup in the startupinvestormatch table, e.g. for the nightly
+"new matches" digest.
+
+Startups are read in id order and split into shards that are scored in a
+process pool. Each worker receives the investor feature matrix once, when it
+starts, and scores its shards with the vectorized ranker. The parent process
+bulk-inserts the results shard by shard, in order, and commits the run's
+checkpoint (last_startup_id) in the same transaction, so an interrupted run
+resumes after the last saved shard.
+
+Usage:
+    python -m app.scripts.precompute_matches
+    python -m app.scripts.precompute_matches --workers 8 --shard-size 1000 --top-n 50
+    python -m app.scripts.precompute_matches --restart
+"""
+
+import argparse
+import os
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, insert
+from sqlmodel import Session, select
+
+from app.models.match import MatchRun, MatchRunStatus, StartupInvestorMatch
+from app.models.recommendation import StartupProfile
+from app.models.startup import Startup
+from app.scripts.seed_investors import create_database_engine
+from app.services.features import InvestorFeatureMatrix
+from app.services.investor_index import investor_index
+from app.services.recommendation_engine import recommendation_engine
+from app.services.startup_index import load_startup_profiles, select_startup_profiles
+
+# (startup_id, investor_id, rank, score)
+MatchRow = Tuple[uuid.UUID, uuid.UUID, int, float]
+
+# Investor features shared read-only by every shard scored in a worker
+_worker_investors: Optional[InvestorFeatureMatrix] = None
+
+
+def _init_worker(investors: InvestorFeatureMatrix) -> None:
+    """Process pool initializer: keep the investor features for this worker."""
+    global _worker_investors
+    _worker_investors = investors
+
+
+def score_shard(
+    startups: List[StartupProfile], top_n: int, min_score: float
+) -> List[MatchRow]:
+    """Return the top-N investor matches for every startup in a shard."""
+    investors = _worker_investors
+    matches = []
+    for startup in startups:
+        rows, scores = recommendation_engine.top_investor_rows(
+            startup, investors, top_n, min_score
+        )
+        for rank, (row, score) in enumerate(zip(rows, scores), start=1):
+            matches.append(
+                (startup.id, investors.investors[row].id, rank, round(float(score), 2))
+            )
+    return matches
+
+
+def iter_startup_shards(
+    session: Session, after: Optional[uuid.UUID], shard_size: int
+) -> Iterator[List[StartupProfile]]:
+    """Yield published startups in id order, starting after the checkpoint."""
+    while True:
+        statement = select_startup_profiles().where(Startup.is_published)
+        if after is not None:
+            statement = statement.where(Startup.id > after)
+        shard = load_startup_profiles(
+            session, statement.order_by(Startup.id).limit(shard_size)
+        )
+        if not shard:
+            return
+
+        yield shard
+        after = shard[-1].id
+
+
+def start_or_resume_run(
+    session: Session, top_n: int, min_score: float, restart: bool
+) -> MatchRun:
+    """Resume the unfinished run if there is one, otherwise start a new run."""
+    run = session.exec(
+        select(MatchRun)
+        .where(MatchRun.status == MatchRunStatus.RUNNING)
+        .order_by(MatchRun.started_at.desc())
+    ).first()
+
+    if run and restart:
+        print(f"🗑  Abandoning unfinished run {run.id}")
+        session.exec(
+            delete(StartupInvestorMatch).where(StartupInvestorMatch.run_id == run.id)
+        )
+        run.status = MatchRunStatus.ABANDONED
+        session.add(run)
+        session.commit()
+        run = None
+
+    if run:
+        print(
+            f"⏯  Resuming run {run.id} after {run.startups_processed} startups"
+            f" (top_n={run.top_n}, min_score={run.min_score})"
+        )
+        return run
+
+    run = MatchRun(
+        algorithm_version=recommendation_engine.algorithm_version,
+        top_n=top_n,
+        min_score=min_score,
+    )
+    session.add(run)
+    session.commit()
+    session.refresh(run)
+    print(f"🆕 Started run {run.id}")
+    return run
+
+
+def save_shard(
+    session: Session,
+    run: MatchRun,
+    last_startup_id: uuid.UUID,
+    shard_size: int,
+    matches: List[MatchRow],
+) -> None:
+    """Bulk-insert a shard's matches and advance the checkpoint atomically."""
+    if matches:
+        session.exec(
+            insert(StartupInvestorMatch),
+            params=[
+                {
+                    "id": uuid.uuid4(),
+                    "run_id": run.id,
+                    "startup_id": startup_id,
+                    "investor_id": investor_id,
+                    "rank": rank,
+                    "score": score,
+                }
+                for startup_id, investor_id, rank, score in matches
+            ],
+        )
+
+    run.last_startup_id = last_startup_id
+    run.startups_processed += shard_size
+    run.matches_written += len(matches)
+    session.add(run)
+    session.commit()
+
+
+def complete_run(session: Session, run: MatchRun, keep_runs: int) -> None:
+    """
+    Mark the run completed, drop completed runs beyond the newest keep_runs
+    and every abandoned run.
+
+    Only completed runs count toward keep_runs, so an abandoned run never
+    pushes the previous completed run (which digests diff against) out.
+    """
+    run.status = MatchRunStatus.COMPLETED
+    run.completed_at = datetime.utcnow()
+    session.add(run)
+    session.commit()
+
+    old_run_ids = session.exec(
+        select(MatchRun.id)
+        .where(MatchRun.status == MatchRunStatus.COMPLETED)
+        .order_by(MatchRun.started_at.desc())
+        .offset(keep_runs)
+    ).all()
+    old_run_ids += session.exec(
+        select(MatchRun.id).where(MatchRun.status == MatchRunStatus.ABANDONED)
+    ).all()
+    if old_run_ids:
+        session.exec(
+            delete(StartupInvestorMatch).where(
+                StartupInvestorMatch.run_id.in_(old_run_ids)
+            )
+        )
+        session.exec(delete(MatchRun).where(MatchRun.id.in_(old_run_ids)))
+        session.commit()
+
+
+def precompute_matches(
+    top_n: int = 20,
+    min_score: float = 30.0,
+    workers: int = 1,
+    shard_size: int = 500,
+    restart: bool = False,
+    keep_runs: int = 2,
+) -> dict:
+    """
+    Compute and store the top-N investor matches for every published startup.
+
+    Args:
+        top_n: Matches to keep per startup
+        min_score: Minimum score for a match to be stored
+        workers: Number of scoring processes
+        shard_size: Startups per shard (and per checkpoint)
+        restart: Abandon an unfinished run instead of resuming it
+        keep_runs: Completed runs to keep, including this one
+
+    Returns:
+        dict: Run summary
+    """
+    engine = create_database_engine()
+
+    with Session(engine) as session:
+        run = start_or_resume_run(session, top_n, min_score, restart)
+        investors = investor_index.snapshot(session)
+        print(f"👥 Scoring against {len(investors):,} investors with {workers} worker(s)")
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(investors,)
+        ) as executor:
+            # Bounded in-flight window; results are saved in submission order
+            # so the checkpoint only ever moves past fully saved shards
+            pending = deque()
+            for shard in iter_startup_shards(
+                session, run.last_startup_id, shard_size
+            ):
+                future = executor.submit(score_shard, shard, run.top_n, run.min_score)
+                pending.append((shard[-1].id, len(shard), future))
+
+                if len(pending) >= workers * 2:
+                    last_startup_id, size, future = pending.popleft()
+                    save_shard(session, run, last_startup_id, size, future.result())
+                    print(f"  ✓ {run.startups_processed:,} startups saved")
+
+            while pending:
+                last_startup_id, size, future = pending.popleft()
+                save_shard(session, run, last_startup_id, size, future.result())
+                print(f"  ✓ {run.startups_processed:,} startups saved")
+
+        complete_run(session, run, keep_runs)
+
+        return {
+            "run_id": run.id,
+            "startups": run.startups_processed,
+            "investors": len(investors),
+            "matches": run.matches_written,
+        }
+
+
+def main():
+    """Main function for command-line usage."""
+    parser = argparse.ArgumentParser(
+        description="Precompute the top-N investor matches for every startup"
+    )
+    parser.add_argument("--top-n", type=int, default=20, help="Matches per startup")
+    parser.add_argument("--min-score", type=float, default=30.0)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Scoring processes"
+    )
+    parser.add_argument(
+        "--shard-size", type=int, default=500, help="Startups per shard/checkpoint"
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Abandon an unfinished run instead of resuming it",
+    )
+    parser.add_argument(
+        "--keep-runs",
+        type=int,
+        default=2,
+        help="Completed runs to keep (the previous run is needed for digests)",
+    )
+
+    args = parser.parse_args()
+
+    print("🧮 Starting match precompute...")
+    results = precompute_matches(
+        top_n=args.top_n,
+        min_score=args.min_score,
+        workers=args.workers,
+        shard_size=args.shard_size,
+        restart=args.restart,
+        keep_runs=args.keep_runs,
+    )
+
+    print("\n" + "=" * 50)
+    print("📊 MATCH PRECOMPUTE SUMMARY")
+    print("=" * 50)
+    print(f"Run: {results['run_id']}")
+    print(f"Startups scored: {results['startups']:,}")
+    print(f"Investors: {results['investors']:,}")
+    print(f"Matches stored: {results['matches']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Industry and funding stage affinity matrices for recommendation scoring.
+
+Partial credit between a startup's industry (or stage) and an investor's
+preferences is stored in dense float tables indexed by enum ordinal:
+``industry[startup_industry, investor_industry]`` and
+``stage[startup_stage, investor_stage]``. Exact matches score 1.0 and an
+investor's score is the best entry over their preferences.
+
+The defaults below can be overridden with a JSON file
+(RECOMMENDATION_AFFINITY_FILE) mapping startup values to investor values to
+credit, e.g.::
+
+    {
+      "industry": {"Fintech": {"Technology": 0.7, "Finance": 0.8}},
+      "stage": {"Seed": {"Pre-Seed": 0.6, "Series A": 0.5}}
+    }
+
+Entries in the file replace the matching default entries; everything else
+keeps its default value.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Type
+
+import numpy as np
+
+from app.core.config import settings
+from app.models.startup import FundingStage, Industry
+from app.services.features import INDUSTRY_BITS, STAGE_BITS
+
+# Default partial credit: (startup value, investor value, credit)
+DEFAULT_INDUSTRY_AFFINITIES: List[Tuple[Industry, Industry, float]] = [
+    (Industry.TECHNOLOGY, Industry.FINTECH, 0.7),
+    (Industry.TECHNOLOGY, Industry.HEALTH_TECH, 0.7),
+    (Industry.TECHNOLOGY, Industry.ED_TECH, 0.7),
+    (Industry.FINTECH, Industry.TECHNOLOGY, 0.7),
+    (Industry.FINTECH, Industry.FINANCE, 0.7),
+    (Industry.HEALTH_TECH, Industry.TECHNOLOGY, 0.7),
+    (Industry.HEALTH_TECH, Industry.HEALTHCARE, 0.7),
+    (Industry.HEALTH_TECH, Industry.BIOTECHNOLOGY, 0.7),
+    (Industry.BIOTECHNOLOGY, Industry.HEALTHCARE, 0.7),
+    (Industry.BIOTECHNOLOGY, Industry.HEALTH_TECH, 0.7),
+]
+
+# Stages in funding order; neighbours get partial credit
+STAGE_ORDER: List[FundingStage] = [
+    FundingStage.IDEA,
+    FundingStage.MVP,
+    FundingStage.PRE_SEED,
+    FundingStage.SEED,
+    FundingStage.SERIES_A,
+    FundingStage.SERIES_B,
+    FundingStage.SERIES_C,
+]
+ADJACENT_STAGE_CREDIT = 0.6
+
+DEFAULT_STAGE_AFFINITIES: List[Tuple[FundingStage, FundingStage, float]] = [
+    pair
+    for earlier, later in zip(STAGE_ORDER, STAGE_ORDER[1:])
+    for pair in (
+        (earlier, later, ADJACENT_STAGE_CREDIT),
+        (later, earlier, ADJACENT_STAGE_CREDIT),
+    )
+]
+
+
+def _build_matrix(
+    enum_class: Type[Any],
+    ordinals: Mapping[Any, int],
+    entries: Iterable[Tuple[Any, Any, float]],
+) -> np.ndarray:
+    """Dense ordinal x ordinal table with 1.0 on the diagonal."""
+    matrix = np.eye(len(ordinals))
+    for startup_value, investor_value, credit in entries:
+        credit = float(credit)
+        if not 0.0 <= credit <= 1.0:
+            raise ValueError(
+                f"Affinity {startup_value} -> {investor_value} must be between"
+                f" 0 and 1, got {credit}"
+            )
+        matrix[
+            ordinals[enum_class(startup_value)], ordinals[enum_class(investor_value)]
+        ] = credit
+    return matrix
+
+
+def _flatten(
+    section: Mapping[str, Mapping[str, float]],
+) -> List[Tuple[str, str, float]]:
+    """Turn {startup value: {investor value: credit}} into entry tuples."""
+    return [
+        (startup_value, investor_value, credit)
+        for startup_value, credits in section.items()
+        for investor_value, credit in credits.items()
+    ]
+
+
+def _best_credit(
+    row: np.ndarray,
+    enum_class: Type[Any],
+    ordinals: Mapping[Any, int],
+    values: Iterable[Any],
+) -> float:
+    """Best entry of a matrix row over a list of enum values."""
+    best = 0.0
+    for value in values or []:
+        try:
+            best = max(best, float(row[ordinals[enum_class(value)]]))
+        except ValueError:
+            # Unknown values stored in the JSON column never match
+            continue
+    return best
+
+
+def _best_credit_batch(row: np.ndarray, bits: np.ndarray) -> np.ndarray:
+    """
+    Best entry of a matrix row over every bitset in ``bits``.
+
+    Walks the distinct credits in ascending order and overwrites the rows
+    whose bitset contains any value worth at least that credit, so each row
+    ends with its maximum.
+    """
+    scores = np.zeros(len(bits))
+    for credit in np.unique(row[row > 0]):
+        mask = sum(1 << int(position) for position in np.flatnonzero(row >= credit))
+        scores[(bits & np.uint32(mask)) != 0] = credit
+    return scores
+
+
+class AffinityMatrices:
+    """Industry x industry and stage x stage partial-credit tables."""
+
+    def __init__(self, overrides: Optional[Dict[str, Any]] = None):
+        overrides = overrides or {}
+        self.industry = _build_matrix(
+            Industry,
+            INDUSTRY_BITS,
+            DEFAULT_INDUSTRY_AFFINITIES + _flatten(overrides.get("industry", {})),
+        )
+        self.stage = _build_matrix(
+            FundingStage,
+            STAGE_BITS,
+            DEFAULT_STAGE_AFFINITIES + _flatten(overrides.get("stage", {})),
+        )
+        # Changes whenever any credit changes; part of recommendation cache keys
+        self.version = hashlib.sha1(
+            self.industry.tobytes() + self.stage.tobytes()
+        ).hexdigest()
+
+    @classmethod
+    def from_file(cls, path: Optional[str]) -> "AffinityMatrices":
+        """Load overrides from a JSON file, or use the defaults if no path."""
+        if not path:
+            return cls()
+
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def industry_score(
+        self, startup_industry: Industry, investor_industries: Iterable[Any]
+    ) -> float:
+        """Best credit of the investor's industries for the startup's industry."""
+        row = self.industry[INDUSTRY_BITS[Industry(startup_industry)]]
+        return _best_credit(row, Industry, INDUSTRY_BITS, investor_industries)
+
+    def stage_score(
+        self, startup_stage: FundingStage, investor_stages: Iterable[Any]
+    ) -> float:
+        """Best credit of the investor's stages for the startup's stage."""
+        row = self.stage[STAGE_BITS[FundingStage(startup_stage)]]
+        return _best_credit(row, FundingStage, STAGE_BITS, investor_stages)
+
+    def industry_scores_batch(
+        self, startup_industry: Industry, industry_bits: np.ndarray
+    ) -> np.ndarray:
+        """industry_score for every investor bitset (see features.industry_mask)."""
+        row = self.industry[INDUSTRY_BITS[Industry(startup_industry)]]
+        return _best_credit_batch(row, industry_bits)
+
+    def stage_scores_batch(
+        self, startup_stage: FundingStage, stage_bits: np.ndarray
+    ) -> np.ndarray:
+        """stage_score for every investor bitset (see features.stage_mask)."""
+        row = self.stage[STAGE_BITS[FundingStage(startup_stage)]]
+        return _best_credit_batch(row, stage_bits)
+
+
+# Global instance
+affinity_matrices = AffinityMatrices.from_file(settings.RECOMMENDATION_AFFINITY_FILE)
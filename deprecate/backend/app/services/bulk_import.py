@@ -0,0 +1,693 @@
+"""
+Streaming bulk import and export for admin data transfers.
+
+Uploads are read record by record from the spooled upload file (CSV through
+csv.DictReader over a decoding wrapper, NDJSON line by line), then validated
+and inserted BULK_IMPORT_BATCH_SIZE records at a time with one executemany
+INSERT per batch, so memory stays flat however large the file is. Per-record
+problems are collected in a BulkImportReport instead of aborting the import.
+
+Investor imports create users, whose bcrypt password hashes dominate the
+cost, so they run as background jobs: the upload is spooled to a temporary
+file, new users' passwords are hashed in a process pool, and progress is
+saved to a BulkImportJob row after every batch.
+
+Exports stream NDJSON from a server-side cursor (``yield_per``), one response
+chunk per batch of rows.
+"""
+
+import csv
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from enum import Enum
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, col, select
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.crud.investor import insert_investors
+from app.crud.startup import insert_startups
+from app.models.bulk_import import BulkImportJob, BulkImportJobStatus
+from app.models.investor import InvestorProfile, InvestorProfileCreate
+from app.models.startup import FundingStage, Industry, Startup, StartupCreate
+from app.models.user import User, UserCreate, UserRole
+from app.services.geo import geocode_fields
+from app.services.investor_index import investor_index
+from app.services.investor_search import investor_search_index
+from app.services.startup_index import startup_index
+from app.services.suggest import suggest_index
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"  # One JSON object per line (also .jsonl)
+
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl")
+
+# Columns that hold JSON documents; CSV cells carry them as JSON text
+STARTUP_JSON_FIELDS = (
+    "team_members",
+    "funding",
+    "metrics",
+    "social_media",
+    "contact",
+    "traction",
+    "use_of_funds",
+    "timeline",
+)
+
+# Export keys: everything StartupCreate accepts plus the ids
+STARTUP_EXPORT_FIELDS = ("id", "founder_id", *StartupCreate.model_fields)
+
+# Password of the users created for imported investors, as for investors
+# created through the admin API
+TEMP_INVESTOR_PASSWORD = "temp_password_123!"
+
+UPLOAD_SPOOL_CHUNK_SIZE = 1024 * 1024
+
+
+class ImportRecord(NamedTuple):
+    row: int  # Data row (CSV) or line (NDJSON) number, from 1
+    data: Optional[Dict[str, Any]]
+    error: Optional[str] = None  # Set when the record could not be parsed
+
+
+class BulkImportReport:
+    """Counts and per-row errors of one import; at most `max_errors` are kept."""
+
+    def __init__(self, max_errors: int = settings.BULK_IMPORT_MAX_ERRORS):
+        self.max_errors = max_errors
+        self.total_rows = 0
+        self.created = 0
+        self.skipped = 0
+        self.error_count = 0
+        self.errors: List[str] = []
+
+    def add_error(self, row: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(f"Row {row}: {message}")
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Bulk import completed. {self.created} created, "
+            f"{self.skipped} skipped, {self.error_count} errors."
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total_rows": self.total_rows,
+            "created": self.created,
+            "skipped": self.skipped,
+            "error_count": self.error_count,
+            "errors": self.errors,
+            "errors_truncated": self.error_count > len(self.errors),
+        }
+
+
+def detect_import_format(
+    filename: Optional[str], content_type: Optional[str]
+) -> Optional[ImportFormat]:
+    """Import format from the upload's file extension or content type."""
+    name = (filename or "").lower()
+    if name.endswith(".csv") or content_type == "text/csv":
+        return ImportFormat.CSV
+    if name.endswith((".ndjson", ".jsonl")) or content_type in NDJSON_CONTENT_TYPES:
+        return ImportFormat.NDJSON
+    return None
+
+
+def iter_records(file: BinaryIO, import_format: ImportFormat) -> Iterator[ImportRecord]:
+    """
+    Parse an uploaded file one record at a time.
+
+    Args:
+        file: Binary file object positioned at the start of the upload
+        import_format: How to parse it
+
+    Returns:
+        Iterator of ImportRecords; CSV records have stripped values with
+        empty cells left out. Decoding stops at the first invalid UTF-8
+        sequence, which is reported as an error record.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if import_format == ImportFormat.CSV:
+            yield from _iter_csv(text)
+        else:
+            yield from _iter_ndjson(text)
+    finally:
+        # Leave the upload file open for its owner
+        text.detach()
+
+
+def batched(
+    records: Iterable[ImportRecord], size: int
+) -> Iterator[List[ImportRecord]]:
+    """Consecutive lists of up to `size` records."""
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """One-line summary of a pydantic ValidationError."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'record'}: "
+        f"{detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def import_startups(
+    db: Session,
+    file: BinaryIO,
+    import_format: ImportFormat,
+    batch_size: int = settings.BULK_IMPORT_BATCH_SIZE,
+) -> BulkImportReport:
+    """
+    Validate and insert the startups of an uploaded CSV or NDJSON file.
+
+    Each record has StartupCreate's fields plus ``founder_email`` or
+    ``founder_id`` naming an existing user. Records whose founder already has
+    a startup of the same name (in the database or earlier in the file) are
+    skipped, so re-running an import is harmless. Startups get new ids; an
+    ``id`` key, as in exports, is ignored.
+
+    Every batch is committed on its own: a failed batch is rolled back and
+    reported without undoing earlier ones.
+    """
+    report = BulkImportReport()
+    try:
+        for batch in batched(iter_records(file, import_format), batch_size):
+            _import_startup_batch(db, batch, report)
+    finally:
+        if report.created:
+            # One reload instead of an index update per inserted startup
+            startup_index.invalidate()
+            suggest_index.invalidate()
+    return report
+
+
+def import_investors(
+    db: Session,
+    file: BinaryIO,
+    import_format: ImportFormat,
+    hash_executor: Executor,
+    batch_size: int = settings.BULK_IMPORT_BATCH_SIZE,
+    on_batch: Optional[Callable[[BulkImportReport], None]] = None,
+) -> BulkImportReport:
+    """
+    Validate and insert the investors of an uploaded CSV or NDJSON file.
+
+    Records use the investor CSV export's columns: name (or full_name),
+    email, firm_name (or company), bio, website, location, linkedin_url (or
+    linkedin), twitter_url (or twitter), investment_focus and
+    preferred_stages (comma-separated in CSV, lists in NDJSON).
+
+    New emails get an investor user with TEMP_INVESTOR_PASSWORD, hashed on
+    `hash_executor`. Existing investors without a profile get one; emails
+    that already have a profile, or appeared earlier in the file, are
+    skipped; emails of other users are errors. Each batch's users and
+    profiles are inserted in one transaction, then `on_batch` is called with
+    the report so far.
+    """
+    report = BulkImportReport()
+    try:
+        for batch in batched(iter_records(file, import_format), batch_size):
+            _import_investor_batch(db, batch, report, hash_executor)
+            if on_batch:
+                on_batch(report)
+    finally:
+        if report.created:
+            investor_index.invalidate()
+            investor_search_index.invalidate()
+            suggest_index.invalidate()
+    return report
+
+
+def spool_upload(file: BinaryIO, suffix: str = "") -> str:
+    """
+    Copy an upload chunk by chunk to a temporary file that outlives the request.
+
+    Returns:
+        str: Path of the copy; whoever processes it deletes it
+    """
+    with tempfile.NamedTemporaryFile(
+        prefix="bulk-import-", suffix=suffix, delete=False
+    ) as spooled:
+        shutil.copyfileobj(file, spooled, UPLOAD_SPOOL_CHUNK_SIZE)
+    return spooled.name
+
+
+def run_investor_import_job(
+    engine: Engine, job_id: uuid.UUID, path: str, import_format: ImportFormat
+) -> None:
+    """
+    Background task: import the spooled upload at `path` for a BulkImportJob.
+
+    Uses its own session and saves the job's progress after every batch. The
+    job ends completed or failed (with the error in ``detail``); batches
+    saved before a failure stay. The spooled file is deleted.
+    """
+    try:
+        with Session(engine) as db:
+            job = db.get(BulkImportJob, job_id)
+            job.status = BulkImportJobStatus.RUNNING
+            db.commit()
+
+            try:
+                # Spawned hashers: forking a threaded server process is unsafe
+                with (
+                    open(path, "rb") as file,
+                    ProcessPoolExecutor(
+                        max_workers=settings.BULK_IMPORT_HASH_WORKERS,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    ) as hash_executor,
+                ):
+                    import_investors(
+                        db,
+                        file,
+                        import_format,
+                        hash_executor,
+                        on_batch=lambda report: save_job_progress(db, job, report),
+                    )
+                job.status = BulkImportJobStatus.COMPLETED
+            except Exception as e:
+                db.rollback()
+                job.status = BulkImportJobStatus.FAILED
+                job.detail = str(e)
+
+            job.completed_at = datetime.utcnow()
+            db.add(job)
+            db.commit()
+    finally:
+        os.remove(path)
+
+
+def save_job_progress(
+    db: Session, job: BulkImportJob, report: BulkImportReport
+) -> None:
+    """Copy an import's counts and errors to its job and commit."""
+    job.total_rows = report.total_rows
+    job.created = report.created
+    job.skipped = report.skipped
+    job.error_count = report.error_count
+    job.errors = list(report.errors)
+    db.add(job)
+    db.commit()
+
+
+def parse_csv_list(csv_string: str) -> List[str]:
+    """Parse a comma-separated string into a list."""
+    if not csv_string:
+        return []
+
+    return [item.strip() for item in csv_string.split(",") if item.strip()]
+
+
+def parse_investment_focus(focus_list) -> List[Industry]:
+    """Parse investment focus from various input formats."""
+    if isinstance(focus_list, str):
+        focus_list = parse_csv_list(focus_list)
+
+    if not focus_list:
+        return []
+
+    valid_industries = []
+    for item in focus_list:
+        try:
+            # Try to match with Industry enum
+            industry = Industry(str(item).strip())
+            valid_industries.append(industry)
+        except ValueError:
+            # If not a valid industry, skip it
+            continue
+
+    return valid_industries
+
+
+def parse_funding_stages(stages_list) -> List[FundingStage]:
+    """Parse funding stages from various input formats."""
+    if isinstance(stages_list, str):
+        stages_list = parse_csv_list(stages_list)
+
+    if not stages_list:
+        return []
+
+    valid_stages = []
+    for item in stages_list:
+        try:
+            # Try to match with FundingStage enum
+            stage = FundingStage(str(item).strip())
+            valid_stages.append(stage)
+        except ValueError:
+            # If not a valid stage, skip it
+            continue
+
+    return valid_stages
+
+
+def export_startups_ndjson(
+    engine: Engine, batch_size: int = settings.BULK_IMPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """
+    Every startup as an NDJSON line with its founder's email, in id order.
+
+    Uses its own session: the response body is streamed after the request's
+    session is gone. Output can be fed back to import_startups.
+    """
+    columns = [getattr(Startup, field) for field in STARTUP_EXPORT_FIELDS]
+    statement = (
+        select(*columns, User.email.label("founder_email"))
+        .join(User, Startup.founder_id == User.id)
+        .order_by(Startup.id)
+        .execution_options(yield_per=batch_size)
+    )
+    with Session(engine) as session:
+        for rows in session.exec(statement).partitions():
+            yield b"".join(
+                orjson.dumps(dict(row._mapping), option=orjson.OPT_APPEND_NEWLINE)
+                for row in rows
+            )
+
+
+def _iter_csv(text: io.TextIOWrapper) -> Iterator[ImportRecord]:
+    reader = csv.DictReader(text)
+    row = 0
+    while True:
+        row += 1
+        try:
+            values = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield ImportRecord(row, None, f"Malformed CSV: {e}")
+            continue
+        except UnicodeDecodeError:
+            yield ImportRecord(row, None, "File is not valid UTF-8")
+            return
+
+        # Surplus cells land under None, missing ones are None
+        yield ImportRecord(
+            row,
+            {
+                key.strip(): value.strip()
+                for key, value in values.items()
+                if key and isinstance(value, str) and value.strip()
+            },
+        )
+
+
+def _iter_ndjson(text: io.TextIOWrapper) -> Iterator[ImportRecord]:
+    line_number = 0
+    while True:
+        line_number += 1
+        try:
+            line = text.readline()
+        except UnicodeDecodeError:
+            yield ImportRecord(line_number, None, "File is not valid UTF-8")
+            return
+        if not line:
+            return
+        if not line.strip():
+            continue
+
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            yield ImportRecord(line_number, None, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRecord(line_number, None, "Expected a JSON object")
+            continue
+        yield ImportRecord(line_number, data)
+
+
+def _import_startup_batch(
+    db: Session, batch: List[ImportRecord], report: BulkImportReport
+) -> None:
+    report.total_rows += len(batch)
+
+    # (row, founder id or email, validated startup)
+    candidates: List[Tuple[int, Union[uuid.UUID, str], StartupCreate]] = []
+    for record in batch:
+        if record.error:
+            report.add_error(record.row, record.error)
+            continue
+        try:
+            founder = _founder_reference(record.data)
+            startup = StartupCreate.model_validate(_startup_fields(record.data))
+        except ValidationError as e:
+            report.add_error(record.row, format_validation_error(e))
+            continue
+        except ValueError as e:
+            report.add_error(record.row, str(e))
+            continue
+        candidates.append((record.row, founder, startup))
+
+    founders = _resolve_founders(db, {founder for _, founder, _ in candidates})
+    resolved = []
+    for row, founder, startup in candidates:
+        if founder not in founders:
+            report.add_error(row, f"Founder {founder} not found")
+            continue
+        resolved.append((row, founders[founder], startup))
+
+    existing = _existing_startup_names(
+        db, {(founder_id, startup.name) for _, founder_id, startup in resolved}
+    )
+    rows = []
+    row_numbers = []
+    for row, founder_id, startup in resolved:
+        if (founder_id, startup.name) in existing:
+            report.skipped += 1
+            continue
+        existing.add((founder_id, startup.name))
+        rows.append(
+            {
+                **startup.model_dump(),
+                "id": uuid.uuid4(),
+                "founder_id": founder_id,
+                **geocode_fields(startup.location),
+            }
+        )
+        row_numbers.append(row)
+
+    try:
+        report.created += insert_startups(db, rows)
+    except SQLAlchemyError as e:
+        db.rollback()
+        message = f"Batch insert failed: {getattr(e, 'orig', None) or e}"
+        for row in row_numbers:
+            report.add_error(row, message)
+
+
+def _founder_reference(data: Dict[str, Any]) -> Union[uuid.UUID, str]:
+    if data.get("founder_id"):
+        try:
+            return uuid.UUID(str(data["founder_id"]))
+        except ValueError:
+            raise ValueError(f"Invalid founder_id {data['founder_id']!r}") from None
+    if data.get("founder_email"):
+        return str(data["founder_email"]).strip()
+    raise ValueError("founder_email or founder_id is required")
+
+
+def _startup_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    fields = {
+        key: value
+        for key, value in data.items()
+        if key not in ("id", "founder_id", "founder_email")
+    }
+    for field in STARTUP_JSON_FIELDS:
+        value = fields.get(field)
+        if isinstance(value, str) and value.startswith(("{", "[")):
+            try:
+                fields[field] = json.loads(value)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{field}: invalid JSON ({e})") from None
+    return fields
+
+
+def _resolve_founders(
+    db: Session, references: Set[Union[uuid.UUID, str]]
+) -> Dict[Union[uuid.UUID, str], uuid.UUID]:
+    """Map founder ids and emails that exist to user ids, one query each."""
+    ids = {reference for reference in references if isinstance(reference, uuid.UUID)}
+    emails = references - ids
+
+    founders: Dict[Union[uuid.UUID, str], uuid.UUID] = {}
+    if ids:
+        for user_id in db.exec(select(User.id).where(col(User.id).in_(ids))):
+            founders[user_id] = user_id
+    if emails:
+        statement = select(User.id, User.email).where(col(User.email).in_(emails))
+        for user_id, email in db.exec(statement):
+            founders[email] = user_id
+    return founders
+
+
+def _existing_startup_names(
+    db: Session, pairs: Set[Tuple[uuid.UUID, str]]
+) -> Set[Tuple[uuid.UUID, str]]:
+    """The (founder_id, name) pairs that already have a startup."""
+    if not pairs:
+        return set()
+    statement = select(Startup.founder_id, Startup.name).where(
+        tuple_(Startup.founder_id, Startup.name).in_(pairs)
+    )
+    return {(founder_id, name) for founder_id, name in db.exec(statement)}
+
+
+def _import_investor_batch(
+    db: Session,
+    batch: List[ImportRecord],
+    report: BulkImportReport,
+    hash_executor: Executor,
+) -> None:
+    report.total_rows += len(batch)
+
+    # email -> (row, user, profile), first occurrence in the batch
+    candidates: Dict[str, Tuple[int, UserCreate, InvestorProfileCreate]] = {}
+    for record in batch:
+        if record.error:
+            report.add_error(record.row, record.error)
+            continue
+        try:
+            user, profile = _investor_fields(record.data)
+        except ValidationError as e:
+            report.add_error(record.row, format_validation_error(e))
+            continue
+        except ValueError as e:
+            report.add_error(record.row, str(e))
+            continue
+        if user.email in candidates:
+            report.skipped += 1
+            continue
+        candidates[user.email] = (record.row, user, profile)
+
+    existing = _existing_users(db, set(candidates))
+    new_users = []
+    profile_rows = []
+    row_numbers = []
+    for email, (row, user, profile) in candidates.items():
+        if email in existing:
+            user_id, role, has_profile = existing[email]
+            if role != UserRole.INVESTOR:
+                report.add_error(
+                    row, f"User with email {email} exists but is not an investor"
+                )
+                continue
+            if has_profile:
+                report.skipped += 1
+                continue
+        else:
+            user_id = uuid.uuid4()
+            new_users.append((user_id, user))
+        profile_rows.append(
+            {
+                **profile.model_dump(),
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                **geocode_fields(profile.location),
+            }
+        )
+        row_numbers.append(row)
+
+    hashes = hash_executor.map(
+        get_password_hash, [user.password for _, user in new_users]
+    )
+    user_rows = [
+        {
+            **user.model_dump(exclude={"password"}),
+            "id": user_id,
+            "hashed_password": hashed_password,
+        }
+        for (user_id, user), hashed_password in zip(new_users, hashes)
+    ]
+
+    try:
+        report.created += insert_investors(db, user_rows, profile_rows)
+    except SQLAlchemyError as e:
+        db.rollback()
+        message = f"Batch insert failed: {getattr(e, 'orig', None) or e}"
+        for row in row_numbers:
+            report.add_error(row, message)
+
+
+def _investor_fields(
+    data: Dict[str, Any],
+) -> Tuple[UserCreate, InvestorProfileCreate]:
+    if not data.get("email"):
+        raise ValueError("Email is required")
+
+    user = UserCreate.model_validate(
+        {
+            "full_name": data.get("name") or data.get("full_name") or "",
+            "email": data["email"],
+            "role": UserRole.INVESTOR,
+            "is_active": True,
+            "is_verified": True,
+            "password": TEMP_INVESTOR_PASSWORD,
+        }
+    )
+    profile = InvestorProfileCreate.model_validate(
+        {
+            "firm_name": data.get("firm_name") or data.get("company") or "",
+            "bio": data.get("bio"),
+            "website": data.get("website"),
+            "location": data.get("location"),
+            "linkedin_url": data.get("linkedin_url") or data.get("linkedin"),
+            "twitter_url": data.get("twitter_url") or data.get("twitter"),
+            "investment_focus": parse_investment_focus(data.get("investment_focus")),
+            "preferred_stages": parse_funding_stages(data.get("preferred_stages")),
+        }
+    )
+    return user, profile
+
+
+def _existing_users(
+    db: Session, emails: Set[str]
+) -> Dict[str, Tuple[uuid.UUID, UserRole, bool]]:
+    """email -> (user id, role, has an investor profile) for known emails."""
+    if not emails:
+        return {}
+    statement = (
+        select(User.email, User.id, User.role, InvestorProfile.id)
+        .outerjoin(InvestorProfile, InvestorProfile.user_id == User.id)
+        .where(col(User.email).in_(emails))
+    )
+    return {
+        email: (user_id, role, profile_id is not None)
+        for email, user_id, role, profile_id in db.exec(statement)
+    }
@@ -0,0 +1,313 @@
+"""
+Array-backed features for batch recommendation scoring.
+
+Investors and startups are encoded once into NumPy arrays (industry and stage
+bitsets or ordinals, interned location ids, gazetteer region ordinals and
+the per-startup terms) so one side of a match can be scored against every row of
+the other with a handful of vectorized operations instead of a Python loop
+over ORM and pydantic objects.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.models.startup import FundingStage, Industry
+from app.services.geo import region_index
+
+# Bit positions follow enum declaration order
+INDUSTRY_BITS: Dict[Industry, int] = {
+    industry: position for position, industry in enumerate(Industry)
+}
+STAGE_BITS: Dict[FundingStage, int] = {
+    stage: position for position, stage in enumerate(FundingStage)
+}
+
+
+def industry_mask(industries: Optional[Iterable[Any]]) -> int:
+    """Encode a list of industries (enums or raw JSON values) as a bitset."""
+    mask = 0
+    for value in industries or []:
+        try:
+            mask |= 1 << INDUSTRY_BITS[Industry(value)]
+        except ValueError:
+            # Unknown values stored in the JSON column never match
+            continue
+    return mask
+
+
+def stage_mask(stages: Optional[Iterable[Any]]) -> int:
+    """Encode a list of funding stages (enums or raw JSON values) as a bitset."""
+    mask = 0
+    for value in stages or []:
+        try:
+            mask |= 1 << STAGE_BITS[FundingStage(value)]
+        except ValueError:
+            continue
+    return mask
+
+
+# Typical raise sizes per stage, used by the funding amount scorer
+FUNDING_STAGE_RANGES: Dict[FundingStage, Tuple[float, float]] = {
+    FundingStage.PRE_SEED: (50_000, 500_000),
+    FundingStage.SEED: (250_000, 2_000_000),
+    FundingStage.SERIES_A: (1_000_000, 15_000_000),
+    FundingStage.SERIES_B: (5_000_000, 50_000_000),
+}
+
+# Funding fit codes stored per startup
+FUNDING_UNKNOWN = -1
+FUNDING_OUTSIDE_RANGE = 0
+FUNDING_IN_RANGE = 1
+
+
+def funding_fit(funding_stage: FundingStage, funding_goal: Optional[float]) -> int:
+    """Classify a funding goal against the typical range for its stage."""
+    if not funding_goal:
+        return FUNDING_UNKNOWN
+
+    if funding_stage in FUNDING_STAGE_RANGES:
+        min_range, max_range = FUNDING_STAGE_RANGES[funding_stage]
+        if min_range <= funding_goal <= max_range:
+            return FUNDING_IN_RANGE
+
+    return FUNDING_OUTSIDE_RANGE
+
+
+def profile_completeness(startup: Any) -> float:
+    """Calculate how complete a startup profile is (0.0 to 1.0)."""
+    required_fields = [
+        startup.name,
+        startup.description,
+        startup.industry,
+        startup.funding_stage,
+        startup.location,
+    ]
+
+    optional_fields = [
+        startup.funding_goal,
+        startup.business_model,
+        startup.target_market,
+    ]
+
+    required_score = sum(1 for field in required_fields if field) / len(
+        required_fields
+    )
+    optional_score = sum(1 for field in optional_fields if field) / len(
+        optional_fields
+    )
+
+    # Weight required fields more heavily
+    return (required_score * 0.8) + (optional_score * 0.2)
+
+
+class FeatureMatrix:
+    """
+    Growable struct-of-arrays keyed by row.
+
+    Row ``i`` of every array describes ``records[i]``. Rows can be appended,
+    overwritten and removed in place so that long-lived owners (see
+    ``app.services.record_index``) never have to rebuild the matrix.
+    Subclasses declare their arrays in ``_ARRAYS`` and encode a record in
+    ``_encode``.
+    """
+
+    # Array name -> (dtype, fill value)
+    _ARRAYS: Dict[str, Tuple[Any, Any]] = {}
+
+    def __init__(self, records: Sequence[Any] = ()):
+        self.records: List[Any] = []
+        self._location_vocab: Dict[str, int] = {}
+        self._allocate(max(len(records), 16))
+
+        for record in records:
+            self.append(record)
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate (or grow) the backing arrays to the given capacity."""
+        size = len(self.records)
+        for name, (dtype, fill) in self._ARRAYS.items():
+            array = np.full(capacity, fill, dtype=dtype)
+            if size:
+                array[:size] = getattr(self, name)[:size]
+            setattr(self, name, array)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _view(self, name: str) -> np.ndarray:
+        return getattr(self, name)[: len(self.records)]
+
+    # Row maintenance
+
+    def append(self, record: Any) -> int:
+        """Add a record as a new row and return its row index."""
+        row = len(self.records)
+        if row == len(getattr(self, next(iter(self._ARRAYS)))):
+            self._allocate(max(row * 2, 16))
+
+        self.records.append(record)
+        self.set_row(row, record)
+        return row
+
+    def set_row(self, row: int, record: Any) -> None:
+        """Overwrite the features stored at ``row``."""
+        self.records[row] = record
+        self._encode(row, record)
+
+    def _encode(self, row: int, record: Any) -> None:
+        raise NotImplementedError
+
+    def remove(self, row: int) -> Optional[Any]:
+        """
+        Remove ``row`` by moving the last row into its place.
+
+        Returns the record that now occupies ``row`` (None if the removed
+        row was the last one) so callers can update their position maps.
+        """
+        last = len(self.records) - 1
+        moved = None
+        if row != last:
+            moved = self.records[last]
+            self.records[row] = moved
+            for name in self._ARRAYS:
+                array = getattr(self, name)
+                array[row] = array[last]
+
+        self.records.pop()
+        return moved
+
+    def copy(self) -> "FeatureMatrix":
+        """Return an independent snapshot that is safe to score concurrently."""
+        snapshot = self.__class__.__new__(self.__class__)
+        snapshot.records = list(self.records)
+        # The vocabulary is append-only, so sharing it is safe
+        snapshot._location_vocab = self._location_vocab
+        for name in self._ARRAYS:
+            setattr(snapshot, name, self._view(name).copy())
+        return snapshot
+
+    # Lookups
+
+    def _intern_location(self, location: Optional[str]) -> int:
+        """Return the interned id of a free-text location (-1 if missing)."""
+        if not location:
+            return -1
+
+        return self._location_vocab.setdefault(
+            location.lower(), len(self._location_vocab)
+        )
+
+    def location_id(self, location: Optional[str]) -> int:
+        """Return the interned id of a lowercased location, or -1 if unseen."""
+        if not location:
+            return -1
+        return self._location_vocab.get(location, -1)
+
+    def rows(self, indices: Iterable[int]) -> List[Any]:
+        """Return the source records for the given row indices."""
+        return [self.records[int(index)] for index in indices]
+
+
+class InvestorFeatureMatrix(FeatureMatrix):
+    """
+    Scoring features for investors.
+
+    Records only need to expose ``investment_focus``, ``preferred_stages``,
+    ``location`` and ``region``.
+    """
+
+    _ARRAYS = {
+        "_industry_bits": (np.uint32, 0),
+        "_stage_bits": (np.uint32, 0),
+        "_has_stage_preferences": (bool, False),
+        "_location_ids": (np.int32, -1),
+        "_region_ids": (np.int16, -1),
+    }
+
+    @property
+    def investors(self) -> List[Any]:
+        return self.records
+
+    @property
+    def industry_bits(self) -> np.ndarray:
+        return self._view("_industry_bits")
+
+    @property
+    def stage_bits(self) -> np.ndarray:
+        return self._view("_stage_bits")
+
+    @property
+    def has_stage_preferences(self) -> np.ndarray:
+        return self._view("_has_stage_preferences")
+
+    @property
+    def location_ids(self) -> np.ndarray:
+        return self._view("_location_ids")
+
+    @property
+    def region_ids(self) -> np.ndarray:
+        return self._view("_region_ids")
+
+    def _encode(self, row: int, investor: Any) -> None:
+        self._industry_bits[row] = industry_mask(investor.investment_focus)
+        self._stage_bits[row] = stage_mask(investor.preferred_stages)
+        self._has_stage_preferences[row] = bool(investor.preferred_stages)
+        self._location_ids[row] = self._intern_location(investor.location)
+        self._region_ids[row] = region_index(investor.region)
+
+
+class StartupFeatureMatrix(FeatureMatrix):
+    """
+    Scoring features for startups.
+
+    Records are ``StartupProfile`` objects. Terms that only depend on the
+    startup (funding fit and profile completeness) are precomputed per row.
+    """
+
+    _ARRAYS = {
+        "_industry_ids": (np.int8, -1),
+        "_stage_ids": (np.int8, -1),
+        "_location_ids": (np.int32, -1),
+        "_region_ids": (np.int16, -1),
+        "_funding_fit": (np.int8, FUNDING_UNKNOWN),
+        "_completeness": (np.float64, 0.0),
+    }
+
+    @property
+    def startups(self) -> List[Any]:
+        return self.records
+
+    @property
+    def industry_ids(self) -> np.ndarray:
+        return self._view("_industry_ids")
+
+    @property
+    def stage_ids(self) -> np.ndarray:
+        return self._view("_stage_ids")
+
+    @property
+    def location_ids(self) -> np.ndarray:
+        return self._view("_location_ids")
+
+    @property
+    def region_ids(self) -> np.ndarray:
+        return self._view("_region_ids")
+
+    @property
+    def funding_fit(self) -> np.ndarray:
+        return self._view("_funding_fit")
+
+    @property
+    def completeness(self) -> np.ndarray:
+        return self._view("_completeness")
+
+    def _encode(self, row: int, startup: Any) -> None:
+        self._industry_ids[row] = INDUSTRY_BITS[Industry(startup.industry)]
+        self._stage_ids[row] = STAGE_BITS[FundingStage(startup.funding_stage)]
+        self._location_ids[row] = self._intern_location(startup.location)
+        self._region_ids[row] = region_index(startup.region)
+        self._funding_fit[row] = funding_fit(
+            startup.funding_stage, startup.funding_goal
+        )
+        self._completeness[row] = profile_completeness(startup)
@@ -0,0 +1,167 @@
+"""
+Bundled offline gazetteer for location normalization.
+
+Each region is a startup/investor hub with a canonical id, a display name, the
+centroid coordinates and the aliases that free-text locations are matched
+against (see ``app.services.geo``). Aliases are matched as whole words on the
+normalized text, longest alias first, so "New York, NY" resolves through "new
+york" and "Brooklyn" through its own alias.
+
+Region ids are stored in the database; never rename or reuse one.
+"""
+
+from typing import List, NamedTuple, Tuple
+
+
+class Region(NamedTuple):
+    id: str
+    name: str
+    latitude: float
+    longitude: float
+    aliases: Tuple[str, ...]
+
+
+GAZETTEER: List[Region] = [
+    # North America
+    Region(
+        "sf_bay_area",
+        "San Francisco Bay Area",
+        37.7749,
+        -122.4194,
+        (
+            "san francisco",
+            "sf",
+            "bay area",
+            "silicon valley",
+            "palo alto",
+            "menlo park",
+            "mountain view",
+            "san jose",
+            "sunnyvale",
+            "santa clara",
+            "cupertino",
+            "redwood city",
+            "san mateo",
+            "oakland",
+            "berkeley",
+        ),
+    ),
+    Region(
+        "los_angeles",
+        "Los Angeles",
+        34.0522,
+        -118.2437,
+        ("los angeles", "santa monica", "culver city", "pasadena", "hollywood"),
+    ),
+    Region("san_diego", "San Diego", 32.7157, -117.1611, ("san diego",)),
+    Region(
+        "seattle",
+        "Seattle",
+        47.6062,
+        -122.3321,
+        ("seattle", "bellevue", "redmond", "kirkland"),
+    ),
+    Region("portland", "Portland", 45.5152, -122.6784, ("portland",)),
+    Region("denver", "Denver / Boulder", 39.7392, -104.9903, ("denver", "boulder")),
+    Region("austin", "Austin", 30.2672, -97.7431, ("austin",)),
+    Region(
+        "dallas",
+        "Dallas-Fort Worth",
+        32.7767,
+        -96.7970,
+        ("dallas", "fort worth", "plano"),
+    ),
+    Region("houston", "Houston", 29.7604, -95.3698, ("houston",)),
+    Region("chicago", "Chicago", 41.8781, -87.6298, ("chicago",)),
+    Region(
+        "boston",
+        "Boston",
+        42.3601,
+        -71.0589,
+        ("boston", "cambridge ma", "somerville"),
+    ),
+    Region(
+        "new_york",
+        "New York City",
+        40.7128,
+        -74.0060,
+        (
+            "new york",
+            "nyc",
+            "ny",
+            "manhattan",
+            "brooklyn",
+            "queens",
+            "jersey city",
+            "hoboken",
+        ),
+    ),
+    Region(
+        "washington_dc",
+        "Washington, D.C.",
+        38.9072,
+        -77.0369,
+        ("washington dc", "washington d c", "dc"),
+    ),
+    Region("atlanta", "Atlanta", 33.7490, -84.3880, ("atlanta",)),
+    Region("miami", "Miami", 25.7617, -80.1918, ("miami", "fort lauderdale")),
+    Region("toronto", "Toronto", 43.6532, -79.3832, ("toronto", "waterloo")),
+    Region("vancouver", "Vancouver", 49.2827, -123.1207, ("vancouver",)),
+    Region("montreal", "Montreal", 45.5017, -73.5673, ("montreal",)),
+    Region("mexico_city", "Mexico City", 19.4326, -99.1332, ("mexico city", "cdmx")),
+    # South America
+    Region("sao_paulo", "São Paulo", -23.5505, -46.6333, ("sao paulo",)),
+    Region("buenos_aires", "Buenos Aires", -34.6037, -58.3816, ("buenos aires",)),
+    Region("bogota", "Bogotá", 4.7110, -74.0721, ("bogota",)),
+    Region("santiago", "Santiago", -33.4489, -70.6693, ("santiago",)),
+    # Europe
+    Region("london", "London", 51.5074, -0.1278, ("london",)),
+    Region("dublin", "Dublin", 53.3498, -6.2603, ("dublin",)),
+    Region("paris", "Paris", 48.8566, 2.3522, ("paris",)),
+    Region("amsterdam", "Amsterdam", 52.3676, 4.9041, ("amsterdam",)),
+    Region("berlin", "Berlin", 52.5200, 13.4050, ("berlin",)),
+    Region("munich", "Munich", 48.1351, 11.5820, ("munich", "munchen")),
+    Region("zurich", "Zurich", 47.3769, 8.5417, ("zurich",)),
+    Region("stockholm", "Stockholm", 59.3293, 18.0686, ("stockholm",)),
+    Region("barcelona", "Barcelona", 41.3851, 2.1734, ("barcelona",)),
+    Region("madrid", "Madrid", 40.4168, -3.7038, ("madrid",)),
+    Region("lisbon", "Lisbon", 38.7223, -9.1393, ("lisbon", "lisboa")),
+    # Middle East and Africa
+    Region("tel_aviv", "Tel Aviv", 32.0853, 34.7818, ("tel aviv",)),
+    Region("dubai", "Dubai", 25.2048, 55.2708, ("dubai",)),
+    Region("cairo", "Cairo", 30.0444, 31.2357, ("cairo",)),
+    Region("lagos", "Lagos", 6.5244, 3.3792, ("lagos",)),
+    Region("accra", "Accra", 5.6037, -0.1870, ("accra",)),
+    Region("nairobi", "Nairobi", -1.2921, 36.8219, ("nairobi",)),
+    Region("kigali", "Kigali", -1.9441, 30.0619, ("kigali",)),
+    Region(
+        "johannesburg",
+        "Johannesburg",
+        -26.2041,
+        28.0473,
+        ("johannesburg", "sandton"),
+    ),
+    Region("cape_town", "Cape Town", -33.9249, 18.4241, ("cape town",)),
+    # Asia-Pacific
+    Region(
+        "bangalore", "Bengaluru", 12.9716, 77.5946, ("bangalore", "bengaluru")
+    ),
+    Region("mumbai", "Mumbai", 19.0760, 72.8777, ("mumbai",)),
+    Region(
+        "delhi",
+        "Delhi NCR",
+        28.7041,
+        77.1025,
+        ("delhi", "new delhi", "gurgaon", "gurugram", "noida"),
+    ),
+    Region("singapore", "Singapore", 1.3521, 103.8198, ("singapore",)),
+    Region("jakarta", "Jakarta", -6.2088, 106.8456, ("jakarta",)),
+    Region("hong_kong", "Hong Kong", 22.3193, 114.1694, ("hong kong",)),
+    Region("shenzhen", "Shenzhen", 22.5431, 114.0579, ("shenzhen",)),
+    Region("shanghai", "Shanghai", 31.2304, 121.4737, ("shanghai",)),
+    Region("beijing", "Beijing", 39.9042, 116.4074, ("beijing",)),
+    Region("seoul", "Seoul", 37.5665, 126.9780, ("seoul",)),
+    Region("tokyo", "Tokyo", 35.6762, 139.6503, ("tokyo",)),
+    Region("sydney", "Sydney", -33.8688, 151.2093, ("sydney",)),
+    Region("melbourne", "Melbourne", -37.8136, 144.9631, ("melbourne",)),
+]
@@ -0,0 +1,131 @@
+"""
+Location normalization and geo-proximity scoring.
+
+Free-text locations are resolved to a canonical region from the bundled
+gazetteer (``app.services.gazetteer``) once, when a startup or investor profile
+is written. The recommendation engine then scores proximity from region ids
+with a precomputed region-to-region score table, so no string work happens per
+startup-investor pair.
+"""
+
+import math
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.gazetteer import GAZETTEER, Region
+
+# Region id -> ordinal used by the scoring arrays
+REGION_INDEX: Dict[str, int] = {region.id: i for i, region in enumerate(GAZETTEER)}
+
+# (padded alias, region), longest alias first so specific names win
+_ALIASES: List[Tuple[str, Region]] = sorted(
+    ((f" {alias} ", region) for region in GAZETTEER for alias in region.aliases),
+    key=lambda item: len(item[0]),
+    reverse=True,
+)
+
+# (max distance in km, score); the first band that fits wins
+DISTANCE_BANDS: Tuple[Tuple[float, float], ...] = (
+    (0.0, 1.0),  # Same region
+    (800.0, 0.7),  # Nearby region, e.g. San Francisco - Los Angeles
+    (2000.0, 0.4),  # Same part of the continent
+)
+
+
+def normalize_location_text(location: str) -> str:
+    """Lowercase, strip accents and punctuation, and collapse whitespace."""
+    text = unicodedata.normalize("NFKD", location)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text.lower()).split())
+
+
+def geocode(location: Optional[str]) -> Optional[Region]:
+    """Resolve a free-text location to a gazetteer region, if any."""
+    if not location:
+        return None
+
+    padded = f" {normalize_location_text(location)} "
+    for alias, region in _ALIASES:
+        if alias in padded:
+            return region
+    return None
+
+
+def geocode_fields(location: Optional[str]) -> Dict[str, Any]:
+    """``region``, ``latitude`` and ``longitude`` column values for a location."""
+    region = geocode(location)
+    return {
+        "region": region.id if region else None,
+        "latitude": region.latitude if region else None,
+        "longitude": region.longitude if region else None,
+    }
+
+
+def apply_geocode(record: Any) -> None:
+    """Set ``region``, ``latitude`` and ``longitude`` from ``record.location``."""
+    for field, value in geocode_fields(record.location).items():
+        setattr(record, field, value)
+
+
+def region_index(region_id: Optional[str]) -> int:
+    """Return the ordinal of a stored region id, or -1 if unknown."""
+    if not region_id:
+        return -1
+    return REGION_INDEX.get(region_id, -1)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 6371.0 * 2 * math.asin(math.sqrt(a))
+
+
+class GeoProximityScorer:
+    """
+    Location proximity from canonical regions.
+
+    Distances between every pair of gazetteer regions are computed once and
+    mapped to scores through distance bands. The recommendation engine only
+    does table lookups; swap the engine's ``location_scorer`` to change the
+    scoring.
+    """
+
+    def __init__(
+        self,
+        distance_bands: Sequence[Tuple[float, float]] = DISTANCE_BANDS,
+        default_score: float = 0.2,
+    ):
+        self.distance_bands = tuple(distance_bands)
+        # Score for regions further apart than every band (or unknown ones)
+        self.default_score = default_score
+
+        count = len(GAZETTEER)
+        self.distances = np.zeros((count, count))
+        self.scores = np.full((count, count), default_score)
+        for i, a in enumerate(GAZETTEER):
+            for j, b in enumerate(GAZETTEER):
+                if i != j:
+                    self.distances[i, j] = haversine_km(
+                        a.latitude, a.longitude, b.latitude, b.longitude
+                    )
+                for max_distance, score in self.distance_bands:
+                    if self.distances[i, j] <= max_distance:
+                        self.scores[i, j] = score
+                        break
+
+    def score(self, region_a: int, region_b: int) -> float:
+        """Score two known region ordinals (see region_index)."""
+        return float(self.scores[region_a, region_b])
+
+    def distance_km(self, region_a: int, region_b: int) -> float:
+        return float(self.distances[region_a, region_b])
+
+    def region_name(self, region: int) -> str:
+        return GAZETTEER[region].name
@@ -0,0 +1,136 @@
+"""
+Process-local investor index for the recommendation engine.
+
+The index keeps a compact record per investor plus the array-backed scoring
+features, and is updated incrementally by the investor CRUD functions (see
+``app.services.record_index``). Writes made by other workers are picked up by a
+periodic full reload (INVESTOR_INDEX_TTL_SECONDS).
+"""
+
+import uuid
+from typing import Any, List, Optional, Sequence
+
+from sqlmodel import Session, select
+from sqlmodel.sql.expression import Select
+
+from app.core.config import settings
+from app.models.investor import InvestorProfile
+from app.models.startup import FundingStage, Industry
+from app.models.user import User
+from app.services.features import InvestorFeatureMatrix
+from app.services.record_index import RecordIndex
+
+
+class InvestorRecord:
+    """Compact, read-only view of an investor and its user."""
+
+    __slots__ = (
+        "id",
+        "user_id",
+        "name",
+        "email",
+        "firm_name",
+        "bio",
+        "website",
+        "location",
+        "linkedin_url",
+        "twitter_url",
+        "investment_focus",
+        "preferred_stages",
+        "region",
+    )
+
+    def __init__(
+        self,
+        id: uuid.UUID,
+        user_id: uuid.UUID,
+        name: str,
+        email: str,
+        firm_name: str,
+        bio: Optional[str] = None,
+        website: Optional[str] = None,
+        location: Optional[str] = None,
+        linkedin_url: Optional[str] = None,
+        twitter_url: Optional[str] = None,
+        investment_focus: Optional[List[Industry]] = None,
+        preferred_stages: Optional[List[FundingStage]] = None,
+        region: Optional[str] = None,
+    ):
+        self.id = id
+        self.user_id = user_id
+        self.name = name
+        self.email = email
+        self.firm_name = firm_name
+        self.bio = bio
+        self.website = website
+        self.location = location
+        self.linkedin_url = linkedin_url
+        self.twitter_url = twitter_url
+        self.investment_focus = investment_focus
+        self.preferred_stages = preferred_stages
+        self.region = region
+
+    @classmethod
+    def from_profile(cls, profile: InvestorProfile, user: User) -> "InvestorRecord":
+        return cls(
+            id=profile.id,
+            user_id=profile.user_id,
+            name=user.full_name,
+            email=user.email,
+            firm_name=profile.firm_name,
+            bio=profile.bio,
+            website=profile.website,
+            location=profile.location,
+            linkedin_url=profile.linkedin_url,
+            twitter_url=profile.twitter_url,
+            investment_focus=profile.investment_focus,
+            preferred_stages=profile.preferred_stages,
+            region=profile.region,
+        )
+
+
+class InvestorIndex(RecordIndex):
+    """In-memory investor records and scoring features with incremental updates."""
+
+    matrix_class = InvestorFeatureMatrix
+
+    def __init__(self, ttl_seconds: int = settings.INVESTOR_INDEX_TTL_SECONDS):
+        super().__init__(ttl_seconds)
+
+    def _select_records(self) -> Select:
+        return select(
+            InvestorProfile.id,
+            InvestorProfile.user_id,
+            User.full_name,
+            User.email,
+            InvestorProfile.firm_name,
+            InvestorProfile.bio,
+            InvestorProfile.website,
+            InvestorProfile.location,
+            InvestorProfile.linkedin_url,
+            InvestorProfile.twitter_url,
+            InvestorProfile.investment_focus,
+            InvestorProfile.preferred_stages,
+            InvestorProfile.region,
+        ).join(User, InvestorProfile.user_id == User.id)
+
+    def _build_records(self, rows: Sequence[Any]) -> List[InvestorRecord]:
+        return [InvestorRecord(*row) for row in rows]
+
+    def snapshot(self, db: Session) -> InvestorFeatureMatrix:
+        return super().snapshot(db)
+
+    def current(self) -> InvestorFeatureMatrix:
+        return super().current()
+
+    def upsert(self, profile: InvestorProfile) -> None:
+        """Insert or replace a single investor."""
+        if self._skip_unloaded():
+            return
+
+        # Resolve the user relationship outside the lock (may hit the database)
+        self._put(InvestorRecord.from_profile(profile, profile.user))
+
+
+# Global instance
+investor_index = InvestorIndex()
@@ -0,0 +1,109 @@
+"""
+Column projection and serialization fast path for InvestorWithUserRead.
+
+Investor listings select only the columns InvestorWithUserRead needs (no ORM
+entities), map each row straight to its JSON-ready response dict and return
+the page as an ORJSONResponse. FastAPI then neither builds one pydantic model
+per row nor re-validates the whole list against the route's
+``response_model``, which still documents the schema in OpenAPI.
+
+Code that has to embed investors in another pydantic model (recommendations)
+uses ``investor_read_model``, which builds the same fields without running
+validation.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from sqlmodel import select
+from sqlmodel.sql.expression import Select
+
+from app.models.investor import InvestorProfile, InvestorWithUserRead
+from app.models.startup import FundingStage, Industry
+from app.models.user import User
+
+# Labels match InvestorRecord's attributes, so both map the same way
+INVESTOR_READ_COLUMNS = (
+    InvestorProfile.id,
+    InvestorProfile.user_id,
+    User.full_name.label("name"),
+    User.email,
+    InvestorProfile.firm_name,
+    InvestorProfile.bio,
+    InvestorProfile.website,
+    InvestorProfile.location,
+    InvestorProfile.linkedin_url,
+    InvestorProfile.twitter_url,
+    InvestorProfile.investment_focus,
+    InvestorProfile.preferred_stages,
+)
+
+
+def select_investor_reads() -> Select:
+    """SELECT of the InvestorWithUserRead columns, investor joined to its user."""
+    return select(*INVESTOR_READ_COLUMNS).join(
+        User, InvestorProfile.user_id == User.id
+    )
+
+
+def investor_read_dict(investor: Any) -> Dict[str, Any]:
+    """
+    JSON-ready InvestorWithUserRead fields for a projected row.
+
+    Args:
+        investor: A row from select_investor_reads() or an InvestorRecord
+
+    Returns:
+        Dict with the response model's keys; industries and stages are the
+        stored string values
+    """
+    return {
+        "id": investor.id,
+        "user_id": investor.user_id,
+        "name": investor.name,
+        "email": investor.email,
+        "company": investor.firm_name,  # Map firm_name to company
+        "firm_name": investor.firm_name,
+        "bio": investor.bio,
+        "website": investor.website,
+        "location": investor.location,
+        "linkedin_url": investor.linkedin_url,
+        "twitter_url": investor.twitter_url,
+        "investment_focus": investor.investment_focus,
+        "preferred_stages": investor.preferred_stages,
+        "profile_picture": None,  # TODO: Add profile picture handling
+        "min_investment": None,  # TODO: Add investment range fields to model
+        "max_investment": None,  # TODO: Add investment range fields to model
+    }
+
+
+def investor_read_dicts(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """investor_read_dict for every row."""
+    return [investor_read_dict(row) for row in rows]
+
+
+def investor_read_model(investor: Any) -> InvestorWithUserRead:
+    """
+    InvestorWithUserRead built without validation.
+
+    JSON columns load as raw strings, so industries and stages are converted
+    to their enums (unknown values dropped) to keep serialization exact.
+    """
+    fields = investor_read_dict(investor)
+    fields["investment_focus"] = _enum_list(Industry, investor.investment_focus)
+    fields["preferred_stages"] = _enum_list(FundingStage, investor.preferred_stages)
+    return InvestorWithUserRead.model_construct(**fields)
+
+
+def _enum_list(
+    enum_class: Type[Any], values: Optional[List[Any]]
+) -> Optional[List[Any]]:
+    if values is None:
+        return None
+
+    members = []
+    for value in values:
+        try:
+            members.append(enum_class(value))
+        except ValueError:
+            continue
+    return members
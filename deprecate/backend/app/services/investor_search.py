@@ -0,0 +1,202 @@
+"""
+Investor name and firm search.
+
+On PostgreSQL, search runs in SQL: ``user.full_name`` and
+``investorprofile.firm_name`` have pg_trgm GIN indexes, so substring (ILIKE)
+filters do not scan the tables, and results are ranked in the query (see
+``app.crud.investor.search_investors_by_name_or_firm``).
+
+Other databases (SQLite in development) use the process-local trigram index in
+this module instead. It is loaded once, updated by the investor CRUD functions
+and reloaded periodically (INVESTOR_INDEX_TTL_SECONDS) to pick up writes made
+by other workers, like the recommendation engine's investor index.
+
+Both backends match case-insensitive substrings of the name or firm and order
+them by the same keys: names or firms starting with the term first, then
+words starting with the term, then by trigram similarity, firm name and id.
+The similarity here only approximates pg_trgm's ``similarity()``: pg_trgm
+pads each word with spaces and splits on non-alphanumeric characters, while
+this index takes the trigrams of the whole normalized text. Results within
+a prefix rank can therefore come out in a somewhat different order.
+"""
+
+import heapq
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models.investor import InvestorProfile
+from app.models.user import User
+
+# Prefix ranks, best first
+PREFIX_MATCH = 2  # The name or firm starts with the term
+WORD_PREFIX_MATCH = 1  # A word of the name or firm starts with the term
+SUBSTRING_MATCH = 0
+
+
+def normalize_search_text(text: Optional[str]) -> str:
+    """Case-fold and collapse whitespace."""
+    return " ".join((text or "").casefold().split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Every 3-character substring of already-normalized text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class InvestorSearchIndex:
+    """
+    In-process trigram index over investor names and firm names.
+
+    A term of three or more characters is looked up by intersecting the
+    posting sets of its trigrams, then candidates are checked for the actual
+    substring. Shorter terms (typeahead's first keystrokes) scan the names.
+    """
+
+    def __init__(self, ttl_seconds: int = settings.INVESTOR_INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        # investor profile id -> (normalized name, normalized firm, firm name,
+        # trigram count of the name, trigram count of the firm)
+        self._documents: Dict[uuid.UUID, Tuple[str, str, str, int, int]] = {}
+        self._postings: Dict[str, Set[uuid.UUID]] = defaultdict(set)
+        self._loaded_at: Optional[float] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def load(self, db: Session) -> None:
+        """(Re)load every investor from the database."""
+        statement = select(
+            InvestorProfile.id, User.full_name, InvestorProfile.firm_name
+        ).join(User, InvestorProfile.user_id == User.id)
+        rows = db.exec(statement).all()
+
+        with self._lock:
+            self._documents = {}
+            self._postings = defaultdict(set)
+            for profile_id, name, firm_name in rows:
+                self._add(profile_id, name, firm_name)
+            self._loaded_at = time.monotonic()
+
+    def refresh_if_stale(self, db: Session) -> None:
+        """Load the index if it was never loaded or its TTL expired."""
+        if (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > self.ttl_seconds
+        ):
+            self.load(db)
+
+    def upsert(self, profile: InvestorProfile) -> None:
+        """Insert or replace a single investor."""
+        if not self.is_loaded:
+            # Loaded with everything on the first search
+            return
+
+        # Resolve the user relationship outside the lock (may hit the database)
+        name = profile.user.full_name
+        with self._lock:
+            self._discard(profile.id)
+            self._add(profile.id, name, profile.firm_name)
+
+    def remove(self, profile_id: uuid.UUID) -> None:
+        """Drop a single investor from the index."""
+        with self._lock:
+            self._discard(profile_id)
+
+    def invalidate(self) -> None:
+        """Force a full reload on the next search."""
+        with self._lock:
+            self._loaded_at = None
+
+    def search(self, db: Session, term: str, limit: int) -> List[uuid.UUID]:
+        """Return the ids of the best `limit` matches for `term`, best first."""
+        self.refresh_if_stale(db)
+
+        term = normalize_search_text(term)
+        if not term or limit <= 0:
+            return []
+
+        term_trigrams = trigrams(term)
+        word_start = f" {term}"
+        with self._lock:
+            if term_trigrams:
+                # Smallest posting set first keeps the intersection cheap
+                postings = sorted(
+                    (self._postings.get(gram, set()) for gram in term_trigrams),
+                    key=len,
+                )
+                candidates = set.intersection(*postings)
+            else:
+                candidates = self._documents.keys()
+
+            matches = []
+            for profile_id in candidates:
+                name, firm, firm_name, name_grams, firm_grams = self._documents[
+                    profile_id
+                ]
+                in_name = term in name
+                in_firm = term in firm
+                if not in_name and not in_firm:
+                    continue
+
+                # A field containing the term contains all of its trigrams, so
+                # trigram similarity reduces to |term| / |field| trigrams
+                similarity = max(
+                    len(term_trigrams) / name_grams if in_name and name_grams else 0.0,
+                    len(term_trigrams) / firm_grams if in_firm and firm_grams else 0.0,
+                )
+                if name.startswith(term) or firm.startswith(term):
+                    rank = PREFIX_MATCH
+                elif word_start in name or word_start in firm:
+                    rank = WORD_PREFIX_MATCH
+                else:
+                    rank = SUBSTRING_MATCH
+
+                matches.append(
+                    (
+                        -rank,
+                        -similarity,
+                        firm_name,
+                        profile_id,
+                    )
+                )
+
+        return [match[-1] for match in heapq.nsmallest(limit, matches)]
+
+    def _add(self, profile_id: uuid.UUID, name: str, firm_name: str) -> None:
+        name = normalize_search_text(name)
+        firm = normalize_search_text(firm_name)
+        name_trigrams = trigrams(name)
+        firm_trigrams = trigrams(firm)
+
+        self._documents[profile_id] = (
+            name,
+            firm,
+            firm_name,
+            len(name_trigrams),
+            len(firm_trigrams),
+        )
+        for gram in name_trigrams | firm_trigrams:
+            self._postings[gram].add(profile_id)
+
+    def _discard(self, profile_id: uuid.UUID) -> None:
+        document = self._documents.pop(profile_id, None)
+        if document is None:
+            return
+        for gram in trigrams(document[0]) | trigrams(document[1]):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(profile_id)
+                if not posting:
+                    del self._postings[gram]
+
+
+# Global instance
+investor_search_index = InvestorSearchIndex()
@@ -0,0 +1,91 @@
+"""
+Result cache for founder recommendations.
+
+Entries are keyed by everything that can change a recommendation response:
+the startup id, a fingerprint of the startup profile, the investor index
+version, the scoring weights, the algorithm version and the request filters.
+Entries expire after a TTL and the least recently used entry is evicted once
+the cache is full. Startup writes evict that startup's entries explicitly;
+investor writes bump the investor index version, so older entries stop
+matching.
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.models.recommendation import StartupProfile
+
+
+def startup_profile_version(startup: StartupProfile) -> str:
+    """Fingerprint the startup fields the recommendation engine reads."""
+    return hashlib.sha1(startup.model_dump_json().encode()).hexdigest()
+
+
+def weights_version(weights: Dict[str, float]) -> Tuple[Tuple[str, float], ...]:
+    """Hashable, order-independent representation of scoring weights."""
+    return tuple(sorted(weights.items()))
+
+
+class RecommendationCache:
+    """Thread-safe TTL + LRU cache for recommendation responses."""
+
+    def __init__(
+        self,
+        max_entries: int = settings.RECOMMENDATION_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = settings.RECOMMENDATION_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock  # Seconds; replaceable in tests
+        self._lock = threading.Lock()
+        # key -> (expires_at, value); ordered from least to most recently used
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return a cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < self._clock():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_startup(self, startup_id: uuid.UUID) -> None:
+        """Drop every entry for a startup. Keys must start with the startup id."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == startup_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global instance
+recommendation_cache = RecommendationCache()
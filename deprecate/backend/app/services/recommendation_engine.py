@@ -6,21 +6,47 @@ with investors based on various factors including industry alignment, funding
 stage preferences, location proximity, and other business criteria.
 """
 
+import asyncio
+import heapq
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
 
-from app.crud.investor import get_all_investor_profiles_with_users
-from app.crud.startup import get_startup_by_founder
-from app.models.investor import InvestorProfile
+import numpy as np
+
+from app.crud.investor import get_investor_profile_by_user_id
+from app.core.config import settings
+from app.crud.startup import get_startup_by_founder, get_startup_by_founder_async
 from app.models.recommendation import (
     InvestorRecommendation,
     RecommendationReason,
     RecommendationResponse,
     StartupProfile,
+    StartupRecommendation,
+    StartupRecommendationResponse,
+)
+from app.models.startup import FundingStage, Industry, Startup
+from app.services.affinity import affinity_matrices
+from app.services.features import (
+    FUNDING_IN_RANGE,
+    FUNDING_UNKNOWN,
+    FeatureMatrix,
+    InvestorFeatureMatrix,
+    StartupFeatureMatrix,
+    funding_fit,
+    profile_completeness,
 )
-from app.models.startup import FundingStage, Industry
-from app.models.user import User
+from app.services.geo import GeoProximityScorer, region_index
+from app.services.investor_index import InvestorRecord, investor_index
+from app.services.investor_projection import investor_read_model
+from app.services.recommendation_cache import (
+    recommendation_cache,
+    startup_profile_version,
+    weights_version,
+)
+from app.services.startup_index import startup_index
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Session
 
 
@@ -39,6 +65,23 @@ class RecommendationEngine:
             "profile_completeness": 0.05,  # 5% - Bonus factor
         }
 
+        # Partial credit between industries and between funding stages
+        self.affinities = affinity_matrices
+
+        # Location proximity from canonical regions (pluggable)
+        self.location_scorer = GeoProximityScorer()
+
+        # Score all investors at once with NumPy. The per-investor loop in
+        # _rank_investors is kept as the reference implementation.
+        self.batch_scoring = True
+
+        # Bounded pool for the async path: at most this many scoring passes run
+        # at once per worker, and none of them on the event loop
+        self.scoring_executor = ThreadPoolExecutor(
+            max_workers=settings.RECOMMENDATION_SCORING_WORKERS,
+            thread_name_prefix="recommendation-scoring",
+        )
+
     def get_recommendations_for_founder(
         self,
         db: Session,
@@ -61,16 +104,86 @@ class RecommendationEngine:
         # Get the founder's startup profile
         startup = get_startup_by_founder(db, founder_id)
         if not startup:
-            return RecommendationResponse(
-                recommendations=[],
-                total_investors_analyzed=0,
-                startup_profile_completeness=0.0,
-                generated_at=datetime.utcnow().isoformat(),
-                algorithm_version=self.algorithm_version,
-            )
+            return self._empty_founder_response()
+
+        # Serve repeated requests from the cache while nothing has changed
+        startup_profile = self._startup_profile(startup)
+        investor_index.refresh_if_stale(db)
+        cache_key = self._founder_cache_key(startup_profile, max_results, min_score)
+        cached_response = recommendation_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        # Get all investors from the in-memory index
+        investors = investor_index.snapshot(db)
+
+        response = self._build_founder_response(
+            startup_profile, investors, max_results, min_score
+        )
+        recommendation_cache.set(cache_key, response)
+        return response
+
+    async def get_recommendations_for_founder_async(
+        self,
+        session: AsyncSession,
+        founder_id: uuid.UUID,
+        max_results: int = 10,
+        min_score: float = 30.0,
+    ) -> RecommendationResponse:
+        """
+        Async variant of get_recommendations_for_founder for async routes.
+
+        The startup and, when stale, the investor index are loaded through the
+        async session. Scoring runs on the bounded scoring executor so a large
+        scoring pass never blocks the event loop.
+
+        Args:
+            session: Async database session
+            founder_id: UUID of the founder requesting recommendations
+            max_results: Maximum number of recommendations to return
+            min_score: Minimum score threshold for recommendations
+
+        Returns:
+            RecommendationResponse with scored and explained recommendations
+        """
+        startup = await get_startup_by_founder_async(session, founder_id)
+        if not startup:
+            return self._empty_founder_response()
+
+        startup_profile = self._startup_profile(startup)
+        await investor_index.refresh_if_stale_async(session, self.scoring_executor)
+        cache_key = self._founder_cache_key(startup_profile, max_results, min_score)
+        cached_response = recommendation_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        # The snapshot takes the index lock and copies the feature matrix, so
+        # it is taken in the worker thread too
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            self.scoring_executor,
+            self._build_founder_response_from,
+            startup_profile,
+            investor_index.current,
+            max_results,
+            min_score,
+        )
+        recommendation_cache.set(cache_key, response)
+        return response
 
-        # Convert to simplified profile for algorithm
-        startup_profile = StartupProfile(
+    def _empty_founder_response(self) -> RecommendationResponse:
+        """Response for founders without a startup profile."""
+        return RecommendationResponse(
+            recommendations=[],
+            total_investors_analyzed=0,
+            startup_profile_completeness=0.0,
+            generated_at=datetime.utcnow().isoformat(),
+            algorithm_version=self.algorithm_version,
+        )
+
+    def _startup_profile(self, startup: Startup) -> StartupProfile:
+        """Convert a startup row to the simplified profile the algorithm uses."""
+        return StartupProfile(
             id=startup.id,
             founder_id=startup.founder_id,
             name=startup.name,
@@ -81,45 +194,491 @@ class RecommendationEngine:
             description=startup.description,
             business_model=startup.business_model,
             target_market=startup.target_market,
+            region=startup.region,
         )
 
-        # Get all investors
-        investor_pairs = get_all_investor_profiles_with_users(db, skip=0, limit=1000)
-
-        # Score each investor
-        scored_recommendations = []
-        for investor_profile, user in investor_pairs:
-            score, reasons = self._calculate_investor_score(
-                startup_profile, investor_profile
-            )
+    def _founder_cache_key(
+        self, startup_profile: StartupProfile, max_results: int, min_score: float
+    ) -> Tuple:
+        """Cache key for a founder request; read after refreshing the index."""
+        return (
+            startup_profile.id,
+            startup_profile_version(startup_profile),
+            investor_index.version,
+            weights_version(self.weights),
+            self.affinities.version,
+            self.algorithm_version,
+            max_results,
+            min_score,
+        )
 
-            if score >= min_score:
-                recommendation = self._create_recommendation(
-                    investor_profile, user, score, reasons
-                )
-                scored_recommendations.append(recommendation)
+    def _build_founder_response_from(
+        self,
+        startup_profile: StartupProfile,
+        snapshot: Callable[[], InvestorFeatureMatrix],
+        max_results: int,
+        min_score: float,
+    ) -> RecommendationResponse:
+        """Executor task: snapshot the investor index, then score it."""
+        return self._build_founder_response(
+            startup_profile, snapshot(), max_results, min_score
+        )
 
-        # Sort by score (descending) and limit results
-        scored_recommendations.sort(key=lambda x: x.score, reverse=True)
-        top_recommendations = scored_recommendations[:max_results]
+    def _build_founder_response(
+        self,
+        startup_profile: StartupProfile,
+        investors: InvestorFeatureMatrix,
+        max_results: int,
+        min_score: float,
+    ) -> RecommendationResponse:
+        """Score every investor and build the founder response."""
+        if self.batch_scoring:
+            top_recommendations = self._rank_investors_batch(
+                startup_profile, investors, max_results, min_score
+            )
+        else:
+            top_recommendations = self._rank_investors(
+                startup_profile, investors.investors, max_results, min_score
+            )
 
         # Calculate startup profile completeness
         profile_completeness = self._calculate_profile_completeness(startup_profile)
 
         return RecommendationResponse(
             recommendations=top_recommendations,
-            total_investors_analyzed=len(investor_pairs),
+            total_investors_analyzed=len(investors),
             startup_profile_completeness=profile_completeness,
             generated_at=datetime.utcnow().isoformat(),
             algorithm_version=self.algorithm_version,
         )
 
+    def get_recommendations_for_investor(
+        self,
+        db: Session,
+        user_id: uuid.UUID,
+        max_results: int = 10,
+        min_score: float = 30.0,
+    ) -> StartupRecommendationResponse:
+        """
+        Generate startup recommendations for a specific investor.
+
+        Uses the same scoring as founder recommendations, with the investor
+        fixed and every published startup scored at once.
+
+        Args:
+            db: Database session
+            user_id: UUID of the investor user requesting recommendations
+            max_results: Maximum number of recommendations to return
+            min_score: Minimum score threshold for recommendations
+
+        Returns:
+            StartupRecommendationResponse with scored and explained startups
+        """
+        profile = get_investor_profile_by_user_id(db, user_id)
+        if not profile:
+            return StartupRecommendationResponse(
+                recommendations=[],
+                total_startups_analyzed=0,
+                generated_at=datetime.utcnow().isoformat(),
+                algorithm_version=self.algorithm_version,
+            )
+
+        investor = InvestorRecord.from_profile(profile, profile.user)
+
+        # Get all published startups from the in-memory index
+        startups = startup_index.snapshot(db)
+
+        return StartupRecommendationResponse(
+            recommendations=self._rank_startups_batch(
+                investor, startups, max_results, min_score
+            ),
+            total_startups_analyzed=len(startups),
+            generated_at=datetime.utcnow().isoformat(),
+            algorithm_version=self.algorithm_version,
+        )
+
+    def _rank_investors(
+        self,
+        startup: StartupProfile,
+        investors: Sequence[InvestorRecord],
+        max_results: int,
+        min_score: float,
+    ) -> List[InvestorRecommendation]:
+        """
+        Score investors one at a time, keeping only the top-k in a bounded heap.
+
+        Heap entries are (rounded score, -position) so the root is always the
+        weakest kept investor; on equal scores the earlier investor wins, which
+        matches a stable descending sort over the full list. Once the heap is
+        full its root becomes the floor passed to _calculate_investor_score, so
+        investors that cannot beat it skip the location and funding scorers.
+        """
+        if max_results <= 0:
+            return []
+
+        heap: List[Tuple[float, int, float, InvestorRecord, List]] = []
+        for position, investor in enumerate(investors):
+            floor = min_score
+            if len(heap) == max_results:
+                floor = max(min_score, heap[0][0])
+
+            score, reasons = self._calculate_investor_score(
+                startup, investor, floor=floor
+            )
+            if score < min_score:
+                continue
+
+            entry = (round(score, 2), -position, score, investor, reasons)
+            if len(heap) < max_results:
+                heapq.heappush(heap, entry)
+            elif entry[0] > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+        # Sort by score (descending), earliest investor first on ties
+        heap.sort(key=lambda entry: (entry[0], entry[1]), reverse=True)
+        return [
+            self._create_recommendation(investor, score, reasons)
+            for _, _, score, investor, reasons in heap
+        ]
+
+    def _rank_investors_batch(
+        self,
+        startup: StartupProfile,
+        features: InvestorFeatureMatrix,
+        max_results: int,
+        min_score: float,
+    ) -> List[InvestorRecommendation]:
+        """
+        Score all investors with vectorized operations.
+
+        Industry and stage (70% of the weight) are scored for everyone first.
+        Investors whose best possible score cannot reach min_score, or the k-th
+        best worst-case score, are dropped before location scoring. Reasons and
+        response objects are only built for the top-k survivors.
+        """
+        top_rows, top_scores = self.top_investor_rows(
+            startup, features, max_results, min_score
+        )
+
+        recommendations = []
+        for score, investor in zip(top_scores, features.rows(top_rows)):
+            _, reasons = self._calculate_investor_score(startup, investor)
+            recommendations.append(
+                self._create_recommendation(investor, float(score), reasons)
+            )
+
+        return recommendations
+
+    def top_investor_rows(
+        self,
+        startup: StartupProfile,
+        features: InvestorFeatureMatrix,
+        max_results: int,
+        min_score: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the (rows, scores) of the top-k investors, best first.
+
+        Rows index into `features`; scores are the unrounded 0-100 match
+        scores. Used by the batch ranker and the offline match job, which
+        only needs ids and scores, not InvestorRecommendation objects.
+        """
+        if max_results <= 0 or not len(features):
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        alignment_scores = self._score_alignment_batch(startup, features)
+        fixed_score = self._fixed_score(startup)
+        location_weight = self.weights["location_proximity"]
+
+        # Bounds assuming the best (1.0) and worst (default) location score
+        worst_location = self.location_scorer.default_score * location_weight
+        upper_bounds = (alignment_scores + location_weight + fixed_score) * 100
+        lower_bounds = (alignment_scores + worst_location + fixed_score) * 100
+
+        floor = min_score
+        if len(features) > max_results:
+            kth_lower_bound = np.partition(lower_bounds, -max_results)[-max_results]
+            # Keep a rounding margin so ties on the 2-decimal score survive
+            floor = max(floor, kth_lower_bound - 0.01)
+        rows = np.flatnonzero(upper_bounds >= floor - 1e-9)
+
+        scores = self._combine_scores_batch(
+            startup,
+            alignment_scores[rows],
+            self._score_location_batch(startup, features, rows),
+        )
+        survivors = scores >= min_score
+        rows, scores = rows[survivors], scores[survivors]
+
+        return self._select_top_k(rows, scores, max_results)
+
+    def _select_top_k(
+        self, rows: np.ndarray, scores: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the k best (rows, scores), ordered like the reference ranking.
+
+        Ranking uses the rounded score, and ties keep ascending row order. An
+        O(n) partition finds the k-th key so only the winners are sorted.
+        """
+        keys = np.round(scores, 2)
+        if len(rows) > k:
+            kth_key = np.partition(keys, len(keys) - k)[len(keys) - k]
+            above = np.flatnonzero(keys > kth_key)
+            tied = np.flatnonzero(keys == kth_key)[: k - len(above)]
+            keep = np.sort(np.concatenate([above, tied]))
+            rows, scores, keys = rows[keep], scores[keep], keys[keep]
+
+        order = np.argsort(-keys, kind="stable")
+        return rows[order], scores[order]
+
+    def _score_investors_batch(
+        self, startup: StartupProfile, features: InvestorFeatureMatrix
+    ) -> np.ndarray:
+        """
+        Calculate recommendation scores for every investor in the matrix.
+
+        Mirrors _calculate_investor_score term by term so both paths produce
+        identical floats.
+        """
+        return self._combine_scores_batch(
+            startup,
+            self._score_alignment_batch(startup, features),
+            self._score_location_batch(startup, features),
+        )
+
+    def _score_alignment_batch(
+        self, startup: StartupProfile, features: InvestorFeatureMatrix
+    ) -> np.ndarray:
+        """
+        Weighted industry + stage scores for every investor.
+
+        Both come from the same affinity matrices as the scalar scorers.
+        """
+        # 1. Industry Match
+        industry_scores = self.affinities.industry_scores_batch(
+            startup.industry, features.industry_bits
+        )
+
+        # 2. Funding Stage Match
+        stage_scores = np.where(
+            features.has_stage_preferences,
+            self.affinities.stage_scores_batch(
+                startup.funding_stage, features.stage_bits
+            ),
+            0.5,
+        )
+
+        alignment_scores = industry_scores * self.weights["industry_match"]
+        return alignment_scores + stage_scores * self.weights["stage_match"]
+
+    def _score_location_batch(
+        self,
+        startup: StartupProfile,
+        features: InvestorFeatureMatrix,
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Unweighted location scores for the given rows (default: all)."""
+        location_ids = features.location_ids
+        region_ids = features.region_ids
+        if rows is not None:
+            location_ids = location_ids[rows]
+            region_ids = region_ids[rows]
+
+        if not startup.location:
+            return np.full(len(location_ids), 0.3)
+
+        return self._score_regions_batch(
+            startup.location,
+            region_index(startup.region),
+            features,
+            location_ids,
+            region_ids,
+        )
+
+    def _score_regions_batch(
+        self,
+        location: str,
+        region: int,
+        features: FeatureMatrix,
+        location_ids: np.ndarray,
+        region_ids: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Unweighted location scores of one known location against many rows.
+
+        Mirrors _score_location_match: rows without a location score 0.3,
+        rows where both regions are known use the scorer's region table, and
+        otherwise only an identical location counts.
+        """
+        scorer = self.location_scorer
+        same_location = location_ids == features.location_id(location.lower())
+        if region >= 0:
+            known_region = region_ids >= 0
+            region_scores = scorer.scores[region][np.maximum(region_ids, 0)]
+        else:
+            known_region = np.zeros(len(region_ids), dtype=bool)
+            region_scores = 0.0
+
+        return np.where(
+            location_ids < 0,
+            0.3,
+            np.where(
+                known_region,
+                region_scores,
+                np.where(same_location, 1.0, scorer.default_score),
+            ),
+        )
+
+    def _combine_scores_batch(
+        self,
+        startup: StartupProfile,
+        alignment_scores: np.ndarray,
+        location_scores: np.ndarray,
+    ) -> np.ndarray:
+        """Add the remaining terms in the same order as the scalar path."""
+        # 4-5. Funding amount and completeness only depend on the startup
+        funding_score, _ = self._score_funding_compatibility(startup, None)
+        completeness_score = self._calculate_profile_completeness(startup)
+
+        total_scores = (
+            alignment_scores + location_scores * self.weights["location_proximity"]
+        )
+        total_scores = total_scores + funding_score * self.weights["funding_amount"]
+        total_scores = (
+            total_scores + completeness_score * self.weights["profile_completeness"]
+        )
+
+        # Convert to 0-100 scale
+        return total_scores * 100
+
+    def _fixed_score(self, startup: StartupProfile) -> float:
+        """Weighted score of the terms that do not depend on the investor."""
+        funding_score, _ = self._score_funding_compatibility(startup, None)
+        completeness_score = self._calculate_profile_completeness(startup)
+        return (
+            funding_score * self.weights["funding_amount"]
+            + completeness_score * self.weights["profile_completeness"]
+        )
+
+    def _rank_startups_batch(
+        self,
+        investor: InvestorRecord,
+        features: StartupFeatureMatrix,
+        max_results: int,
+        min_score: float,
+    ) -> List[StartupRecommendation]:
+        """
+        Score all startups for one investor with vectorized operations.
+
+        Reasons and response objects are only built for the top-k startups.
+        """
+        if max_results <= 0 or not len(features):
+            return []
+
+        scores = self._score_startups_batch(investor, features)
+        rows = np.flatnonzero(scores >= min_score)
+        top_rows, top_scores = self._select_top_k(rows, scores[rows], max_results)
+
+        recommendations = []
+        for score, startup in zip(top_scores, features.rows(top_rows)):
+            _, reasons = self._calculate_investor_score(startup, investor)
+            recommendations.append(
+                StartupRecommendation(
+                    startup=startup,
+                    score=round(float(score), 2),
+                    confidence=self._confidence_level(score),
+                    reasons=reasons,
+                    match_percentage=int(score),
+                )
+            )
+
+        return recommendations
+
+    def _score_startups_batch(
+        self, investor: InvestorRecord, features: StartupFeatureMatrix
+    ) -> np.ndarray:
+        """
+        Calculate recommendation scores for every startup in the matrix.
+
+        Industry and stage scores only depend on the startup's enum value, so
+        they are computed once per value from the affinity matrices and
+        gathered per row. Terms are added in the same order as _calculate_investor_score
+        so both paths produce identical floats.
+        """
+        # 1. Industry Match, per startup industry
+        focus = investor.investment_focus or []
+        industry_table = np.array(
+            [self.affinities.industry_score(industry, focus) for industry in Industry]
+        )
+
+        # 2. Funding Stage Match, per startup stage
+        preferred_stages = investor.preferred_stages or []
+        stage_table = np.array(
+            [
+                self.affinities.stage_score(stage, preferred_stages)
+                if preferred_stages
+                else 0.5
+                for stage in FundingStage
+            ]
+        )
+
+        # 3. Location Proximity
+        if investor.location:
+            location_scores = self._score_regions_batch(
+                investor.location,
+                region_index(investor.region),
+                features,
+                features.location_ids,
+                features.region_ids,
+            )
+        else:
+            location_scores = np.full(len(features), 0.3)
+
+        # 4. Funding Amount Compatibility
+        funding_scores = np.where(
+            features.funding_fit == FUNDING_IN_RANGE,
+            1.0,
+            np.where(features.funding_fit == FUNDING_UNKNOWN, 0.5, 0.6),
+        )
+
+        total_scores = industry_table[features.industry_ids] * self.weights[
+            "industry_match"
+        ]
+        total_scores = (
+            total_scores + stage_table[features.stage_ids] * self.weights["stage_match"]
+        )
+        total_scores = (
+            total_scores + location_scores * self.weights["location_proximity"]
+        )
+        total_scores = total_scores + funding_scores * self.weights["funding_amount"]
+
+        # 5. Profile Completeness Bonus
+        total_scores = (
+            total_scores
+            + features.completeness * self.weights["profile_completeness"]
+        )
+
+        # Convert to 0-100 scale
+        return total_scores * 100
+
     def _calculate_investor_score(
-        self, startup: StartupProfile, investor: InvestorProfile
+        self,
+        startup: StartupProfile,
+        investor: InvestorRecord,
+        floor: Optional[float] = None,
     ) -> Tuple[float, List[RecommendationReason]]:
         """
         Calculate the recommendation score for a startup-investor pair.
 
+        Args:
+            startup: Startup being matched
+            investor: Investor being scored
+            floor: Optional score the caller needs to beat. If industry and
+                stage alone show the investor cannot reach it, the remaining
+                scorers are skipped and an upper bound below the floor is
+                returned instead of the exact score.
+
         Returns:
             Tuple of (score, list of reasons)
         """
@@ -138,6 +697,18 @@ class RecommendationEngine:
         if stage_reason:
             reasons.append(stage_reason)
 
+        # Early exit: assume perfect location and funding scores
+        if floor is not None:
+            upper_bound = (
+                total_score
+                + self.weights["location_proximity"]
+                + self.weights["funding_amount"]
+                + self._calculate_profile_completeness(startup)
+                * self.weights["profile_completeness"]
+            ) * 100
+            if upper_bound < floor:
+                return upper_bound, reasons
+
         # 3. Location Proximity (15% weight)
         location_score, location_reason = self._score_location_match(startup, investor)
         total_score += location_score * self.weights["location_proximity"]
@@ -162,34 +733,38 @@ class RecommendationEngine:
         return final_score, reasons
 
     def _score_industry_match(
-        self, startup: StartupProfile, investor: InvestorProfile
+        self, startup: StartupProfile, investor: InvestorRecord
     ) -> Tuple[float, Optional[RecommendationReason]]:
         """Score based on industry alignment."""
         if not investor.investment_focus:
             return 0.0, None
 
+        industry_score = self.affinities.industry_score(
+            startup.industry, investor.investment_focus
+        )
+
         if startup.industry in investor.investment_focus:
-            return 1.0, RecommendationReason(
+            return industry_score, RecommendationReason(
                 type="industry_match",
                 description=f"Perfect industry match: {startup.industry.value}",
-                weight=self.weights["industry_match"],
+                weight=self.weights["industry_match"] * industry_score,
             )
 
-        # Check for related industries (simplified logic)
-        related_matches = self._find_related_industries(
-            startup.industry, investor.investment_focus
-        )
-        if related_matches:
-            return 0.7, RecommendationReason(
+        # Partial credit for related industries
+        if industry_score > 0:
+            related_matches = self._find_related_industries(
+                startup.industry, investor.investment_focus
+            )
+            return industry_score, RecommendationReason(
                 type="industry_match",
                 description=f"Related industry match: {', '.join(related_matches)}",
-                weight=self.weights["industry_match"] * 0.7,
+                weight=self.weights["industry_match"] * industry_score,
             )
 
         return 0.0, None
 
     def _score_stage_match(
-        self, startup: StartupProfile, investor: InvestorProfile
+        self, startup: StartupProfile, investor: InvestorRecord
     ) -> Tuple[float, Optional[RecommendationReason]]:
         """Score based on funding stage alignment."""
         if not investor.preferred_stages:
@@ -199,225 +774,134 @@ class RecommendationEngine:
                 weight=self.weights["stage_match"] * 0.5,
             )
 
+        stage_score = self.affinities.stage_score(
+            startup.funding_stage, investor.preferred_stages
+        )
+
         if startup.funding_stage in investor.preferred_stages:
-            return 1.0, RecommendationReason(
+            return stage_score, RecommendationReason(
                 type="stage_match",
                 description=f"Perfect stage match: {startup.funding_stage.value}",
-                weight=self.weights["stage_match"],
+                weight=self.weights["stage_match"] * stage_score,
             )
 
-        # Check for adjacent stages
-        adjacent_score = self._check_adjacent_stages(
-            startup.funding_stage, investor.preferred_stages
-        )
-        if adjacent_score > 0:
-            return adjacent_score, RecommendationReason(
+        # Partial credit for nearby stages
+        if stage_score > 0:
+            return stage_score, RecommendationReason(
                 type="stage_match",
                 description="Compatible with nearby funding stages",
-                weight=self.weights["stage_match"] * adjacent_score,
+                weight=self.weights["stage_match"] * stage_score,
             )
 
         return 0.0, None
 
     def _score_location_match(
-        self, startup: StartupProfile, investor: InvestorProfile
+        self, startup: StartupProfile, investor: InvestorRecord
     ) -> Tuple[float, Optional[RecommendationReason]]:
         """Score based on location proximity."""
         if not investor.location or not startup.location:
             return 0.3, None  # Neutral score if location info missing
 
-        startup_location = startup.location.lower()
-        investor_location = investor.location.lower()
+        scorer = self.location_scorer
+        startup_region = region_index(startup.region)
+        investor_region = region_index(investor.region)
 
-        # Exact match
-        if startup_location == investor_location:
-            return 1.0, RecommendationReason(
+        # Locations outside the gazetteer only match exactly
+        if startup_region < 0 or investor_region < 0:
+            if startup.location.lower() == investor.location.lower():
+                return 1.0, RecommendationReason(
+                    type="location_match",
+                    description=f"Same location: {startup.location}",
+                    weight=self.weights["location_proximity"],
+                )
+            return scorer.default_score, None  # Small penalty for distant locations
+
+        location_score = scorer.score(startup_region, investor_region)
+        if startup_region == investor_region:
+            return location_score, RecommendationReason(
                 type="location_match",
-                description=f"Same location: {startup.location}",
-                weight=self.weights["location_proximity"],
+                description=f"Same region: {scorer.region_name(startup_region)}",
+                weight=self.weights["location_proximity"] * location_score,
             )
 
-        # City/state matching (simplified)
-        if self._locations_compatible(startup_location, investor_location):
-            return 0.7, RecommendationReason(
+        if location_score > scorer.default_score:
+            distance = scorer.distance_km(startup_region, investor_region)
+            return location_score, RecommendationReason(
                 type="location_match",
-                description="Compatible geographic region",
-                weight=self.weights["location_proximity"] * 0.7,
+                description=f"Nearby region: {scorer.region_name(investor_region)}"
+                f" (~{distance:,.0f} km)",
+                weight=self.weights["location_proximity"] * location_score,
             )
 
-        return 0.2, None  # Small penalty for distant locations
+        return location_score, None  # Small penalty for distant locations
 
     def _score_funding_compatibility(
-        self, startup: StartupProfile, investor: InvestorProfile
+        self, startup: StartupProfile, investor: InvestorRecord
     ) -> Tuple[float, Optional[RecommendationReason]]:
         """Score based on funding amount compatibility."""
-        if not startup.funding_goal:
-            return 0.5, None  # Neutral if no funding goal specified
-
         # This is a simplified implementation
         # In reality, you'd need investment range data from investors
-        funding_goal = startup.funding_goal
-
         # Heuristic scoring based on typical investment ranges per stage
-        stage_ranges = {
-            FundingStage.PRE_SEED: (50_000, 500_000),
-            FundingStage.SEED: (250_000, 2_000_000),
-            FundingStage.SERIES_A: (1_000_000, 15_000_000),
-            FundingStage.SERIES_B: (5_000_000, 50_000_000),
-        }
+        fit = funding_fit(startup.funding_stage, startup.funding_goal)
 
-        if startup.funding_stage in stage_ranges:
-            min_range, max_range = stage_ranges[startup.funding_stage]
-            if min_range <= funding_goal <= max_range:
-                return 1.0, RecommendationReason(
-                    type="funding_amount",
-                    description=f"Funding goal (${funding_goal:,.0f}) fits typical range",
-                    weight=self.weights["funding_amount"],
-                )
+        if fit == FUNDING_UNKNOWN:
+            return 0.5, None  # Neutral if no funding goal specified
+
+        if fit == FUNDING_IN_RANGE:
+            return 1.0, RecommendationReason(
+                type="funding_amount",
+                description=f"Funding goal (${startup.funding_goal:,.0f}) fits typical range",
+                weight=self.weights["funding_amount"],
+            )
 
         return 0.6, None  # Neutral score if outside typical ranges
 
     def _calculate_profile_completeness(self, startup: StartupProfile) -> float:
         """Calculate how complete the startup profile is."""
-        required_fields = [
-            startup.name,
-            startup.description,
-            startup.industry,
-            startup.funding_stage,
-            startup.location,
-        ]
-
-        optional_fields = [
-            startup.funding_goal,
-            startup.business_model,
-            startup.target_market,
-        ]
-
-        required_score = sum(1 for field in required_fields if field) / len(
-            required_fields
-        )
-        optional_score = sum(1 for field in optional_fields if field) / len(
-            optional_fields
-        )
-
-        # Weight required fields more heavily
-        return (required_score * 0.8) + (optional_score * 0.2)
+        return profile_completeness(startup)
 
     def _find_related_industries(
         self, startup_industry: Industry, investor_industries: List[Industry]
     ) -> List[str]:
-        """Find related industries for partial matching."""
-        # Simplified related industry mapping
-        related_map = {
-            Industry.TECHNOLOGY: [
-                Industry.FINTECH,
-                Industry.HEALTH_TECH,
-                Industry.ED_TECH,
-            ],
-            Industry.FINTECH: [Industry.TECHNOLOGY, Industry.FINANCE],
-            Industry.HEALTH_TECH: [
-                Industry.TECHNOLOGY,
-                Industry.HEALTHCARE,
-                Industry.BIOTECHNOLOGY,
-            ],
-            Industry.BIOTECHNOLOGY: [Industry.HEALTHCARE, Industry.HEALTH_TECH],
-        }
-
-        related = related_map.get(startup_industry, [])
-        return [ind.value for ind in investor_industries if ind in related]
-
-    def _check_adjacent_stages(
-        self, startup_stage: FundingStage, investor_stages: List[FundingStage]
-    ) -> float:
-        """Check if investor is interested in stages adjacent to startup's stage."""
-        # Define stage adjacency
-        stage_order = [
-            FundingStage.IDEA,
-            FundingStage.MVP,
-            FundingStage.PRE_SEED,
-            FundingStage.SEED,
-            FundingStage.SERIES_A,
-            FundingStage.SERIES_B,
-            FundingStage.SERIES_C,
-        ]
-
-        try:
-            startup_idx = stage_order.index(startup_stage)
-            for inv_stage in investor_stages:
-                if inv_stage in stage_order:
-                    inv_idx = stage_order.index(inv_stage)
-                    if abs(startup_idx - inv_idx) == 1:  # Adjacent stage
-                        return 0.6
-        except ValueError:
-            pass
-
-        return 0.0
-
-    def _locations_compatible(self, loc1: str, loc2: str) -> bool:
-        """Check if two locations are in compatible regions."""
-        # Simplified location matching
-        # In production, you'd use proper geocoding and distance calculation
-
-        # Extract common city/state patterns
-        for location in [loc1, loc2]:
-            if any(term in location for term in ["san francisco", "sf", "bay area"]):
-                if any(
-                    term in (loc1 + loc2)
-                    for term in ["san francisco", "sf", "bay area", "california", "ca"]
-                ):
-                    return True
-            if any(term in location for term in ["new york", "ny", "nyc"]):
-                if any(term in (loc1 + loc2) for term in ["new york", "ny", "nyc"]):
-                    return True
-
-        return False
+        """Investor industries that earn partial credit for the startup's."""
+        related = []
+        for industry in investor_industries:
+            try:
+                # JSON columns load as raw strings
+                industry = Industry(industry)
+            except ValueError:
+                continue
+            if (
+                industry != startup_industry
+                and self.affinities.industry_score(startup_industry, [industry]) > 0
+            ):
+                related.append(industry.value)
+        return related
 
     def _create_recommendation(
         self,
-        investor_profile: InvestorProfile,
-        user: User,
+        investor: InvestorRecord,
         score: float,
         reasons: List[RecommendationReason],
     ) -> InvestorRecommendation:
         """Create a recommendation object from scoring results."""
-        from app.models.investor import InvestorWithUserRead
-
-        # Create investor object for response
-        investor_data = InvestorWithUserRead(
-            id=investor_profile.id,
-            user_id=investor_profile.user_id,
-            name=user.full_name,
-            email=user.email,
-            company=investor_profile.firm_name,
-            firm_name=investor_profile.firm_name,
-            bio=investor_profile.bio,
-            website=investor_profile.website,
-            location=investor_profile.location,
-            linkedin_url=investor_profile.linkedin_url,
-            twitter_url=investor_profile.twitter_url,
-            investment_focus=investor_profile.investment_focus,
-            preferred_stages=investor_profile.preferred_stages,
-            profile_picture=None,
-            min_investment=None,
-            max_investment=None,
-        )
-
-        # Determine confidence level
-        if score >= 80:
-            confidence = "high"
-        elif score >= 60:
-            confidence = "medium"
-        else:
-            confidence = "low"
-
         return InvestorRecommendation(
-            investor=investor_data,
+            # Built from the already-typed index record, without validation
+            investor=investor_read_model(investor),
             score=round(score, 2),
-            confidence=confidence,
+            confidence=self._confidence_level(score),
             reasons=reasons,
             match_percentage=int(score),
         )
 
+    def _confidence_level(self, score: float) -> str:
+        """Determine the confidence level for a score."""
+        if score >= 80:
+            return "high"
+        elif score >= 60:
+            return "medium"
+        return "low"
+
 
 # Global instance
 recommendation_engine = RecommendationEngine()
@@ -0,0 +1,167 @@
+"""
+Process-local record index shared by the recommendation engine's indexes.
+
+An index loads every record once, keeps it in an array-backed feature matrix
+(see ``app.services.features``) and is updated incrementally by the CRUD
+functions. Recommendation requests read a snapshot of the index instead of
+rehydrating ORM rows from the database on every call.
+
+Each worker process owns its own indexes, so writes made by other workers are
+picked up by a periodic full reload (``ttl_seconds``). Async routes reload
+through an AsyncSession (``refresh_if_stale_async``) and build the feature
+matrix off the event loop.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import Session
+from sqlmodel.sql.expression import Select
+
+from app.services.features import FeatureMatrix
+
+
+class RecordIndex:
+    """In-memory records and scoring features with incremental updates."""
+
+    # Feature matrix used to store the records
+    matrix_class: Type[FeatureMatrix] = FeatureMatrix
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        # Single-flight for async reloads: concurrent stale requests wait for
+        # one load instead of each querying the database
+        self._async_load_lock = asyncio.Lock()
+        self._features = self.matrix_class()
+        self._rows: Dict[uuid.UUID, int] = {}
+        self._loaded_at: Optional[float] = None
+        # Bumped on every change so callers can key caches on the record set
+        self.version = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def _is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    def _select_records(self) -> Select:
+        """Statement selecting every record that belongs in the index."""
+        raise NotImplementedError
+
+    def _build_records(self, rows: Sequence[Any]) -> List[Any]:
+        """Turn the rows returned by _select_records() into records."""
+        raise NotImplementedError
+
+    def _fetch_records(self, db: Session) -> List[Any]:
+        """Return every record that belongs in the index."""
+        return self._build_records(db.exec(self._select_records()).all())
+
+    def load(self, db: Session) -> None:
+        """(Re)load every record from the database."""
+        self._install(self._fetch_records(db))
+
+    async def load_async(
+        self, session: AsyncSession, executor: Optional[Executor] = None
+    ) -> None:
+        """
+        (Re)load every record through an async session.
+
+        Rows are fetched on the event loop; building the records and the
+        feature matrix is CPU work and runs on ``executor`` (the loop's default
+        executor if None).
+        """
+        rows = (await session.execute(self._select_records())).all()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, self._install_rows, rows)
+
+    def _install_rows(self, rows: Sequence[Any]) -> None:
+        self._install(self._build_records(rows))
+
+    def _install(self, records: List[Any]) -> None:
+        """Replace the whole index with ``records``."""
+        features = self.matrix_class(records)
+        rows = {record.id: row for row, record in enumerate(records)}
+
+        with self._lock:
+            self._features = features
+            self._rows = rows
+            self._loaded_at = time.monotonic()
+            self.version += 1
+
+    def refresh_if_stale(self, db: Session) -> None:
+        """Load the index if it was never loaded or its TTL expired."""
+        if self._is_stale():
+            self.load(db)
+
+    async def refresh_if_stale_async(
+        self, session: AsyncSession, executor: Optional[Executor] = None
+    ) -> None:
+        """Async refresh_if_stale; concurrent callers share a single load."""
+        if not self._is_stale():
+            return
+
+        async with self._async_load_lock:
+            # Another request may have reloaded the index while we waited
+            if self._is_stale():
+                await self.load_async(session, executor)
+
+    def snapshot(self, db: Session) -> FeatureMatrix:
+        """Return a consistent copy of the index, loading it first if needed."""
+        self.refresh_if_stale(db)
+        return self.current()
+
+    def current(self) -> FeatureMatrix:
+        """Return a consistent copy of the index as currently loaded."""
+        with self._lock:
+            return self._features.copy()
+
+    def _put(self, record: Any) -> None:
+        """Insert or replace a record. Records must expose ``id``."""
+        with self._lock:
+            row = self._rows.get(record.id)
+            if row is None:
+                self._rows[record.id] = self._features.append(record)
+            else:
+                self._features.set_row(row, record)
+            self.version += 1
+
+    def _skip_unloaded(self) -> bool:
+        """
+        Bump the version and return True if the index was never loaded.
+
+        There is nothing to keep in sync until the first snapshot loads the
+        index, so writers can skip building records.
+        """
+        if self.is_loaded:
+            return False
+
+        with self._lock:
+            self.version += 1
+        return True
+
+    def remove(self, record_id: uuid.UUID) -> None:
+        """Drop a single record from the index."""
+        with self._lock:
+            row = self._rows.pop(record_id, None)
+            if row is None:
+                return
+
+            moved = self._features.remove(row)
+            if moved is not None:
+                self._rows[moved.id] = row
+            self.version += 1
+
+    def invalidate(self) -> None:
+        """Force a full reload on the next snapshot."""
+        with self._lock:
+            self._loaded_at = None
+            self.version += 1
@@ -0,0 +1,83 @@
+"""
+Process-local index of published startups for the recommendation engine.
+
+Powers the reverse recommendation mode (one investor against every published
+startup). Startups are kept as StartupProfile records plus the array-backed
+scoring features and are synced by the startup CRUD functions (see
+``app.services.record_index``). Writes made by other workers are picked up by a
+periodic full reload (STARTUP_INDEX_TTL_SECONDS).
+"""
+
+from typing import Any, List, Sequence
+
+from sqlmodel import Session, select
+from sqlmodel.sql.expression import Select
+
+from app.core.config import settings
+from app.models.recommendation import StartupProfile
+from app.models.startup import Startup
+from app.services.features import StartupFeatureMatrix
+from app.services.record_index import RecordIndex
+
+
+def select_startup_profiles() -> Select:
+    """Select only the startup columns needed to build a StartupProfile."""
+    return select(
+        Startup.id,
+        Startup.founder_id,
+        Startup.name,
+        Startup.industry,
+        Startup.funding_stage,
+        Startup.location,
+        Startup.funding_goal,
+        Startup.description,
+        Startup.business_model,
+        Startup.target_market,
+        Startup.region,
+    )
+
+
+def build_startup_profiles(rows: Sequence[Any]) -> List[StartupProfile]:
+    """Build profiles from the rows of a select_startup_profiles() statement."""
+    return [StartupProfile.model_validate(row, from_attributes=True) for row in rows]
+
+
+def load_startup_profiles(db: Session, statement: Select) -> List[StartupProfile]:
+    """Run a select_startup_profiles() statement and build the profiles."""
+    return build_startup_profiles(db.exec(statement).all())
+
+
+class StartupIndex(RecordIndex):
+    """In-memory published startups and scoring features."""
+
+    matrix_class = StartupFeatureMatrix
+
+    def __init__(self, ttl_seconds: int = settings.STARTUP_INDEX_TTL_SECONDS):
+        super().__init__(ttl_seconds)
+
+    def _select_records(self) -> Select:
+        return select_startup_profiles().where(Startup.is_published)
+
+    def _build_records(self, rows: Sequence[Any]) -> List[StartupProfile]:
+        return build_startup_profiles(rows)
+
+    def snapshot(self, db: Session) -> StartupFeatureMatrix:
+        return super().snapshot(db)
+
+    def current(self) -> StartupFeatureMatrix:
+        return super().current()
+
+    def sync(self, startup: Startup) -> None:
+        """Insert, replace or drop a startup depending on its published state."""
+        if not startup.is_published:
+            self.remove(startup.id)
+            return
+
+        if self._skip_unloaded():
+            return
+
+        self._put(StartupProfile.model_validate(startup, from_attributes=True))
+
+
+# Global instance
+startup_index = StartupIndex()
@@ -0,0 +1,199 @@
+"""
+Process-local typeahead index for investor names, firm names and startup names.
+
+Every name is stored under each of its word starts ("Ama Capital" under "ama
+capital" and "capital") in one sorted array, so a prefix lookup is a bisect
+plus a short forward scan and never touches the database. The index is built
+at application startup, updated by the investor and startup CRUD functions
+and reloaded periodically (SUGGEST_INDEX_TTL_SECONDS) to pick up writes made
+by other workers.
+
+Only published startups are suggested.
+"""
+
+import bisect
+import threading
+import time
+import uuid
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models.investor import InvestorProfile
+from app.models.startup import Startup
+from app.models.user import User
+
+
+class SuggestionType(str, Enum):
+    INVESTOR = "investor"  # Investor's full name
+    FIRM = "firm"  # Investor's firm name
+    STARTUP = "startup"  # Published startup's name
+
+
+# (normalized key, type, label, id); sorted by key
+Entry = Tuple[str, SuggestionType, str, uuid.UUID]
+
+
+def normalize_suggest_text(text: Optional[str]) -> str:
+    """Case-fold and collapse whitespace."""
+    return " ".join((text or "").casefold().split())
+
+
+def suggest_keys(label: str) -> List[str]:
+    """The normalized label from each of its word starts."""
+    words = normalize_suggest_text(label).split(" ")
+    return [" ".join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+class SuggestIndex:
+    """Sorted array of name prefixes with incremental updates."""
+
+    def __init__(self, ttl_seconds: int = settings.SUGGEST_INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        self._entries: List[Entry] = []
+        # (owner type, id) -> entries it contributed, for updates and removals
+        self._owned: Dict[Tuple[SuggestionType, uuid.UUID], List[Entry]] = {}
+        self._loaded_at: Optional[float] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def load(self, db: Session) -> None:
+        """(Re)build the index from the database."""
+        investors = db.exec(
+            select(
+                InvestorProfile.id, User.full_name, InvestorProfile.firm_name
+            ).join(User, InvestorProfile.user_id == User.id)
+        ).all()
+        startups = db.exec(
+            select(Startup.id, Startup.name).where(Startup.is_published)
+        ).all()
+
+        owned = {}
+        for profile_id, name, firm_name in investors:
+            owner = (SuggestionType.INVESTOR, profile_id)
+            owned[owner] = self._investor_entries(profile_id, name, firm_name)
+        for startup_id, name in startups:
+            owner = (SuggestionType.STARTUP, startup_id)
+            owned[owner] = self._entries_for(SuggestionType.STARTUP, name, startup_id)
+
+        entries = sorted(entry for group in owned.values() for entry in group)
+        with self._lock:
+            self._entries = entries
+            self._owned = owned
+            self._loaded_at = time.monotonic()
+
+    def refresh_if_stale(self, db: Session) -> None:
+        """Load the index if it was never loaded or its TTL expired."""
+        if (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > self.ttl_seconds
+        ):
+            self.load(db)
+
+    def suggest(
+        self,
+        prefix: str,
+        limit: int = 10,
+        types: Optional[List[SuggestionType]] = None,
+    ) -> List[Tuple[SuggestionType, uuid.UUID, str]]:
+        """
+        Return up to `limit` (type, id, label) suggestions for a prefix.
+
+        Suggestions are in alphabetical order of the matching text, each
+        record at most once.
+        """
+        prefix = normalize_suggest_text(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        suggestions = []
+        seen = set()
+        with self._lock:
+            position = bisect.bisect_left(self._entries, (prefix,))
+            while position < len(self._entries) and len(suggestions) < limit:
+                key, kind, label, record_id = self._entries[position]
+                position += 1
+                if not key.startswith(prefix):
+                    break
+                if types and kind not in types:
+                    continue
+                if (kind, record_id) in seen:
+                    continue
+                seen.add((kind, record_id))
+                suggestions.append((kind, record_id, label))
+
+        return suggestions
+
+    def sync_investor(self, profile: InvestorProfile) -> None:
+        """Insert or replace an investor's name and firm."""
+        if not self.is_loaded:
+            return
+
+        # Resolve the user relationship outside the lock (may hit the database)
+        name = profile.user.full_name
+        self._replace(
+            (SuggestionType.INVESTOR, profile.id),
+            self._investor_entries(profile.id, name, profile.firm_name),
+        )
+
+    def sync_startup(self, startup: Startup) -> None:
+        """Insert, replace or drop a startup depending on its published state."""
+        if not self.is_loaded:
+            return
+
+        entries = []
+        if startup.is_published:
+            entries = self._entries_for(
+                SuggestionType.STARTUP, startup.name, startup.id
+            )
+        self._replace((SuggestionType.STARTUP, startup.id), entries)
+
+    def remove_investor(self, profile_id: uuid.UUID) -> None:
+        self._replace((SuggestionType.INVESTOR, profile_id), [])
+
+    def remove_startup(self, startup_id: uuid.UUID) -> None:
+        self._replace((SuggestionType.STARTUP, startup_id), [])
+
+    def invalidate(self) -> None:
+        """Force a full reload on the next refresh."""
+        with self._lock:
+            self._loaded_at = None
+
+    def _replace(
+        self, owner: Tuple[SuggestionType, uuid.UUID], entries: List[Entry]
+    ) -> None:
+        with self._lock:
+            for entry in self._owned.pop(owner, []):
+                position = bisect.bisect_left(self._entries, entry)
+                if position < len(self._entries) and self._entries[position] == entry:
+                    del self._entries[position]
+            for entry in entries:
+                bisect.insort(self._entries, entry)
+            if entries:
+                self._owned[owner] = entries
+
+    def _investor_entries(
+        self, profile_id: uuid.UUID, name: Optional[str], firm_name: Optional[str]
+    ) -> List[Entry]:
+        return self._entries_for(
+            SuggestionType.INVESTOR, name, profile_id
+        ) + self._entries_for(SuggestionType.FIRM, firm_name, profile_id)
+
+    @staticmethod
+    def _entries_for(
+        kind: SuggestionType, label: Optional[str], record_id: uuid.UUID
+    ) -> List[Entry]:
+        if not label:
+            return []
+        # A repeated word would produce the same entry twice
+        keys = dict.fromkeys(suggest_keys(label))
+        return [(key, kind, label, record_id) for key in keys]
+
+
+# Global instance
+suggest_index = SuggestIndex()
@@ -0,0 +1,144 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.api.deps import get_current_user, get_db
+from app.api.endpoints import admin
+from app.models import User, UserRole
+from app.models.bulk_import import BulkImportJob, BulkImportJobStatus
+from app.models.investor import InvestorProfile
+from app.services import bulk_import
+
+
+@pytest.fixture
+def client(engine, founder) -> TestClient:
+    app = FastAPI()
+    app.include_router(admin.router)
+
+    def get_test_db():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_current_user] = lambda: founder
+    return TestClient(app)
+
+
+@pytest.fixture
+def job_statuses(engine, monkeypatch) -> list:
+    """Record a job's status when its background task starts and after batches."""
+    statuses = []
+    run_job = admin.run_investor_import_job
+    save_progress = bulk_import.save_job_progress
+
+    def run(engine, job_id, path, import_format):
+        with Session(engine) as session:
+            statuses.append(session.get(BulkImportJob, job_id).status)
+        run_job(engine, job_id, path, import_format)
+
+    def save(db, job, report):
+        statuses.append(job.status)
+        save_progress(db, job, report)
+
+    monkeypatch.setattr(admin, "run_investor_import_job", run)
+    monkeypatch.setattr(bulk_import, "save_job_progress", save)
+    return statuses
+
+
+def poll_job(client, job_id, timeout=30.0) -> dict:
+    """GET the job until it has finished."""
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/admin/imports/{job_id}").json()
+        if job["status"] in ("completed", "failed") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.1)
+
+
+def test_admin_investor_delete_updates_every_index(session, founder, monkeypatch):
+    user = User(
+        email="investor@example.com",
+        full_name="Test Investor",
+        role=UserRole.INVESTOR,
+        hashed_password="x",
+    )
+    session.add(user)
+    session.commit()
+    profile = InvestorProfile(firm_name="Test Capital", user_id=user.id)
+    session.add(profile)
+    session.commit()
+
+    removed = []
+    monkeypatch.setattr(
+        admin.investor_index, "remove", lambda id: removed.append(("index", id))
+    )
+    monkeypatch.setattr(
+        admin.investor_search_index,
+        "remove",
+        lambda id: removed.append(("search", id)),
+    )
+    monkeypatch.setattr(
+        admin.suggest_index,
+        "remove_investor",
+        lambda id: removed.append(("suggest", id)),
+    )
+
+    asyncio.run(admin.delete_investor_admin(profile.id, session, founder))
+
+    assert session.get(InvestorProfile, profile.id) is None
+    assert sorted(removed) == [
+        ("index", profile.id),
+        ("search", profile.id),
+        ("suggest", profile.id),
+    ]
+
+
+def test_investor_import_job_runs_to_completion(client, job_statuses):
+    ndjson = (
+        b'{"email": "ada@example.com", "firm_name": "Mensah Capital"}\n'
+        b'{"email": "ada@example.com", "firm_name": "Mensah Again"}\n'
+        b"{not json\n"
+    )
+
+    response = client.post(
+        "/admin/investors/bulk-import",
+        files={"file": ("investors.ndjson", ndjson, "application/x-ndjson")},
+    )
+    assert response.status_code == 202
+    job = poll_job(client, response.json()["job_id"])
+
+    assert job_statuses[0] == BulkImportJobStatus.PENDING
+    assert set(job_statuses[1:]) == {BulkImportJobStatus.RUNNING}
+    assert job["status"] == "completed"
+    assert job["completed_at"] is not None
+    assert (job["total_rows"], job["created"], job["skipped"]) == (3, 1, 1)
+    assert job["error_count"] == 1
+    assert job["errors"][0].startswith("Row 3: Invalid JSON")
+
+
+def test_failed_investor_import_job_reports_why(client, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("Database went away")
+
+    monkeypatch.setattr(bulk_import, "import_investors", fail)
+
+    response = client.post(
+        "/admin/investors/bulk-import",
+        files={"file": ("investors.csv", b"email\n", "text/csv")},
+    )
+    job = poll_job(client, response.json()["job_id"])
+
+    assert job["status"] == "failed"
+    assert job["detail"] == "Database went away"
+    assert job["completed_at"] is not None
+
+
+def test_unknown_import_job(client):
+    response = client.get(f"/admin/imports/{uuid.uuid4()}")
+
+    assert response.status_code == 404
@@ -0,0 +1,212 @@
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlmodel import select
+
+from app.models.bulk_import import BulkImportJob
+from app.models.investor import InvestorProfile
+from app.models.startup import FundingStage, Industry, Startup
+from app.models.user import User, UserRole
+from app.services import bulk_import
+from app.services.bulk_import import (
+    ImportFormat,
+    import_investors,
+    import_startups,
+    save_job_progress,
+)
+
+INVESTOR_CSV = """\
+name,email,firm_name,location,investment_focus,preferred_stages
+Ada Mensah,ada@example.com,Mensah Capital,"Accra, Ghana","Fintech, Healthcare",Seed
+Kofi Boateng,kofi@example.com,Boateng Ventures,Lagos,Fintech,"Seed, Series A"
+"""
+
+
+@pytest.fixture
+def hash_executor(monkeypatch):
+    # bcrypt would dominate the test; the executor only has to map it
+    monkeypatch.setattr(bulk_import, "get_password_hash", lambda password: "hash")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield executor
+
+
+def ndjson(*records) -> io.BytesIO:
+    return io.BytesIO(
+        b"".join(
+            (record if isinstance(record, str) else json.dumps(record)).encode()
+            + b"\n"
+            for record in records
+        )
+    )
+
+
+def investors(session):
+    return session.exec(
+        select(User.email, InvestorProfile).join(InvestorProfile).order_by(User.email)
+    ).all()
+
+
+def test_import_investors_csv(session, hash_executor):
+    report = import_investors(
+        session, io.BytesIO(INVESTOR_CSV.encode()), ImportFormat.CSV, hash_executor
+    )
+
+    assert report.as_dict() == {
+        "total_rows": 2,
+        "created": 2,
+        "skipped": 0,
+        "error_count": 0,
+        "errors": [],
+        "errors_truncated": False,
+    }
+    (ada_email, ada), (kofi_email, kofi) = investors(session)
+    assert (ada_email, ada.firm_name) == ("ada@example.com", "Mensah Capital")
+    assert ada.investment_focus == [Industry.FINTECH, Industry.HEALTHCARE]
+    assert kofi.preferred_stages == [FundingStage.SEED, FundingStage.SERIES_A]
+    user = session.exec(select(User).where(User.email == kofi_email)).one()
+    assert user.role == UserRole.INVESTOR and user.hashed_password == "hash"
+
+
+def test_import_investors_ndjson(session, hash_executor):
+    file = ndjson(
+        {
+            "full_name": "Ada Mensah",
+            "email": "ada@example.com",
+            "company": "Mensah Capital",
+            "investment_focus": ["Fintech"],
+            "preferred_stages": ["Seed"],
+        }
+    )
+
+    report = import_investors(session, file, ImportFormat.NDJSON, hash_executor)
+
+    assert (report.created, report.error_count) == (1, 0)
+    [(email, profile)] = investors(session)
+    assert (email, profile.firm_name) == ("ada@example.com", "Mensah Capital")
+    assert profile.investment_focus == [Industry.FINTECH]
+
+
+def test_malformed_rows_are_reported_with_their_line(session, hash_executor):
+    file = ndjson(
+        {"email": "ada@example.com", "firm_name": "Mensah Capital"},
+        "{not json",
+        "[1, 2]",
+        {"firm_name": "No Email"},
+        {"email": "not-an-email", "firm_name": "Bad Email"},
+    )
+
+    report = import_investors(session, file, ImportFormat.NDJSON, hash_executor)
+
+    assert (report.total_rows, report.created, report.error_count) == (5, 1, 4)
+    assert report.errors[0].startswith("Row 2: Invalid JSON")
+    assert report.errors[1] == "Row 3: Expected a JSON object"
+    assert report.errors[2] == "Row 4: Email is required"
+    assert report.errors[3].startswith("Row 5: email:")
+
+
+def test_malformed_csv_rows_are_reported_with_their_row(session, hash_executor):
+    csv = INVESTOR_CSV + ",,No Email Capital,,,\n"
+
+    report = import_investors(
+        session, io.BytesIO(csv.encode()), ImportFormat.CSV, hash_executor
+    )
+
+    assert report.created == 2
+    assert report.errors == ["Row 3: Email is required"]
+
+
+def test_duplicate_emails_are_skipped(session, make_investor, hash_executor):
+    existing = make_investor("Existing Capital")
+    existing_email = session.get(User, existing.user_id).email
+    file = ndjson(
+        {"email": "ada@example.com", "firm_name": "Mensah Capital"},
+        {"email": existing_email, "firm_name": "Existing Again"},
+        {"email": "ada@example.com", "firm_name": "Mensah Again"},
+        {"email": "kofi@example.com", "firm_name": "Boateng Ventures"},
+    )
+
+    # Batches of 2: the repeated email is in a later batch than the first
+    report = import_investors(
+        session, file, ImportFormat.NDJSON, hash_executor, batch_size=2
+    )
+
+    assert (report.total_rows, report.created, report.skipped) == (4, 2, 2)
+    assert [profile.firm_name for _, profile in investors(session)] == [
+        "Mensah Capital",
+        "Existing Capital",
+        "Boateng Ventures",
+    ]
+
+
+def test_progress_is_reported_after_every_batch(session, hash_executor):
+    file = ndjson(*({"email": f"i{i}@example.com", "firm_name": "F"} for i in range(5)))
+    progress = []
+
+    report = import_investors(
+        session,
+        file,
+        ImportFormat.NDJSON,
+        hash_executor,
+        batch_size=2,
+        on_batch=lambda report: progress.append((report.total_rows, report.created)),
+    )
+
+    assert progress == [(2, 2), (4, 4), (5, 5)]
+    assert report.message == "Bulk import completed. 5 created, 0 skipped, 0 errors."
+
+
+def test_job_counters_after_the_last_batch(session, hash_executor):
+    job = BulkImportJob(kind="investors")
+    session.add(job)
+    session.commit()
+    file = ndjson(
+        {"email": "ada@example.com", "firm_name": "Mensah Capital"},
+        {"email": "ada@example.com", "firm_name": "Mensah Again"},
+        {"firm_name": "No Email"},
+    )
+
+    import_investors(
+        session,
+        file,
+        ImportFormat.NDJSON,
+        hash_executor,
+        batch_size=2,
+        on_batch=lambda report: save_job_progress(session, job, report),
+    )
+
+    session.expire_all()
+    job = session.get(BulkImportJob, job.id)
+    assert (job.total_rows, job.created, job.skipped, job.error_count) == (3, 1, 1, 1)
+    assert job.errors == ["Row 3: Email is required"]
+
+
+def test_errors_beyond_the_limit_are_counted_not_kept():
+    report = bulk_import.BulkImportReport(max_errors=2)
+    for row in range(1, 4):
+        report.add_error(row, "Email is required")
+
+    assert report.error_count == 3
+    assert report.errors == ["Row 1: Email is required", "Row 2: Email is required"]
+    assert report.as_dict()["errors_truncated"] is True
+
+
+def test_import_startups_csv(session, founder, make_startup):
+    make_startup("Existing")
+    csv = (
+        "name,description,industry,location,funding_stage,founder_email\n"
+        f"New,A startup,Fintech,Accra,Seed,{founder.email}\n"
+        f"Existing,Again,Fintech,Accra,Seed,{founder.email}\n"
+        "Orphan,No founder,Fintech,Accra,Seed,nobody@example.com\n"
+        f"Bad,Bad industry,Mining,Accra,Seed,{founder.email}\n"
+    )
+
+    report = import_startups(session, io.BytesIO(csv.encode()), ImportFormat.CSV)
+
+    assert (report.total_rows, report.created, report.skipped) == (4, 1, 1)
+    # Validation errors are found before founders are looked up
+    assert report.errors[0].startswith("Row 4: industry:")
+    assert report.errors[1] == "Row 3: Founder nobody@example.com not found"
+    names = session.exec(select(Startup.name).order_by(Startup.name)).all()
+    assert names == ["Existing", "New"]
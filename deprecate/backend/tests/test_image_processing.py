@@ -0,0 +1,142 @@
+import asyncio
+from io import BytesIO
+
+import pytest
+from PIL import Image, UnidentifiedImageError
+
+from app.core.image_processing import (
+    ImageProcessor,
+    image_processor,
+    render_variants,
+)
+
+
+@pytest.fixture
+def processor():
+    processor = ImageProcessor(workers=1, max_pending=2, queue_timeout=5)
+    yield processor
+    processor.shutdown()
+
+
+def jpeg(width: int, height: int) -> bytes:
+    output = BytesIO()
+    Image.new("RGB", (width, height), "teal").save(output, "JPEG")
+    return output.getvalue()
+
+
+def sizes(rendered) -> dict:
+    return {
+        variant.key: Image.open(BytesIO(variant.content)).size for variant in rendered
+    }
+
+
+async def render(processor, content, variants, formats=None):
+    return [
+        variant async for variant in processor.render(content, variants, formats)
+    ]
+
+
+def test_render_in_the_pool(processor):
+    variants = {"original": None, "medium": (800, 600), "small": (400, 300)}
+
+    rendered = asyncio.run(
+        render(processor, jpeg(1600, 900), variants, {"small": ["webp"]})
+    )
+
+    assert [variant.key for variant in rendered] == [
+        "original",
+        "medium",
+        "small",
+        "small.webp",
+    ]
+    assert sizes(rendered) == {
+        "original": (1600, 900),
+        "medium": (800, 450),
+        "small": (400, 225),
+        "small.webp": (400, 225),
+    }
+    assert rendered[-1].content_type == "image/webp"
+    # Rendered by a worker process; every listener was released
+    assert processor._executor is not None and processor._executor._processes
+    assert processor._listeners == {}
+
+
+def test_shutdown_disposes_of_the_pool(processor):
+    asyncio.run(render(processor, jpeg(64, 48), {"small": (32, 24)}))
+    executor = processor._executor
+    workers = list(executor._processes.values())
+
+    processor.shutdown()
+
+    assert processor._executor is None
+    for worker in workers:
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+    # The next render starts a fresh pool
+    [variant] = asyncio.run(render(processor, jpeg(64, 48), {"small": (32, 24)}))
+    assert Image.open(BytesIO(variant.content)).size == (32, 24)
+    assert processor._executor is not executor
+
+
+def test_render_errors_are_raised_to_the_caller(processor):
+    with pytest.raises(UnidentifiedImageError):
+        asyncio.run(render(processor, b"not an image", {"small": (32, 24)}))
+
+    assert processor._listeners == {}
+
+
+def test_app_shutdown_disposes_of_the_pool(monkeypatch):
+    from app import main
+
+    async def nothing():
+        pass
+
+    # No database here; only the image pool part of the lifespan matters
+    for hook in (
+        "backend_pre_start",
+        "test_database_connection",
+        "close_async_database",
+    ):
+        monkeypatch.setattr(main, hook, nothing)
+    monkeypatch.setattr(main, "init_async_database", lambda: None)
+    monkeypatch.setattr(main, "engine", None)
+
+    async def serve():
+        async with main.lifespan(main.app):
+            # The pool starts with the first render
+            await render(image_processor, jpeg(64, 48), {"small": (32, 24)})
+            assert image_processor._executor is not None
+
+    asyncio.run(serve())
+
+    assert image_processor._executor is None
+
+
+def test_cascaded_variants():
+    variants = [
+        ("small", (400, 300)),
+        ("large", (1920, 1080)),
+        ("medium", (800, 600)),
+    ]
+
+    rendered = list(render_variants(jpeg(4000, 3000), variants))
+
+    assert [variant.key for variant in rendered] == ["large", "medium", "small"]
+    assert sizes(rendered) == {
+        "large": (1440, 1080),
+        "medium": (800, 600),
+        "small": (400, 300),
+    }
+
+
+@pytest.mark.parametrize("original", [True, False])
+def test_variant_wider_than_the_previous_one(original):
+    # The wide thumbnail comes after small (smaller area) but doesn't fit in it
+    variants = [("small", (400, 300)), ("thumbnail", (480, 120))]
+    if original:
+        variants.insert(0, ("original", None))
+
+    rendered = list(render_variants(jpeg(4000, 500), variants))
+
+    assert sizes(rendered)["small"] == (400, 50)
+    assert sizes(rendered)["thumbnail"] == (480, 60)
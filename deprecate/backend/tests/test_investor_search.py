@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from app.api.endpoints import admin
+from app.crud.investor import (
+    delete_investor_profile,
+    search_investors_by_name_or_firm,
+)
+from app.services.investor_search import investor_search_index
+from app.services.suggest import SuggestionType, suggest_index
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes():
+    # The indexes are process-wide; reload them from this test's database
+    investor_search_index.invalidate()
+    suggest_index.invalidate()
+    yield
+    investor_search_index.invalidate()
+    suggest_index.invalidate()
+
+
+@pytest.fixture
+def investors(make_investor):
+    return {
+        "prefix": make_investor("Capital Partners Africa", "Ama Owusu"),
+        "word": make_investor("Mensah Capital", "Kofi Mensah"),
+        "longer word": make_investor("Venture Capitalists Group", "Yaw Boateng"),
+        "name word": make_investor("Gold Coast Fund", "Nana Capital"),
+        "substring": make_investor("Accapital Labs", "Efua Sam"),
+    }
+
+
+def firms(rows):
+    return [row.firm_name for row in rows]
+
+
+def test_in_process_ranking(session, investors):
+    rows = search_investors_by_name_or_firm(session, "  CAPITAL ")
+
+    assert firms(rows) == [
+        # The firm starts with the term
+        "Capital Partners Africa",
+        # A word starts with it; the shorter field is more similar
+        "Gold Coast Fund",
+        "Mensah Capital",
+        "Venture Capitalists Group",
+        # Only a substring
+        "Accapital Labs",
+    ]
+
+
+def test_in_process_search_pages(session, investors):
+    rows = search_investors_by_name_or_firm(session, "capital", skip=1, limit=2)
+
+    assert firms(rows) == ["Gold Coast Fund", "Mensah Capital"]
+
+
+def test_short_terms_scan_every_name(session, investors):
+    # Fewer than three characters: no trigrams to look up
+    assert firms(search_investors_by_name_or_firm(session, "ow")) == [
+        "Capital Partners Africa"
+    ]
+    assert search_investors_by_name_or_firm(session, " ") == []
+
+
+def test_search_index_follows_deletes(session, investors):
+    assert firms(search_investors_by_name_or_firm(session, "mensah")) == [
+        "Mensah Capital"
+    ]
+
+    delete_investor_profile(session, investors["word"].id)
+
+    assert search_investors_by_name_or_firm(session, "mensah") == []
+
+
+def test_suggest_prefixes(session, investors, make_startup):
+    make_startup("Capital Bridge", is_published=True)
+    make_startup("Capital Draft", is_published=False)
+    suggest_index.load(session)
+
+    labels = [label for _, _, label in suggest_index.suggest("Capi")]
+    startups = suggest_index.suggest("capi", types=[SuggestionType.STARTUP])
+
+    # Alphabetical by the matching text, from any word start
+    assert labels == [
+        "Mensah Capital",
+        "Nana Capital",
+        "Capital Bridge",
+        "Capital Partners Africa",
+        "Venture Capitalists Group",
+    ]
+    assert [label for _, _, label in startups] == ["Capital Bridge"]
+    assert len(suggest_index.suggest("capi", limit=2)) == 2
+    assert suggest_index.suggest("capital draft") == []
+
+
+def test_suggest_lists_a_record_once(session, make_investor):
+    make_investor("Owusu Capital", "Ama Owusu")
+    suggest_index.load(session)
+
+    suggestions = suggest_index.suggest("owusu")
+
+    # The name and the firm match: one suggestion each, not one per key
+    assert sorted(kind for kind, _, _ in suggestions) == [
+        SuggestionType.FIRM,
+        SuggestionType.INVESTOR,
+    ]
+
+
+def test_admin_delete_removes_the_investor_from_search_and_suggest(
+    session, founder, investors
+):
+    suggest_index.load(session)
+    investor_id = investors["word"].id
+    assert search_investors_by_name_or_firm(session, "mensah")
+
+    asyncio.run(admin.delete_investor_admin(investor_id, session, founder))
+
+    assert search_investors_by_name_or_firm(session, "mensah") == []
+    assert suggest_index.suggest("mensah") == []
+    assert investor_id not in {
+        record_id for _, record_id, _ in suggest_index.suggest("capital", limit=20)
+    }
@@ -0,0 +1,84 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.api.deps import get_current_user, get_db
+from app.api.endpoints import investor
+from app.models.startup import FundingStage, Industry
+
+
+@pytest.fixture
+def client(engine, founder) -> TestClient:
+    app = FastAPI()
+    app.include_router(investor.router)
+
+    def get_test_db():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_current_user] = lambda: founder
+    return TestClient(app)
+
+
+def test_investors_by_industry(client, make_investor):
+    make_investor("Alpha", investment_focus=[Industry.FINTECH, Industry.HEALTHCARE])
+    make_investor("Beta", investment_focus=[Industry.HEALTHCARE])
+    make_investor("Gamma", investment_focus=[Industry.FINTECH])
+    make_investor("Delta")
+
+    response = client.get(f"/investors/by-industry/{Industry.FINTECH.value}")
+
+    assert response.status_code == 200
+    assert [i["firm_name"] for i in response.json()] == ["Alpha", "Gamma"]
+
+
+def test_investors_by_stage(client, make_investor):
+    make_investor("Alpha", preferred_stages=[FundingStage.SEED])
+    make_investor("Beta", preferred_stages=[FundingStage.SERIES_A, FundingStage.SEED])
+    make_investor("Gamma", preferred_stages=[FundingStage.SERIES_A])
+
+    response = client.get(
+        f"/investors/by-stage/{FundingStage.SEED.value}", params={"limit": 1}
+    )
+    rest = client.get(
+        f"/investors/by-stage/{FundingStage.SEED.value}",
+        params={"skip": 1, "limit": 1},
+    )
+
+    assert response.status_code == 200
+    assert [i["firm_name"] for i in response.json()] == ["Alpha"]
+    assert [i["firm_name"] for i in rest.json()] == ["Beta"]
+
+
+def test_cursor_pages_end_with_last_full_page(client, make_investor):
+    # The investor count is an exact multiple of the page size
+    for i in range(4):
+        make_investor(f"Firm {i}")
+
+    first = client.get("/investors/", params={"limit": 2})
+    second = client.get(
+        "/investors/", params={"limit": 2, "cursor": first.json()["next_cursor"]}
+    )
+
+    assert [i["firm_name"] for i in first.json()["investors"]] == ["Firm 0", "Firm 1"]
+    assert [i["firm_name"] for i in second.json()["investors"]] == [
+        "Firm 2",
+        "Firm 3",
+    ]
+    assert second.json()["next_cursor"] is None
+    assert second.json()["page"] is None
+
+
+def test_cursor_with_skip_is_rejected(client, make_investor):
+    make_investor("Firm 0")
+    make_investor("Firm 1")
+    first = client.get("/investors/", params={"limit": 1})
+
+    response = client.get(
+        "/investors/",
+        params={"limit": 1, "skip": 1, "cursor": first.json()["next_cursor"]},
+    )
+
+    assert response.status_code == 400
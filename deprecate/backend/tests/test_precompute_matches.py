@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import select
+
+from app.models.match import MatchRun, MatchRunStatus
+from app.scripts.precompute_matches import complete_run
+
+
+def add_run(session, status, minutes_ago):
+    run = MatchRun(
+        status=status,
+        algorithm_version="test",
+        top_n=5,
+        min_score=0.0,
+        started_at=datetime.utcnow() - timedelta(minutes=minutes_ago),
+    )
+    session.add(run)
+    session.commit()
+    return run
+
+
+def test_abandoned_runs_dont_count_toward_keep_runs(session):
+    add_run(session, MatchRunStatus.COMPLETED, 30)
+    previous = add_run(session, MatchRunStatus.COMPLETED, 20)
+    add_run(session, MatchRunStatus.ABANDONED, 10)
+    run = add_run(session, MatchRunStatus.RUNNING, 5)
+    previous_id = previous.id
+
+    complete_run(session, run, keep_runs=2)
+
+    remaining = set(session.exec(select(MatchRun.id)).all())
+    # The older completed run and the abandoned one are dropped
+    assert remaining == {run.id, previous_id}
@@ -0,0 +1,95 @@
+import uuid
+
+from app.crud.startup import update_startup
+from app.models.startup import StartupUpdate
+from app.services.recommendation_cache import (
+    RecommendationCache,
+    recommendation_cache,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def key(startup_id=None, *filters):
+    return (startup_id or uuid.uuid4(), *filters)
+
+
+def test_entries_expire_after_the_ttl():
+    clock = Clock()
+    cache = RecommendationCache(max_entries=10, ttl_seconds=60, clock=clock)
+    entry = key()
+    cache.set(entry, "response")
+
+    clock.now += 60
+    assert cache.get(entry) == "response"
+
+    clock.now += 1
+    assert cache.get(entry) is None
+    assert len(cache) == 0
+
+
+def test_setting_an_entry_again_restarts_its_ttl():
+    clock = Clock()
+    cache = RecommendationCache(max_entries=10, ttl_seconds=60, clock=clock)
+    entry = key()
+    cache.set(entry, "old")
+
+    clock.now += 50
+    cache.set(entry, "new")
+    clock.now += 50
+
+    assert cache.get(entry) == "new"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = RecommendationCache(max_entries=2, ttl_seconds=60, clock=Clock())
+    first, second, third = key(), key(), key()
+    cache.set(first, 1)
+    cache.set(second, 2)
+
+    # Reading the first entry makes the second the least recently used
+    assert cache.get(first) == 1
+    cache.set(third, 3)
+
+    assert cache.get(second) is None
+    assert (cache.get(first), cache.get(third)) == (1, 3)
+
+
+def test_disabled_cache_stores_nothing():
+    cache = RecommendationCache(max_entries=0, ttl_seconds=60, clock=Clock())
+    cache.set(key(), "response")
+
+    assert len(cache) == 0
+
+
+def test_invalidate_startup_drops_only_its_entries():
+    cache = RecommendationCache(max_entries=10, ttl_seconds=60, clock=Clock())
+    startup_id = uuid.uuid4()
+    other = key()
+    cache.set(key(startup_id, 10, 30.0), "a")
+    cache.set(key(startup_id, 20, 50.0), "b")
+    cache.set(other, "c")
+
+    cache.invalidate_startup(startup_id)
+
+    assert cache.get(key(startup_id, 10, 30.0)) is None
+    assert cache.get(key(startup_id, 20, 50.0)) is None
+    assert cache.get(other) == "c"
+
+
+def test_startup_update_invalidates_its_recommendations(session, make_startup):
+    startup = make_startup("Cached")
+    entry = key(startup.id, 10, 30.0)
+    recommendation_cache.set(entry, "response")
+    try:
+        update_startup(session, startup.id, StartupUpdate(location="Nairobi, Kenya"))
+
+        assert recommendation_cache.get(entry) is None
+    finally:
+        recommendation_cache.clear()
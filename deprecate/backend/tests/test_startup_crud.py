@@ -0,0 +1,19 @@
+from app.crud.startup import get_draft_startups_by_founder
+
+
+def test_draft_startups_are_only_the_unpublished_ones(session, founder, make_startup):
+    draft = make_startup("Draft", is_published=False)
+    make_startup("Published", is_published=True)
+
+    drafts = get_draft_startups_by_founder(session, founder.id)
+
+    assert [startup.id for startup in drafts] == [draft.id]
+
+
+def test_draft_startups_summary_columns(session, founder, make_startup):
+    draft = make_startup("Draft", is_published=False)
+    make_startup("Published", is_published=True)
+
+    drafts = get_draft_startups_by_founder(session, founder.id, summary=True)
+
+    assert [startup.id for startup in drafts] == [draft.id]
@@ -0,0 +1,25 @@
+import os
+
+import pytest
+
+from app.scripts.explain_startup_queries import run_audit
+
+# PostgreSQL is audited too when a database is provided; the audit rolls
+# back everything it seeds
+DATABASE_URLS = ["sqlite://"]
+if os.getenv("AUDIT_DATABASE_URL"):
+    DATABASE_URLS.append(os.environ["AUDIT_DATABASE_URL"])
+
+
+@pytest.mark.parametrize("database_url", DATABASE_URLS)
+def test_startup_queries_use_indexes(database_url):
+    """No startup CRUD query scans a 1000+ row table in full."""
+    failures = run_audit(
+        database_url,
+        startups=2_000,
+        min_rows=1_000,
+        seed_value=7,
+        show_plans=False,
+    )
+
+    assert failures == 0, "see the audit output above for the failing queries"
@@ -0,0 +1,65 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.api.deps import get_db
+from app.api.endpoints import startups
+
+
+@pytest.fixture
+def client(engine) -> TestClient:
+    app = FastAPI()
+    app.include_router(startups.router)
+
+    def get_test_db():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_test_db
+    return TestClient(app)
+
+
+def test_cursor_pages_end_with_last_full_page(client, make_startup):
+    # The published count is an exact multiple of the page size
+    for i in range(5):
+        make_startup(f"Startup {i}", is_published=True)
+
+    first = client.get("/startups/", params={"limit": 5})
+
+    assert first.status_code == 200
+    assert len(first.json()) == 5
+    assert "X-Next-Cursor" not in first.headers
+
+
+def test_cursor_follows_pages_to_the_end(client, make_startup):
+    for i in range(7):
+        make_startup(f"Startup {i}", is_published=True)
+    make_startup("Draft", is_published=False)
+
+    first = client.get("/startups/", params={"limit": 5})
+    second = client.get(
+        "/startups/",
+        params={"limit": 5, "cursor": first.headers["X-Next-Cursor"]},
+    )
+
+    assert [s["name"] for s in first.json()] == [f"Startup {i}" for i in range(5)]
+    assert second.status_code == 200
+    assert [s["name"] for s in second.json()] == ["Startup 5", "Startup 6"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_cursor_past_the_end_is_an_empty_page(client, make_startup):
+    last = make_startup("Startup 0", is_published=True)
+    cursor = startups.encode_startup_cursor(last)
+
+    response = client.get("/startups/", params={"cursor": cursor})
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_no_published_startups_is_not_found(client, make_startup):
+    make_startup("Draft", is_published=False)
+
+    assert client.get("/startups/").status_code == 404
@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.core import upload as upload_module
+from app.core.config import settings
+from app.core.storage import MinIOStorageClient
+from app.core.upload import FileUploadError, UploadService, _ChecksumReader
+
+PART_SIZE = settings.UPLOAD_PART_SIZE
+
+
+class FakeMinio:
+    """Minio stand-in that stores put_object streams the way Minio reads them."""
+
+    def __init__(self):
+        self.objects = {}
+        self.parts = {}  # object name -> parts of an unfinished multipart upload
+        self.aborted = []  # (object name, parts read before the failure)
+        self.removed = []
+
+    def put_object(self, bucket_name, object_name, data, length, part_size, **kwargs):
+        assert length == -1
+        parts = self.parts[object_name] = []
+        try:
+            while part := data.read(part_size):
+                parts.append(part)
+        except Exception:
+            # Minio aborts the multipart upload and re-raises
+            self.aborted.append((object_name, len(parts)))
+            del self.parts[object_name]
+            raise
+        self.objects[object_name] = b"".join(self.parts.pop(object_name))
+
+    def remove_object(self, bucket_name, object_name):
+        self.removed.append(object_name)
+        self.objects.pop(object_name, None)
+
+
+@pytest.fixture
+def minio(monkeypatch) -> FakeMinio:
+    client = FakeMinio()
+    monkeypatch.setattr(MinIOStorageClient, "_get_minio_client", lambda self: client)
+    return client
+
+
+@pytest.fixture
+def service(minio) -> UploadService:
+    storage = MinIOStorageClient()
+    storage.bucket_exists = lambda: True
+    return UploadService(storage_client=storage)
+
+
+def upload(content: bytes, size=None) -> UploadFile:
+    return UploadFile(
+        io.BytesIO(content),
+        size=len(content) if size is None else size,
+        filename="deck.pdf",
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+
+
+def test_checksum_reader_over_chunked_reads():
+    content = bytes(range(256)) * 1000
+    reader = _ChecksumReader(io.BytesIO(content))
+
+    chunks = []
+    while chunk := reader.read(4096):
+        chunks.append(chunk)
+
+    assert b"".join(chunks) == content
+    assert reader.size == len(content)
+    assert reader.hexdigest() == hashlib.md5(content).hexdigest()
+
+
+def test_checksum_reader_cuts_off_past_max_size():
+    reader = _ChecksumReader(io.BytesIO(b"x" * 10), max_size=6)
+
+    assert reader.read(4) == b"xxxx"
+    with pytest.raises(FileUploadError):
+        reader.read(4)
+
+
+def test_stream_uploads_in_parts(service, minio, session):
+    content = b"%PDF" + b"x" * (2 * PART_SIZE + 100)
+
+    response = asyncio.run(service.upload_document(upload(content), session))
+
+    [(path, stored)] = minio.objects.items()
+    assert stored == content
+    assert response.url.endswith(path)
+    assert response.size == len(content)
+    assert response.file_metadata["checksum"] == hashlib.md5(content).hexdigest()
+
+
+def test_stream_over_the_cap_is_stopped_and_cleaned_up(
+    service, minio, session, monkeypatch
+):
+    limited = settings.model_copy(update={"MAX_FILE_SIZE": 2 * PART_SIZE})
+    monkeypatch.setattr(upload_module, "settings", limited)
+    content = b"x" * (3 * PART_SIZE)
+
+    # The upload claims to be within the limit, the stream is not
+    with pytest.raises(FileUploadError, match="File too large"):
+        asyncio.run(service.upload_document(upload(content, size=100), session))
+
+    # Stopped while reading the third part
+    [(path, parts_read)] = minio.aborted
+    assert parts_read == 2
+    assert minio.removed == [path]
+    assert minio.objects == {} and minio.parts == {}
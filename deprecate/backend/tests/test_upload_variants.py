@@ -0,0 +1,195 @@
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session
+
+from app.core.upload import FileUploadError, UploadService, _parse_accept
+from app.models.upload import FileMetadata
+
+ORIGINAL_PATH = "images/2026/10/18/photo_original.jpg"
+
+
+@pytest.fixture
+def service(storage) -> UploadService:
+    storage.objects[ORIGINAL_PATH] = b"original image"
+    return UploadService(storage_client=storage, variant_formats={})
+
+
+@pytest.fixture
+def image(session: Session) -> FileMetadata:
+    """A lazily uploaded image: only the original is stored."""
+    file_metadata = FileMetadata(
+        file_id="photo",
+        filename="photo.jpg",
+        original_filename="photo.jpg",
+        content_type="image/jpeg",
+        size=14,
+        upload_date=datetime(2026, 10, 18),
+        file_type="image",
+        variants={"original": f"http://storage.test/{ORIGINAL_PATH}"},
+    )
+    session.add(file_metadata)
+    session.commit()
+    return file_metadata
+
+
+@pytest.fixture
+def renders(service, monkeypatch) -> list:
+    """Replace image processing with a slow fake; list the variants rendered."""
+    rendered = []
+
+    async def process_image(content, file_id, filename, upload_date, variants):
+        rendered.append(list(variants))
+        await asyncio.sleep(0.05)
+        return {name: f"http://storage.test/{file_id}_{name}.jpg" for name in variants}
+
+    monkeypatch.setattr(service, "_process_image", process_image)
+    return rendered
+
+
+def test_concurrent_requests_render_a_variant_once(engine, service, image, renders):
+    async def request():
+        with Session(engine) as session:
+            file_metadata = session.get(FileMetadata, image.file_id)
+            file_metadata = await service.ensure_variant(
+                file_metadata, "medium", session
+            )
+            return file_metadata.variants
+
+    async def requests():
+        return await asyncio.gather(*(request() for _ in range(5)))
+
+    results = asyncio.run(requests())
+
+    assert renders == [["medium"]]
+    assert all("medium" in variants for variants in results)
+
+
+def test_rendered_variant_is_merged_into_the_row(engine, service, image, renders):
+    with Session(engine) as session:
+        stale = session.get(FileMetadata, image.file_id)
+        # Another worker records a variant after this request loaded the row
+        with Session(engine) as other:
+            row = other.get(FileMetadata, image.file_id)
+            row.variants = {**row.variants, "small": "http://storage.test/small.jpg"}
+            other.add(row)
+            other.commit()
+
+        file_metadata = asyncio.run(service.ensure_variant(stale, "medium", session))
+
+    assert set(file_metadata.variants) == {"original", "small", "medium"}
+
+
+def test_rendered_variant_is_not_rendered_again(engine, service, image, renders):
+    with Session(engine) as session:
+        file_metadata = session.get(FileMetadata, image.file_id)
+        asyncio.run(service.ensure_variant(file_metadata, "medium", session))
+        asyncio.run(service.ensure_variant(file_metadata, "medium", session))
+
+    assert renders == [["medium"]]
+
+
+def test_variants_row_is_locked_off_the_event_loop(
+    engine, service, image, renders, monkeypatch
+):
+    threads = []
+    record_variants = UploadService._record_variants
+
+    def record(*args):
+        threads.append(threading.current_thread())
+        record_variants(*args)
+
+    monkeypatch.setattr(service, "_record_variants", record)
+    with Session(engine) as session:
+        file_metadata = session.get(FileMetadata, image.file_id)
+        asyncio.run(service.ensure_variant(file_metadata, "medium", session))
+
+    assert threads and threading.main_thread() not in threads
+
+
+def stored(*keys: str, fallback: str = ".jpg") -> FileMetadata:
+    """Metadata of an image with the given variant keys stored."""
+    return FileMetadata(
+        file_id="photo",
+        filename="photo.jpg",
+        original_filename="photo.jpg",
+        content_type="image/jpeg",
+        size=14,
+        upload_date=datetime(2026, 10, 18),
+        file_type="image",
+        variants={
+            key: f"http://storage.test/photo_{key}"
+            + ("" if "." in key else fallback)
+            for key in keys
+        },
+    )
+
+
+def test_parse_accept_q_values():
+    assert _parse_accept("image/avif, image/webp;q=0.8, */* ; Q=0.1") == {
+        "image/avif": 1.0,
+        "image/webp": 0.8,
+        "*/*": 0.1,
+    }
+    # Out of range q-values are clamped, malformed ones exclude the range
+    assert _parse_accept("image/webp;q=2, image/avif;q=oops, ,") == {
+        "image/webp": 1.0,
+        "image/avif": 0.0,
+    }
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        # Ties between modern encodings follow IMAGE_ENCODINGS (AVIF first)
+        ("image/avif,image/webp,*/*", "medium.avif"),
+        ("image/avif;q=0.5, image/webp;q=0.9", "medium.webp"),
+        # q=0 excludes an encoding however preferred it would be
+        ("image/avif;q=0, image/webp", "medium.webp"),
+        ("image/avif;q=0, image/webp;q=0, */*", "medium"),
+        # Modern encodings are only served when named; wildcards get JPEG
+        ("image/*", "medium"),
+        ("*/*", "medium"),
+        ("image/*;q=0.5, image/webp", "medium.webp"),
+        # A named fallback preferred over the modern encodings wins
+        ("image/jpeg, image/webp;q=0.5", "medium"),
+        (None, "medium"),
+        ("", "medium"),
+    ],
+)
+def test_select_variant_negotiates_accept(service, accept, expected):
+    file_metadata = stored("medium", "medium.avif", "medium.webp")
+
+    assert service.select_variant(file_metadata, "medium", accept) == expected
+
+
+def test_select_variant_skips_encodings_never_rendered(service):
+    # Only WebP was configured for this variant
+    file_metadata = stored("medium", "medium.webp")
+
+    assert (
+        service.select_variant(file_metadata, "medium", "image/avif,image/webp;q=0.9")
+        == "medium.webp"
+    )
+    assert service.select_variant(file_metadata, "medium", "image/avif") == "medium"
+
+
+def test_select_variant_png_fallback(service):
+    file_metadata = stored("thumbnail", "thumbnail.webp", fallback=".png")
+
+    accept = "image/png, image/webp;q=0.5"
+    assert service.select_variant(file_metadata, "thumbnail", accept) == "thumbnail"
+    assert (
+        service.select_variant(file_metadata, "thumbnail", "image/webp")
+        == "thumbnail.webp"
+    )
+
+
+@pytest.mark.parametrize("name", ["medium", "poster"])
+def test_select_variant_not_stored(service, name):
+    with pytest.raises(FileUploadError) as error:
+        service.select_variant(stored("original"), name, "image/webp")
+
+    assert error.value.status_code == 404